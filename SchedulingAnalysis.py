@@ -0,0 +1,220 @@
+# SchedulingAnalysis.py
+# ======================
+# Analytical schedulability tests for periodic task sets under Rate Monotonic
+# and EDF, answering feasibility without simulating the schedule.
+#
+# A task is analysed as periodic with worst-case execution time C (burst),
+# period T and relative deadline D (deadline minus arrival, or T when it has
+# no deadline), matching the jobs released by
+# SchedulingCore.periodic_releases. The exact tests assume every task first
+# arrives at the same time, which is the worst case: with different arrival
+# times a pass still holds, but a failure only means that a deadline may be
+# missed, so it is reported as inconclusive.
+
+import heapq
+import math
+from collections import namedtuple
+from fractions import Fraction
+
+from SchedulingCore import UNSET, TaskSet
+
+# Outcome of one test: schedulable is True, False or None (inconclusive)
+Verdict = namedtuple("Verdict", ["test", "schedulable", "detail"])
+
+# Outcome of analysing a task set: the verdict of the last test run, the
+# total utilization and the verdicts of every test run, cheapest first
+Analysis = namedtuple("Analysis", ["algorithm", "schedulable", "utilization", "verdicts"])
+
+PeriodicTask = namedtuple("PeriodicTask", ["index", "name", "burst", "period", "deadline"])
+
+# The processor demand test gives up after checking this many deadlines
+MAX_DEMAND_POINTS = 10**6
+
+def periodic_tasks(tasks):
+    """Tasks with a burst as PeriodicTask tuples, and whether they all arrive together.
+
+    Raises ValueError if one of them has no period.
+    """
+    task_set = TaskSet.from_tasks(tasks)
+    periodic = []
+    for i in range(len(task_set)):
+        name, burst, period = task_set.names[i], task_set.burst[i], task_set.period[i]
+        if burst <= 0:
+            continue
+        if period == UNSET or period <= 0:
+            raise ValueError(f"task {name} has no period")
+        deadline = task_set.deadline[i]
+        relative = period if deadline == UNSET else deadline - task_set.arrival[i]
+        periodic.append(PeriodicTask(i, name, burst, period, relative))
+    synchronous = len({task_set.arrival[task.index] for task in periodic}) <= 1
+    return periodic, synchronous
+
+def utilization(tasks):
+    """Total utilization, the sum of C/T, as an exact fraction"""
+    return sum((Fraction(task.burst, task.period) for task in tasks), Fraction(0))
+
+def fixed_point(demand, start):
+    """Smallest w >= start with demand(w) == w, for a non-decreasing demand"""
+    w = start
+    while True:
+        next_w = demand(w)
+        if next_w == w:
+            return w
+        w = next_w
+
+def liu_layland_test(tasks, synchronous=True):
+    """Liu & Layland bound for RM: U <= n(2^(1/n) - 1) is sufficient when every D >= T"""
+    if any(task.deadline < task.period for task in tasks):
+        return Verdict("Liu & Layland bound", None, "needs deadlines of at least one period")
+    total = utilization(tasks)
+    bound = len(tasks) * (2 ** (1 / len(tasks)) - 1)
+    relation = "<=" if total <= bound else ">"
+    return Verdict("Liu & Layland bound", True if total <= bound else None,
+                   f"U = {float(total):.4f} {relation} {bound:.4f}")
+
+def hyperbolic_test(tasks, synchronous=True):
+    """Hyperbolic bound for RM: prod(U_i + 1) <= 2 is sufficient when every D >= T"""
+    if any(task.deadline < task.period for task in tasks):
+        return Verdict("hyperbolic bound", None, "needs deadlines of at least one period")
+    product = math.prod(Fraction(task.burst, task.period) + 1 for task in tasks)
+    relation = "<=" if product <= 2 else ">"
+    return Verdict("hyperbolic bound", True if product <= 2 else None,
+                   f"prod(U + 1) = {float(product):.4f} {relation} 2")
+
+def response_times(tasks):
+    """Worst-case response time of each task under RM, as (task, time) in priority order.
+
+    Priorities are by period with ties broken by input order, as in the
+    simulation. Deadlines may exceed the period: every job released in the
+    level-i busy period is checked (Lehoczky's analysis), which is only the
+    first one when it completes within its period. The time is None when
+    the task's priority level is overloaded.
+    """
+    ordered = sorted(tasks, key=lambda task: (task.period, task.index))
+    results = []
+    level_utilization = Fraction(0)
+    for level, task in enumerate(ordered):
+        higher = ordered[:level]
+        level_utilization += Fraction(task.burst, task.period)
+        if level_utilization > 1:
+            results.append((task, None))
+            continue
+
+        def interference(w):
+            return sum(-(-w // other.period) * other.burst for other in higher)
+
+        busy = fixed_point(lambda w: interference(w) + -(-w // task.period) * task.burst, task.burst)
+        worst = 0
+        for job in range(-(-busy // task.period)):
+            work = (job + 1) * task.burst
+            finish = fixed_point(lambda w: work + interference(w), work)
+            worst = max(worst, finish - job * task.period)
+        results.append((task, worst))
+    return results
+
+def response_time_test(tasks, synchronous=True):
+    """Exact response-time analysis for RM"""
+    slack = None
+    for task, response in response_times(tasks):
+        if response is None or response > task.deadline:
+            shown = "unbounded" if response is None else response
+            return Verdict("response-time analysis", False if synchronous else None,
+                           f"task {task.name} responds in {shown} > deadline {task.deadline}")
+        slack = task.deadline - response if slack is None else min(slack, task.deadline - response)
+    return Verdict("response-time analysis", True, f"all deadlines met, least slack {slack}")
+
+def demand_test(tasks, synchronous=True):
+    """Processor demand test for EDF.
+
+    Checks that the work due by every absolute deadline t, dbf(t), fits in
+    t, for every deadline up to the end of the first busy period or Baruah's
+    bound, whichever is smaller. Deadlines are generated in order from a heap
+    holding the next deadline of each task.
+    """
+    total = utilization(tasks)
+    if total > 1:
+        return Verdict("processor demand", False, f"U = {float(total):.4f} > 1")
+    if all(task.deadline >= task.period for task in tasks):
+        return Verdict("processor demand", True, "U <= 1 and every deadline is at least one period")
+
+    # A first deadline miss can only happen within these bounds
+    limit = fixed_point(lambda w: sum(-(-w // task.period) * task.burst for task in tasks),
+                        sum(task.burst for task in tasks))
+    if total < 1:
+        baruah = sum((task.period - task.deadline) * Fraction(task.burst, task.period)
+                     for task in tasks) / (1 - total)
+        limit = min(limit, max(max(task.deadline for task in tasks), math.floor(baruah)))
+
+    # Heap of (absolute deadline, task position)
+    deadlines = [(task.deadline, position) for position, task in enumerate(tasks)]
+    heapq.heapify(deadlines)
+    demand = 0
+    checked = 0
+    while deadlines[0][0] <= limit:
+        t = deadlines[0][0]
+        while deadlines[0][0] == t:
+            position = deadlines[0][1]
+            demand += tasks[position].burst
+            heapq.heapreplace(deadlines, (t + tasks[position].period, position))
+        if demand > t:
+            return Verdict("processor demand", False if synchronous else None,
+                           f"demand {demand} > {t} by time {t}")
+        checked += 1
+        if checked >= MAX_DEMAND_POINTS:
+            return Verdict("processor demand", None, f"gave up after {checked} deadlines")
+    return Verdict("processor demand", True, f"demand fits at all {checked} deadlines up to {limit}")
+
+# Tests for each algorithm, run in order until one is conclusive. Each takes
+# the PeriodicTask list and whether the tasks arrive together.
+TESTS = {
+    "Rate Monotonic": (liu_layland_test, hyperbolic_test, response_time_test),
+    "EDF": (demand_test,),
+}
+
+def analyze(tasks, algorithm):
+    """Schedulability of a periodic task set under Rate Monotonic or EDF.
+
+    The cheap utilization bounds run first, and the exact test only when
+    they cannot decide. Returns an Analysis whose schedulable field is
+    True, False, or None when the task set cannot be decided without
+    simulating it (or is not periodic).
+    """
+    if algorithm not in TESTS:
+        raise ValueError(f"no schedulability analysis for {algorithm}")
+    try:
+        periodic, synchronous = periodic_tasks(tasks)
+    except ValueError as e:
+        return Analysis(algorithm, None, None, [Verdict("periodic task model", None, str(e))])
+    total = utilization(periodic)
+
+    # Checks that hold for any arrival times
+    verdicts = []
+    too_short = next((task for task in periodic if task.deadline < task.burst), None)
+    if too_short is not None:
+        verdicts.append(Verdict("deadline check", False, f"task {too_short.name} has a deadline "
+                                                         f"shorter than its burst"))
+    elif total > 1:
+        verdicts.append(Verdict("utilization", False, f"U = {float(total):.4f} > 1"))
+    elif not periodic:
+        verdicts.append(Verdict("utilization", True, "no work to schedule"))
+    if verdicts:
+        return Analysis(algorithm, verdicts[-1].schedulable, float(total), verdicts)
+
+    for test in TESTS[algorithm]:
+        verdict = test(periodic, synchronous)
+        verdicts.append(verdict)
+        if verdict.schedulable is not None:
+            break
+    return Analysis(algorithm, verdicts[-1].schedulable, float(total), verdicts)
+
+def summary(analysis):
+    """One-line description of an Analysis, naming the test that decided it"""
+    verdict = analysis.verdicts[-1]
+    if analysis.schedulable is None:
+        outcome = "Schedulability not decided"
+    else:
+        outcome = "Schedulable" if analysis.schedulable else "Not schedulable"
+    text = f"{outcome} under {analysis.algorithm}: {verdict.test}, {verdict.detail}"
+    if analysis.utilization is not None:
+        text += f" (U = {analysis.utilization:.4f})"
+    return text
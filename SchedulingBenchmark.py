@@ -0,0 +1,195 @@
+# SchedulingBenchmark.py
+# ======================
+# Benchmark harness: times every scheduling algorithm on synthetic workloads
+# of increasing size, records peak memory and compares against a baseline.
+#
+# Usage: python -m SchedulingBenchmark [--sizes 10,1000,100000] [-o results.json]
+#        python -m SchedulingBenchmark --baseline results.json
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from SchedulingCore import ALGORITHMS, parse_algorithms, run_scheduler
+from WorkloadLoader import BURST_DISTRIBUTIONS, generate_workload
+
+SIZES = [10, 100, 1000, 10**4, 10**5, 10**6]
+LOADS = [0.5, 0.9]
+
+# Quick runs are repeated in a loop until they take at least this long, so
+# that timer resolution and noise do not dominate small workloads
+MIN_TIME = 0.05
+
+def time_runs(algorithm, tasks, time_quantum, number):
+    """Wall time of `number` consecutive runs"""
+    start = time.perf_counter()
+    for _ in range(number):
+        run_scheduler(algorithm, tasks, time_quantum)
+    return time.perf_counter() - start
+
+def measure(algorithm, tasks, time_quantum, repeat):
+    """Best time per run over `repeat` timings, and peak traced memory of one more run"""
+    # Untimed warm-up run, which also pays one-off costs such as lazy imports
+    _, schedule = run_scheduler(algorithm, tasks, time_quantum)
+    intervals = len(schedule)
+    del schedule
+
+    # Find how many runs make up one timing of at least MIN_TIME; the
+    # calibration timings themselves are not kept
+    number = 1
+    elapsed = time_runs(algorithm, tasks, time_quantum, number)
+    while elapsed < MIN_TIME:
+        number *= 10 if elapsed < MIN_TIME / 10 else 2
+        elapsed = time_runs(algorithm, tasks, time_quantum, number)
+
+    seconds = min(time_runs(algorithm, tasks, time_quantum, number) / number for _ in range(repeat))
+
+    # Memory is measured separately, as tracing slows the run down
+    tracemalloc.start()
+    try:
+        run_scheduler(algorithm, tasks, time_quantum)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak, intervals
+
+def run_benchmarks(algorithms=ALGORITHMS, sizes=SIZES, distributions=tuple(BURST_DISTRIBUTIONS),
+                   loads=LOADS, time_quantum=2, repeat=3, seed=0, log=None):
+    """Time every algorithm on every workload; returns a list of result records"""
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            for load in loads:
+                tasks = generate_workload(size, distribution, load, seed)
+                for algorithm in algorithms:
+                    seconds, peak, intervals = measure(algorithm, tasks, time_quantum, repeat)
+                    record = {
+                        "algorithm": algorithm,
+                        "size": size,
+                        "distribution": distribution,
+                        "load": load,
+                        "seconds": seconds,
+                        "peak_bytes": peak,
+                        "intervals": intervals,
+                    }
+                    results.append(record)
+                    if log:
+                        log.write(f"{algorithm:>15} {size:>8} {distribution:>12} load={load:<4} "
+                                  f"{seconds:10.4f}s {peak / 2**20:9.2f} MiB\n")
+                        log.flush()
+    return results
+
+def case_key(record):
+    return (record["algorithm"], record["size"], record["distribution"], record["load"])
+
+def compare_to_baseline(results, baseline, threshold=0.1):
+    """Regressions of results against a baseline, as (record, field, ratio) triples.
+
+    A case regresses when its time or peak memory exceeds the baseline's by
+    more than `threshold` (a fraction). Cases missing from the baseline are
+    skipped.
+    """
+    baseline_cases = {case_key(record): record for record in baseline}
+    regressions = []
+    for record in results:
+        base = baseline_cases.get(case_key(record))
+        if base is None:
+            continue
+        for field in ("seconds", "peak_bytes"):
+            if base[field] > 0 and record[field] / base[field] > 1 + threshold:
+                regressions.append((record, field, record[field] / base[field]))
+    return regressions
+
+def parse_list(convert):
+    """argparse type for a comma-separated list of values"""
+    def parse(text):
+        try:
+            return [convert(value.strip()) for value in text.split(',')]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid list: {text}")
+    return parse
+
+def parse_distributions(text):
+    distributions = text.split(',')
+    for distribution in distributions:
+        if distribution not in BURST_DISTRIBUTIONS:
+            raise argparse.ArgumentTypeError(f"unknown distribution: {distribution}")
+    return distributions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m SchedulingBenchmark",
+        description="Time the scheduling algorithms on synthetic workloads of increasing size."
+    )
+    parser.add_argument("-a", "--algorithms", type=parse_algorithms, default=ALGORITHMS,
+                        help="comma-separated algorithms: fcfs, sjn, rr, rm, edf (default: all)")
+    parser.add_argument("--sizes", type=parse_list(int), default=SIZES,
+                        help="comma-separated task counts (default: 10 to 1000000)")
+    parser.add_argument("--distributions", type=parse_distributions, default=list(BURST_DISTRIBUTIONS),
+                        help="comma-separated burst distributions: " + ", ".join(BURST_DISTRIBUTIONS))
+    parser.add_argument("--loads", type=parse_list(float), default=LOADS,
+                        help="comma-separated offered loads (default: 0.5,0.9)")
+    parser.add_argument("-q", "--time-quantum", type=int, default=2,
+                        help="time quantum for Round Robin (default: 2)")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="timed runs per case, the best is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="workload random seed (default: 0)")
+    parser.add_argument("-o", "--output", metavar="FILE", help="write the results to FILE as JSON")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="compare against results saved with --output; exit with status 1 on a regression")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed slowdown or memory growth over the baseline (default: 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.time_quantum <= 0:
+        parser.error("time quantum must be positive")
+    if args.repeat <= 0:
+        parser.error("repeat must be positive")
+    if min(args.sizes) <= 0 or min(args.loads) <= 0:
+        parser.error("sizes and loads must be positive")
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline) as f:
+                baseline = json.load(f)["results"]
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot read baseline {args.baseline}: {e}")
+
+    results = run_benchmarks(args.algorithms, args.sizes, args.distributions, args.loads,
+                             args.time_quantum, args.repeat, args.seed, log=sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time_quantum": args.time_quantum,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for record, field, ratio in regressions:
+            sys.stderr.write(f"REGRESSION {record['algorithm']} size={record['size']} "
+                             f"{record['distribution']} load={record['load']}: "
+                             f"{field} x{ratio:.2f}\n")
+        if regressions:
+            return 1
+        sys.stderr.write("No regressions against the baseline\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
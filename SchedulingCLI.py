@@ -0,0 +1,206 @@
+# SchedulingCLI.py
+# ======================
+# Headless command line front end: runs scheduling algorithms on a workload
+# file and prints their metrics as JSON or CSV, without importing pygame.
+#
+# Usage: python -m SchedulingCLI workload.csv [-a fcfs,rr] [-q 2] [-f csv]
+#        python -m SchedulingCLI workload.csv --sweep 1-20
+#        python -m SchedulingCLI workload.csv --analyze
+
+import argparse
+import csv
+import json
+import sys
+
+from SchedulingCore import (
+    ALGORITHMS, EXECUTOR_BACKENDS, HYPERPERIOD, PERIODIC_ALGORITHMS, Execution, MetricsAccumulator,
+    ResultCache, iter_schedule, parse_algorithms, sweep_rr
+)
+from SchedulingAnalysis import analyze
+from WorkloadLoader import iter_workload, load_taskset
+
+METRIC_FIELDS = ["cpu_utilization", "avg_waiting", "avg_turnaround", "context_switches"]
+
+def parse_quanta(text):
+    """Parse time quanta as a list (1,2,4,8) or an inclusive range with an optional step (1-20 or 1-20:2)"""
+    try:
+        if '-' in text:
+            bounds, _, step = text.partition(':')
+            first, last = (int(bound) for bound in bounds.split('-'))
+            quanta = list(range(first, last + 1, int(step or 1)))
+        else:
+            quanta = [int(quantum) for quantum in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid quanta: {text}")
+    if not quanta or min(quanta) <= 0:
+        raise argparse.ArgumentTypeError("time quanta must be positive")
+    return quanta
+
+def parse_horizon(text):
+    """Parse a positive periodic release horizon, or hyperperiod"""
+    if text == HYPERPERIOD:
+        return HYPERPERIOD
+    try:
+        horizon = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid horizon: {text}")
+    if horizon <= 0:
+        raise argparse.ArgumentTypeError("horizon must be positive")
+    return horizon
+
+def write_metrics(results, output_format, out):
+    """Write {algorithm: metrics} as JSON or CSV"""
+    if output_format == "json":
+        json.dump(results, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.writer(out)
+        writer.writerow(["algorithm"] + METRIC_FIELDS)
+        for algorithm, metrics in results.items():
+            writer.writerow([algorithm] + [metrics[field] for field in METRIC_FIELDS])
+
+def write_sweep(curve, output_format, out):
+    """Write a Round Robin sweep, [(quantum, metrics)], as JSON or CSV"""
+    if output_format == "json":
+        json.dump([dict(quantum=quantum, **metrics) for quantum, metrics in curve], out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.writer(out)
+        writer.writerow(["quantum"] + METRIC_FIELDS)
+        for quantum, metrics in curve:
+            writer.writerow([quantum] + [metrics[field] for field in METRIC_FIELDS])
+
+def write_analyses(analyses, output_format, out):
+    """Write schedulability analyses as JSON, with every test run, or as CSV with the deciding one"""
+    if output_format == "json":
+        json.dump({
+            analysis.algorithm: {
+                "schedulable": analysis.schedulable,
+                "utilization": analysis.utilization,
+                "tests": [verdict._asdict() for verdict in analysis.verdicts],
+            }
+            for analysis in analyses
+        }, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.writer(out)
+        writer.writerow(["algorithm", "schedulable", "utilization", "test", "detail"])
+        for analysis in analyses:
+            verdict = analysis.verdicts[-1]
+            writer.writerow([analysis.algorithm, analysis.schedulable, analysis.utilization,
+                             verdict.test, verdict.detail])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m SchedulingCLI",
+        description="Run CPU scheduling algorithms on a workload file and print their metrics."
+    )
+    parser.add_argument("workload", help="CSV or JSONL file with name, arrival, burst[, deadline, period] fields")
+    parser.add_argument("-i", "--input-format", choices=["csv", "jsonl"],
+                        help="workload file format (default: from the file extension)")
+    parser.add_argument("-a", "--algorithms", type=parse_algorithms, default=ALGORITHMS,
+                        help="comma-separated algorithms: fcfs, sjn, rr, rm, edf (default: all)")
+    parser.add_argument("-q", "--time-quantum", type=int, default=1,
+                        help="time quantum for Round Robin (default: 1)")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json",
+                        help="output format (default: json)")
+    parser.add_argument("-s", "--schedule", metavar="FILE",
+                        help="also write every execution interval to FILE as CSV")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream the workload from disk for each algorithm instead of "
+                             "loading it; the file must be in arrival order")
+    parser.add_argument("--periodic", metavar="HORIZON", nargs="?", const=HYPERPERIOD, type=parse_horizon,
+                        help="for rm and edf, release a job of each periodic task every period up to "
+                             "HORIZON (default: hyperperiod, one hyperperiod after the last arrival)")
+    parser.add_argument("-c", "--cores", type=int, default=1,
+                        help="number of cores to schedule on (default: 1)")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="with several cores, assign every task to one core instead of "
+                             "sharing a global ready queue")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="reuse results of earlier runs on the same workload stored in DIR")
+    parser.add_argument("--sweep", metavar="QUANTA", type=parse_quanta,
+                        help="instead, print Round Robin metrics for each time quantum in "
+                             "QUANTA, a list (1,2,4) or range (1-20 or 1-20:2)")
+    parser.add_argument("--analyze", action="store_true",
+                        help="instead, test whether the periodic tasks are schedulable under rm "
+                             "and edf analytically, without simulating them")
+    parser.add_argument("--backend", choices=EXECUTOR_BACKENDS, default="process",
+                        help="how --sweep runs the quanta in parallel (default: process)")
+    args = parser.parse_args(argv)
+
+    if args.time_quantum <= 0:
+        parser.error("time quantum must be positive")
+    if args.stream and args.cache_dir:
+        parser.error("--cache-dir cannot be combined with --stream")
+    if args.stream and args.periodic:
+        parser.error("--periodic cannot be combined with --stream")
+    if args.cores <= 0:
+        parser.error("cores must be positive")
+    if args.stream and args.partitioned:
+        parser.error("--partitioned cannot be combined with --stream")
+    if args.cores > 1 and (args.sweep or args.analyze):
+        parser.error("--sweep and --analyze are for a single core")
+
+    if args.analyze:
+        algorithms = [algorithm for algorithm in args.algorithms if algorithm in PERIODIC_ALGORITHMS]
+        if not algorithms:
+            parser.error("--analyze needs rm or edf")
+        try:
+            tasks = load_taskset(args.workload, args.input_format)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        write_analyses([analyze(tasks, algorithm) for algorithm in algorithms], args.format, sys.stdout)
+        return 0
+
+    if args.sweep:
+        try:
+            curve = sweep_rr(load_taskset(args.workload, args.input_format), args.sweep, args.backend)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        write_sweep(curve, args.format, sys.stdout)
+        return 0
+
+    schedule_file = None
+    try:
+        if not args.stream:
+            tasks = load_taskset(args.workload, args.input_format)
+        if args.schedule:
+            schedule_file = open(args.schedule, "w", newline="")
+            schedule_writer = csv.writer(schedule_file)
+            schedule_writer.writerow(["algorithm", "name", "start", "end"] + (["core"] if args.cores > 1 else []))
+
+        # Consume each run event by event, so neither the schedule nor (with
+        # --stream) the workload is ever held in memory. A result cache keeps
+        # whole runs instead, so they can be reused.
+        results = {}
+        cache = ResultCache(directory=args.cache_dir) if args.cache_dir else None
+        for algorithm in args.algorithms:
+            if cache is not None:
+                result, schedule = cache.run(algorithm, tasks, args.time_quantum, args.periodic,
+                                             args.cores, args.partitioned)
+                if schedule_file:
+                    schedule_writer.writerows([algorithm, *entry] for entry in schedule)
+                results[algorithm] = result.metrics.snapshot()
+                continue
+            if args.stream:
+                tasks = iter_workload(args.workload, args.input_format)
+            metrics = MetricsAccumulator(args.cores)
+            events = iter_schedule(tasks, algorithm, args.time_quantum, args.periodic, args.cores, args.partitioned)
+            for event in events:
+                metrics.add(event)
+                if schedule_file and type(event) is Execution:
+                    row = [algorithm, event.name, event.start, event.end]
+                    schedule_writer.writerow(row + [event.core] if args.cores > 1 else row)
+            results[algorithm] = metrics.snapshot()
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    finally:
+        if schedule_file:
+            schedule_file.close()
+
+    write_metrics(results, args.format, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
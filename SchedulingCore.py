@@ -0,0 +1,1573 @@
+# SchedulingCore.py
+# ======================
+# Scheduling algorithms, metrics and execution backends, independent of the UI
+
+import os
+import threading
+import heapq
+import bisect
+import functools
+import hashlib
+import itertools
+import math
+import pickle
+from collections import OrderedDict, deque, namedtuple
+from array import array
+
+# ------------------ TASK CLASS ------------------
+class Task:
+    def __init__(self, name, arrival, burst, deadline=None, period=None):
+        self.name = name
+        self.arrival = arrival
+        self.burst = burst
+        self.remaining = burst
+        self.deadline = deadline
+        self.period = period
+        self.start_time = None
+        self.finish_time = None
+        self.executions = []
+        self.waiting_time = 0
+        self.turnaround_time = 0
+
+# Marker for an unset integer column value (no deadline, not started, ...)
+UNSET = -1
+
+class TaskSet:
+    """Column-oriented storage for a set of tasks.
+    
+    Task attributes are kept in parallel integer arrays instead of one Task
+    object per task, which keeps large traces compact. A TaskSet is treated
+    as immutable by the algorithms, so one instance can be shared by any
+    number of concurrent runs. Indexing or iterating yields TaskView objects
+    exposing the same attributes as Task.
+    """
+    def __init__(self):
+        self.names = []
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.deadline = array('q')
+        self.period = array('q')
+        self.sorted_by_arrival = None
+        
+    @classmethod
+    def from_tasks(cls, tasks):
+        """Build a task set from Task objects; a TaskSet is returned as is"""
+        if isinstance(tasks, TaskSet):
+            return tasks
+            
+        task_set = cls()
+        for task in tasks:
+            task_set.append(task.name, task.arrival, task.burst, task.deadline, task.period)
+        return task_set
+        
+    def append(self, name, arrival, burst, deadline=None, period=None):
+        """Add a task to the set"""
+        self.names.append(name)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.deadline.append(UNSET if deadline is None else deadline)
+        self.period.append(UNSET if period is None else period)
+        self.sorted_by_arrival = None
+        
+    def __getstate__(self):
+        # Pickle the columns as raw bytes, which keeps task sets cheap to
+        # ship to worker processes; names may contain any character, so
+        # they stay a list
+        return (self.names, self.arrival.tobytes(), self.burst.tobytes(),
+                self.deadline.tobytes(), self.period.tobytes())
+        
+    def __setstate__(self, state):
+        names, arrival, burst, deadline, period = state
+        self.names = list(names)
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.deadline = array('q', deadline)
+        self.period = array('q', period)
+        self.sorted_by_arrival = None
+        
+    def fingerprint(self):
+        """Hex digest identifying the contents of the task set"""
+        names, *columns = self.__getstate__()
+        digest = hashlib.sha256(len(self).to_bytes(8, 'little'))
+        # The name lengths delimit the names, whatever characters they hold
+        digest.update(array('q', map(len, names)).tobytes())
+        digest.update(''.join(names).encode('utf-8', 'surrogatepass'))
+        for column in columns:
+            digest.update(column)
+        return digest.hexdigest()
+        
+    def arrival_order(self):
+        """Task indices sorted by arrival time, ties broken by input order.
+        
+        The order is computed once and shared by every run over the set
+        until a task is appended; callers must not modify it.
+        """
+        if self.sorted_by_arrival is None:
+            self.sorted_by_arrival = sorted(range(len(self)), key=self.arrival.__getitem__)
+        return self.sorted_by_arrival
+        
+    def subset(self, indices):
+        """New task set of the tasks at the given indices, in that order"""
+        subset = TaskSet()
+        subset.names = [self.names[i] for i in indices]
+        subset.arrival = array('q', (self.arrival[i] for i in indices))
+        subset.burst = array('q', (self.burst[i] for i in indices))
+        subset.deadline = array('q', (self.deadline[i] for i in indices))
+        subset.period = array('q', (self.period[i] for i in indices))
+        return subset
+        
+    def __len__(self):
+        return len(self.names)
+        
+    def __getitem__(self, index):
+        return TaskView(self, index)
+        
+    def __iter__(self):
+        return (TaskView(self, i) for i in range(len(self)))
+
+class ScheduleResult:
+    """Per-task outcome of running an algorithm over a TaskSet.
+    
+    The input task set is referenced, not copied; only the outcome columns
+    (start, finish and execution intervals) are allocated per run. Waiting
+    and turnaround times are derived from them on access, and the aggregate
+    metrics are kept up to date in a MetricsAccumulator. Indexing or
+    iterating yields TaskView objects combining inputs and outcomes.
+    
+    A periodic task completes a job every period, so its finish time is
+    that of its last job. Once a task completes a second job, the number of
+    jobs completed and the sum of their turnaround times are kept for every
+    task in the jobs and total_turnaround columns; until then they are None
+    and each finished task counts as one job.
+    """
+    def __init__(self, task_set, cores=1):
+        self.task_set = task_set
+        self.start_time = array('q', [UNSET]) * len(task_set)
+        self.finish_time = array('q', [UNSET]) * len(task_set)
+        self.executions = [[] for _ in range(len(task_set))]
+        self.jobs = None
+        self.total_turnaround = None
+        self.metrics = MetricsAccumulator(cores)
+        
+    @classmethod
+    def from_columns(cls, task_set, start_time, finish_time, executions, metrics):
+        """Result with outcome columns computed elsewhere, as by the NumPy kernels"""
+        result = cls.__new__(cls)
+        result.task_set = task_set
+        result.start_time = start_time
+        result.finish_time = finish_time
+        result.executions = executions
+        result.jobs = None
+        result.total_turnaround = None
+        result.metrics = metrics
+        return result
+        
+    def count_jobs(self):
+        """Allocate the jobs and total_turnaround columns from the tasks finished so far"""
+        arrival, finish_time = self.task_set.arrival, self.finish_time
+        self.jobs = array('q', (finish != UNSET for finish in finish_time))
+        self.total_turnaround = array('q', (finish - start if finish != UNSET else 0
+                                            for finish, start in zip(finish_time, arrival)))
+        return self.jobs, self.total_turnaround
+        
+    def __len__(self):
+        return len(self.task_set)
+        
+    def __getitem__(self, index):
+        return TaskView(self.task_set, index, self)
+        
+    def __iter__(self):
+        return (TaskView(self.task_set, i, self) for i in range(len(self)))
+
+class SingleExecutions:
+    """Execution intervals of a ScheduleResult in which every task ran once.
+    
+    Reads like the usual list of interval lists, but derives each task's
+    single interval from the start and finish columns on access instead of
+    holding millions of one-element lists.
+    """
+    __slots__ = ('start_time', 'finish_time')
+    
+    def __init__(self, start_time, finish_time):
+        self.start_time = start_time
+        self.finish_time = finish_time
+        
+    def __len__(self):
+        return len(self.start_time)
+        
+    def __getitem__(self, index):
+        start = self.start_time[index]
+        return [] if start == UNSET else [(start, self.finish_time[index])]
+        
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+        
+    def __getstate__(self):
+        return self.start_time, self.finish_time
+        
+    def __setstate__(self, state):
+        self.start_time, self.finish_time = state
+
+class TaskView:
+    """Read-only view of a single task, compatible with Task.
+    
+    Inputs come from the TaskSet and outcomes from the ScheduleResult, if
+    any; without a result the task reads as not yet scheduled.
+    """
+    __slots__ = ('task_set', 'index', 'result')
+    
+    def __init__(self, task_set, index, result=None):
+        self.task_set = task_set
+        self.index = index
+        self.result = result
+        
+    @property
+    def name(self):
+        return self.task_set.names[self.index]
+        
+    @property
+    def arrival(self):
+        return self.task_set.arrival[self.index]
+        
+    @property
+    def burst(self):
+        return self.task_set.burst[self.index]
+        
+    @property
+    def deadline(self):
+        value = self.task_set.deadline[self.index]
+        return None if value == UNSET else value
+        
+    @property
+    def period(self):
+        value = self.task_set.period[self.index]
+        return None if value == UNSET else value
+        
+    @property
+    def remaining(self):
+        """Work left in the task's current job; 0 between jobs of a periodic task"""
+        in_progress = sum(end - start for start, end in self.executions) - self.jobs * self.burst
+        return self.burst - in_progress if in_progress > 0 or not self.jobs else 0
+        
+    @property
+    def start_time(self):
+        value = self.result.start_time[self.index] if self.result else UNSET
+        return None if value == UNSET else value
+        
+    @property
+    def finish_time(self):
+        value = self.result.finish_time[self.index] if self.result else UNSET
+        return None if value == UNSET else value
+        
+    @property
+    def executions(self):
+        return self.result.executions[self.index] if self.result else []
+        
+    @property
+    def jobs(self):
+        """Number of jobs completed, more than one for a periodic task"""
+        if self.result and self.result.jobs is not None:
+            return self.result.jobs[self.index]
+        return 0 if self.finish_time is None else 1
+        
+    @property
+    def total_turnaround_time(self):
+        """Sum of the turnaround times of the completed jobs"""
+        if self.result and self.result.jobs is not None:
+            return self.result.total_turnaround[self.index]
+        finish = self.finish_time
+        return 0 if finish is None else finish - self.arrival
+        
+    @property
+    def total_waiting_time(self):
+        """Sum of the waiting times of the completed jobs"""
+        return self.total_turnaround_time - self.jobs * self.burst
+        
+    @property
+    def turnaround_time(self):
+        """Turnaround time, averaged over the jobs of a periodic task"""
+        jobs = self.jobs
+        return self.total_turnaround_time / jobs if jobs > 1 else self.total_turnaround_time
+        
+    @property
+    def waiting_time(self):
+        """Waiting time, averaged over the jobs of a periodic task"""
+        jobs = self.jobs
+        return self.total_waiting_time / jobs if jobs > 1 else self.total_waiting_time
+
+# ------------------ SCHEDULING ALGORITHMS ------------------
+# Each algorithm is a generator (iter_fcfs, iter_sjn, ...) that yields an
+# Execution for every interval a task runs and a Completion when it
+# finishes, in simulated time order. The list-returning functions (fcfs,
+# sjn, ...) collect those events into a ScheduleResult and schedule list.
+
+# A task as it enters the simulation; unset deadlines and periods are None
+ArrivingTask = namedtuple('ArrivingTask', ['index', 'name', 'arrival', 'burst', 'deadline', 'period'])
+
+# Events yielded by the iter_* generators; `task` is the task's index and
+# `core` the core an execution ran on, 0 unless scheduled on several
+Execution = namedtuple('Execution', ['task', 'name', 'start', 'end', 'core'], defaults=[0])
+Completion = namedtuple('Completion', ['task', 'name', 'arrival', 'burst', 'finish'])
+
+def arrival_stream(tasks):
+    """Yield an ArrivingTask for each task in arrival order, ties broken by input order.
+    
+    A TaskSet or list of tasks is sorted first. Any other iterable (such as
+    WorkloadLoader.iter_workload) is consumed lazily and must already be in
+    arrival order; tasks are then indexed by their position in the stream.
+    """
+    if isinstance(tasks, (TaskSet, list, tuple)):
+        task_set = TaskSet.from_tasks(tasks)
+        names, arrival, burst = task_set.names, task_set.arrival, task_set.burst
+        deadline, period = task_set.deadline, task_set.period
+        for i in task_set.arrival_order():
+            yield ArrivingTask(i, names[i], arrival[i], burst[i],
+                               None if deadline[i] == UNSET else deadline[i],
+                               None if period[i] == UNSET else period[i])
+    else:
+        last_arrival = None
+        for i, task in enumerate(tasks):
+            if last_arrival is not None and task.arrival < last_arrival:
+                raise ValueError(f"Task {task.name!r} arrives at {task.arrival}, before the previous "
+                                 f"task at {last_arrival}; streamed tasks must be in arrival order")
+            last_arrival = task.arrival
+            yield ArrivingTask(i, task.name, task.arrival, task.burst, task.deadline, task.period)
+
+class ArrivalCursor:
+    """Arrival-ordered stream of ArrivingTasks with a look-ahead of one task"""
+    def __init__(self, stream):
+        self.stream = iter(stream)
+        self.pending = next(self.stream, None)
+        
+    def has_pending(self):
+        return self.pending is not None
+        
+    def next_arrival(self):
+        """Arrival time of the next task still to arrive, or None"""
+        return self.pending.arrival if self.pending is not None else None
+        
+    def admit(self, time):
+        """Return the tasks that have arrived by `time`, in input order"""
+        arrived = []
+        while self.pending is not None and self.pending.arrival <= time:
+            arrived.append(self.pending)
+            self.pending = next(self.stream, None)
+        # Tasks arriving in the same batch are admitted in input order
+        arrived.sort()
+        return arrived
+
+def iter_fcfs(tasks):
+    """First Come First Served Algorithm, as a stream of events"""
+    time = 0
+    for task in arrival_stream(tasks):
+        # Wait until task arrives if needed
+        time = max(time, task.arrival)
+        
+        yield Execution(task.index, task.name, time, time + task.burst)
+        time += task.burst
+        yield Completion(task.index, task.name, task.arrival, task.burst, time)
+
+def iter_sjn(tasks):
+    """Shortest Job Next Algorithm, as a stream of events"""
+    cursor = ArrivalCursor(arrival_stream(tasks))
+    
+    # Ready heap keyed on (burst, admission order)
+    ready = []
+    admitted = 0
+    
+    time = 0
+    while cursor.has_pending() or ready:
+        # Move arrived tasks to ready queue
+        for task in cursor.admit(time):
+            heapq.heappush(ready, (task.burst, admitted, task))
+            admitted += 1
+                
+        if ready:
+            # Select task with shortest burst time
+            task = heapq.heappop(ready)[2]
+            
+            yield Execution(task.index, task.name, time, time + task.burst)
+            time += task.burst
+            yield Completion(task.index, task.name, task.arrival, task.burst, time)
+        else:
+            # No tasks ready, jump to the next arrival
+            time = max(time, cursor.next_arrival())
+
+def check_quantum(time_quantum):
+    """Raise ValueError unless the Round Robin time quantum is positive"""
+    if time_quantum is None or time_quantum <= 0:
+        raise ValueError(f"Round Robin needs a positive time quantum, got {time_quantum!r}")
+
+def iter_rr(tasks, time_quantum):
+    """Round Robin Algorithm, as a stream of events"""
+    cursor = ArrivalCursor(arrival_stream(tasks))
+    
+    # Ready queue of (task, [remaining time]) pairs
+    ready_queue = deque()
+    
+    time = 0
+    while cursor.has_pending() or ready_queue:
+        # Move arrived tasks to ready queue
+        ready_queue.extend((task, [task.burst]) for task in cursor.admit(time))
+                
+        if ready_queue:
+            task, remaining = ready_queue.popleft()
+            
+            # Execute for the quantum, or less if the task finishes first
+            execution_time = min(time_quantum, remaining[0])
+            start_time = time
+            time += execution_time
+            remaining[0] -= execution_time
+            
+            yield Execution(task.index, task.name, start_time, time)
+            
+            # Check if task is complete
+            if remaining[0] <= 0:
+                yield Completion(task.index, task.name, task.arrival, task.burst, time)
+            else:
+                # Put back in ready queue
+                ready_queue.append((task, remaining))
+        else:
+            # No tasks ready, jump to the next arrival
+            time = max(time, cursor.next_arrival())
+
+# Horizon that releases periodic jobs up to the end of the first hyperperiod
+HYPERPERIOD = "hyperperiod"
+
+def check_periods(task_set):
+    """Raise ValueError if a task has a period that is not positive"""
+    for name, period in zip(task_set.names, task_set.period):
+        if period != UNSET and period <= 0:
+            raise ValueError(f"Task {name!r} has period {period}; periods must be positive")
+
+def hyperperiod(tasks):
+    """Least common multiple of the task periods (1 when no task is periodic)"""
+    task_set = TaskSet.from_tasks(tasks)
+    check_periods(task_set)
+    return math.lcm(*(period for period in task_set.period if period != UNSET))
+
+def resolve_horizon(tasks, horizon):
+    """Release horizon as a time: HYPERPERIOD becomes the last arrival plus the hyperperiod.
+    
+    Raises ValueError if a task has a period that is not positive, which
+    would release jobs forever.
+    """
+    task_set = TaskSet.from_tasks(tasks)
+    if horizon != HYPERPERIOD:
+        check_periods(task_set)
+        return horizon
+    return max(task_set.arrival, default=0) + hyperperiod(task_set)
+
+def periodic_job_count(tasks, horizon):
+    """Number of jobs periodic_releases yields, computed without generating them"""
+    task_set = TaskSet.from_tasks(tasks)
+    horizon = resolve_horizon(task_set, horizon)
+    count = 0
+    for arrival, period in zip(task_set.arrival, task_set.period):
+        if arrival < horizon:
+            count += 1 if period == UNSET else -(-(horizon - arrival) // period)
+    return count
+
+def periodic_releases(tasks, horizon=HYPERPERIOD):
+    """Yield the jobs of a task set in release order, each as an ArrivingTask.
+    
+    A task with a period releases a job every period from its arrival time,
+    and a task without one releases a single job; only jobs released before
+    the horizon are yielded. A job carries the index of its task, so its
+    executions and completion are recorded against that task. Its deadline
+    is the task's deadline (taken as relative to the arrival time) shifted to
+    the job's release, or the next release if the task has no deadline.
+    
+    Jobs are generated lazily from a heap holding the next release of each
+    task, so memory stays proportional to the number of tasks however long
+    the hyperperiod is.
+    """
+    task_set = TaskSet.from_tasks(tasks)
+    horizon = resolve_horizon(task_set, horizon)
+    names, arrival, burst = task_set.names, task_set.arrival, task_set.burst
+    deadline, period = task_set.deadline, task_set.period
+    
+    # Heap of (next release, task index); ties release in input order
+    releases = [(arrival[i], i) for i in range(len(task_set)) if arrival[i] < horizon]
+    heapq.heapify(releases)
+    while releases:
+        release, i = releases[0]
+        task_period = None if period[i] == UNSET else period[i]
+        if deadline[i] != UNSET:
+            job_deadline = deadline[i] + release - arrival[i]
+        else:
+            job_deadline = release + task_period if task_period is not None else None
+        yield ArrivingTask(i, names[i], release, burst[i], job_deadline, task_period)
+        
+        if task_period is not None and release + task_period < horizon:
+            heapq.heapreplace(releases, (release + task_period, i))
+        else:
+            heapq.heappop(releases)
+
+def iter_preemptive_priority(tasks, priority_field, raw_ticks=False, horizon=None):
+    """Discrete-event engine for preemptive fixed-priority scheduling.
+
+    Instead of stepping one time unit at a time, the simulation only wakes up
+    at arrivals and completions: the highest priority ready task runs until it
+    either finishes or the next task arrives (the only point where it can be
+    preempted). Ready tasks are kept in a heap keyed on (priority, input
+    order), which matches the tie-breaking of the original unit-step loops.
+    Priorities come from the named task field, lower value first, with unset
+    values ranked last.
+    
+    Adjacent slices of the same task are merged into a single Execution,
+    which is emitted once the task stops running. Pass raw_ticks=True to get
+    one Execution per time unit instead.
+    
+    With a horizon, periodic tasks release a job every period up to it, as
+    generated by periodic_releases; otherwise every task runs once.
+    """
+    if horizon is None:
+        cursor = ArrivalCursor(arrival_stream(tasks))
+    else:
+        cursor = ArrivalCursor(periodic_releases(tasks, horizon))
+    
+    # Heap of (priority, index, release, task, [remaining time])
+    ready = []
+    
+    # Execution of the running task, held back until it stops running
+    running = None
+    
+    time = 0
+    while cursor.has_pending() or ready:
+        # Admit every task that has arrived by now
+        for task in cursor.admit(time):
+            if task.burst > 0:
+                priority = getattr(task, priority_field)
+                key = priority if priority is not None else float('inf')
+                heapq.heappush(ready, (key, task.index, task.arrival, task, [task.burst]))
+                
+        if not ready:
+            # No tasks ready, jump to the next arrival
+            if cursor.has_pending():
+                time = max(time, cursor.next_arrival())
+            continue
+            
+        # Highest priority task stays on the heap until it completes
+        _, _, _, task, remaining = ready[0]
+            
+        # Run until completion or the next arrival, whichever comes first
+        end = time + remaining[0]
+        if cursor.has_pending():
+            end = min(end, cursor.next_arrival())
+            
+        if raw_ticks:
+            for start in range(time, end):
+                yield Execution(task.index, task.name, start, start + 1)
+        elif running is not None and running.task == task.index and running.end == time:
+            # Same task kept running across an arrival
+            running = running._replace(end=end)
+        else:
+            if running is not None:
+                yield running
+            running = Execution(task.index, task.name, time, end)
+            
+        remaining[0] -= end - time
+        time = end
+        
+        # Check if task is complete
+        if remaining[0] <= 0:
+            heapq.heappop(ready)
+            if running is not None:
+                yield running
+                running = None
+            yield Completion(task.index, task.name, task.arrival, task.burst, time)
+
+def iter_rm(tasks, raw_ticks=False, horizon=None):
+    """Rate Monotonic Algorithm, as a stream of events"""
+    # Shortest period has the highest priority
+    return iter_preemptive_priority(tasks, 'period', raw_ticks, horizon)
+
+def iter_edf(tasks, raw_ticks=False, horizon=None):
+    """Earliest Deadline First Algorithm, as a stream of events"""
+    # Earliest deadline has the highest priority
+    return iter_preemptive_priority(tasks, 'deadline', raw_ticks, horizon)
+
+# ------------------ MULTI-CORE SCHEDULING ------------------
+# With more than one core, an algorithm runs either globally, with all cores
+# sharing one ready queue and jobs free to migrate, or partitioned, with each
+# task assigned to one core up front and every core running the single-core
+# algorithm on its own tasks. Executions then carry the core they ran on.
+
+def iter_global(tasks, algorithm, cores, time_quantum=None, horizon=None):
+    """Global multi-core scheduling, as a stream of events.
+
+    Whenever a core is free it takes the head of the shared ready queue,
+    which is ordered as in the single-core algorithm. Rate Monotonic and
+    EDF run the `cores` highest priority jobs at all times: a job arriving
+    with a higher priority than a running one preempts the lowest priority
+    running job, which resumes later on whichever core frees up first.
+    Freed cores are taken lowest numbered first.
+
+    The next completion or quantum expiry of every core is kept in a heap,
+    and for the preemptive algorithms the lowest priority running job in
+    another, both invalidated lazily, so each event costs O(log n) however
+    many cores there are. With one core the events match the single-core
+    algorithm's. Executions of a core are yielded in time order, but those
+    of different cores are only ordered by end time.
+    """
+    periodic = horizon is not None and algorithm in PERIODIC_ALGORITHMS
+    cursor = ArrivalCursor(periodic_releases(tasks, horizon) if periodic else arrival_stream(tasks))
+    preemptive = algorithm in PERIODIC_ALGORITHMS
+    priority_field = 'period' if algorithm == "Rate Monotonic" else 'deadline'
+    quantum = time_quantum if algorithm == "Round Robin" else None
+    
+    def ready_key(task):
+        if preemptive:
+            priority = getattr(task, priority_field)
+            return (priority if priority is not None else float('inf'), task.index, task.arrival)
+        if algorithm == "FCFS":
+            return (task.arrival,)
+        return (task.burst,) if algorithm == "SJN" else ()
+        
+    # Heap of (key, admission order, task, remaining time); Round Robin has
+    # an empty key, so it runs in admission order
+    ready = []
+    admitted = itertools.count()
+    
+    # Per core [key, admission order, task, remaining, slice start, dispatch id], or None
+    running = [None] * cores
+    idle = list(range(cores))
+    dispatches = itertools.count()
+    
+    # Heaps of (slice end, core, dispatch id) and of the running jobs by
+    # descending priority, (negated key, negated order, core, dispatch id)
+    ends = []
+    lowest = []
+    
+    def dispatch(core, key, order, task, remaining):
+        dispatch_id = next(dispatches)
+        running[core] = [key, order, task, remaining, time, dispatch_id]
+        end = time + (remaining if quantum is None else min(quantum, remaining))
+        heapq.heappush(ends, (end, core, dispatch_id))
+        if preemptive:
+            heapq.heappush(lowest, (tuple(-value for value in key), -order, core, dispatch_id))
+            
+    def is_current(core, dispatch_id):
+        return running[core] is not None and running[core][5] == dispatch_id
+        
+    time = 0
+    while True:
+        # Stop the slices ending now; unfinished Round Robin jobs requeue
+        # ahead of the tasks arriving now, as on a single core
+        while ends and ends[0][0] <= time:
+            _, core, dispatch_id = heapq.heappop(ends)
+            if not is_current(core, dispatch_id):
+                continue
+            key, order, task, remaining, start, _ = running[core]
+            running[core] = None
+            heapq.heappush(idle, core)
+            yield Execution(task.index, task.name, start, time, core)
+            remaining -= time - start
+            if remaining <= 0:
+                yield Completion(task.index, task.name, task.arrival, task.burst, time)
+            else:
+                heapq.heappush(ready, (key, next(admitted), task, remaining))
+                
+        for task in cursor.admit(time):
+            if task.burst > 0 or not preemptive:
+                heapq.heappush(ready, (ready_key(task), next(admitted), task, task.burst))
+                
+        while ready and idle:
+            dispatch(heapq.heappop(idle), *heapq.heappop(ready))
+            
+        # Preempt the lowest priority running jobs while a ready job beats them
+        while preemptive and ready:
+            while lowest and not is_current(lowest[0][2], lowest[0][3]):
+                heapq.heappop(lowest)
+            core = lowest[0][2]
+            key, order, task, remaining, start, _ = running[core]
+            if ready[0][:2] >= (key, order):
+                break
+            heapq.heappop(lowest)
+            if time > start:
+                yield Execution(task.index, task.name, start, time, core)
+            running[core] = None
+            heapq.heappush(ready, (key, order, task, remaining - (time - start)))
+            dispatch(core, *heapq.heappop(ready))
+            
+        # Advance to the next slice end, or the next arrival if it can start
+        # running (it cannot while every core runs a non-preemptible job)
+        while ends and not is_current(ends[0][1], ends[0][2]):
+            heapq.heappop(ends)
+        next_time = ends[0][0] if ends else None
+        if cursor.has_pending() and (preemptive or idle or next_time is None):
+            next_arrival = cursor.next_arrival()
+            next_time = next_arrival if next_time is None else min(next_time, next_arrival)
+        if next_time is None:
+            return
+        time = max(time, next_time)
+
+def partition(tasks, algorithm, cores, horizon=None):
+    """Assign every task to a core; returns the task indices of each core.
+
+    Tasks released periodically (PERIODIC_ALGORITHMS with a horizon) are
+    placed in decreasing order of utilization on the least utilized core
+    (worst-fit decreasing), a task without a period counting as its burst
+    over the rest of the horizon. Otherwise each task, in arrival order,
+    goes to the core whose assigned work would finish first if run back to
+    back, which balances one-off jobs as they arrive.
+    """
+    task_set = TaskSet.from_tasks(tasks)
+    arrival, burst, period = task_set.arrival, task_set.burst, task_set.period
+    assigned = [[] for _ in range(cores)]
+    
+    # Heap of (load, core): utilization or estimated finish time
+    loads = [(0, core) for core in range(cores)]
+    if horizon is not None and algorithm in PERIODIC_ALGORITHMS:
+        end = resolve_horizon(task_set, horizon)
+        def utilization(i):
+            if period[i] != UNSET:
+                return burst[i] / period[i]
+            return burst[i] / max(end - arrival[i], 1)
+        for i in sorted(range(len(task_set)), key=lambda i: (-utilization(i), i)):
+            load, core = loads[0]
+            assigned[core].append(i)
+            heapq.heapreplace(loads, (load + utilization(i), core))
+    else:
+        for i in task_set.arrival_order():
+            finish, core = loads[0]
+            assigned[core].append(i)
+            heapq.heapreplace(loads, (max(finish, arrival[i]) + burst[i], core))
+            
+    # Keep input order within a core, so ties break as on a single core
+    for indices in assigned:
+        indices.sort()
+    return assigned
+
+def event_time(event):
+    """Simulated time of an Execution (its end) or Completion"""
+    return event.end if type(event) is Execution else event.finish
+
+def iter_partitioned(tasks, algorithm, cores, time_quantum=None, horizon=None):
+    """Partitioned multi-core scheduling, as a stream of events.
+
+    Tasks are assigned to cores by partition(), then every core runs the
+    single-core algorithm over its own tasks, each core with a run queue of
+    its own. The per-core event streams are merged in time order; the
+    workload is loaded as a whole to partition it.
+    """
+    task_set = TaskSet.from_tasks(tasks)
+    if horizon is not None:
+        # The same horizon for every core, whatever its own hyperperiod
+        horizon = resolve_horizon(task_set, horizon)
+        
+    def on_core(core, indices):
+        for event in iter_schedule(task_set.subset(indices), algorithm, time_quantum, horizon):
+            if type(event) is Execution:
+                yield Execution(indices[event.task], event.name, event.start, event.end, core)
+            else:
+                yield event._replace(task=indices[event.task])
+                
+    streams = [on_core(core, indices)
+               for core, indices in enumerate(partition(task_set, algorithm, cores, horizon)) if indices]
+    return heapq.merge(*streams, key=event_time)
+
+def iter_schedule(tasks, algorithm="FCFS", time_quantum=None, horizon=None, cores=1, partitioned=False):
+    """Generator variant of run_scheduler.
+    
+    Yields Execution and Completion events as the simulation produces them,
+    so long runs can be consumed in constant memory and observed before
+    they finish.
+    """
+    if algorithm == "Round Robin":
+        check_quantum(time_quantum)
+    if cores > 1:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        schedule_on = iter_partitioned if partitioned else iter_global
+        return schedule_on(tasks, algorithm, cores, time_quantum, horizon)
+    if algorithm == "FCFS":
+        return iter_fcfs(tasks)
+    elif algorithm == "SJN":
+        return iter_sjn(tasks)
+    elif algorithm == "Round Robin":
+        return iter_rr(tasks, time_quantum)
+    elif algorithm == "Rate Monotonic":
+        return iter_rm(tasks, horizon=horizon)
+    elif algorithm == "EDF":
+        return iter_edf(tasks, horizon=horizon)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+def collect_schedule(task_set, events, schedule=None, cores=1):
+    """Collect a stream of events over task_set into (ScheduleResult, schedule).
+    
+    The execution intervals are appended to `schedule` if given, so a caller
+    can watch the list grow while the events are being consumed. They are
+    (name, start, end) entries, or (name, start, end, core) entries when
+    scheduled on several cores.
+    """
+    result_tasks = ScheduleResult(task_set, cores)
+    result_schedule = [] if schedule is None else schedule
+    
+    start_time, finish_time = result_tasks.start_time, result_tasks.finish_time
+    executions = result_tasks.executions
+    jobs = total_turnaround = None
+    
+    for event in events:
+        result_tasks.metrics.add(event)
+        if type(event) is Execution:
+            # Set task start time if first execution
+            if start_time[event.task] == UNSET:
+                start_time[event.task] = event.start
+            executions[event.task].append((event.start, event.end))
+            if cores > 1:
+                result_schedule.append((event.name, event.start, event.end, event.core))
+            else:
+                result_schedule.append((event.name, event.start, event.end))
+        else:
+            task = event.task
+            if jobs is None and finish_time[task] != UNSET:
+                # A periodic task completed another job
+                jobs, total_turnaround = result_tasks.count_jobs()
+            if jobs is not None:
+                jobs[task] += 1
+                total_turnaround[task] += event.finish - event.arrival
+                finish_time[task] = max(finish_time[task], event.finish)
+            else:
+                finish_time[task] = event.finish
+            
+    return result_tasks, result_schedule
+
+# Task sets smaller than this run on the pure-Python engines even with
+# NumPy installed, as converting to and from arrays would cost more
+NUMPY_MIN_TASKS = 1000
+
+@functools.lru_cache(maxsize=None)
+def numpy_kernels():
+    """The SchedulingKernels module, or None when NumPy is not installed.
+    
+    Like concurrent.futures, NumPy is imported on first use so that this
+    module stays quick to import.
+    """
+    try:
+        import SchedulingKernels
+    except ImportError:
+        return None
+    return SchedulingKernels
+
+def collect_kernel_schedule(task_set, kernels, kernel):
+    """Run a NumPy kernel over task_set and collect it into (ScheduleResult, schedule).
+    
+    The kernel maps arrival and burst arrays to (order, start, finish) in
+    execution order, each task running once without preemption. The result
+    equals collect_schedule over the matching iter_* engine, but the metric
+    totals are reduced from the arrays instead of accumulated per event.
+    """
+    np = kernels.np
+    arrival, burst = kernels.as_array(task_set.arrival), kernels.as_array(task_set.burst)
+    order, start, finish = kernel(arrival, burst)
+    
+    start_by_index = np.empty_like(start)
+    start_by_index[order] = start
+    finish_by_index = np.empty_like(finish)
+    finish_by_index[order] = finish
+    
+    metrics = MetricsAccumulator()
+    metrics.busy_time = metrics.core_busy_time[0] = int(burst.sum())
+    (metrics.completed, metrics.makespan,
+     metrics.total_waiting, metrics.total_turnaround) = kernels.completion_totals(arrival, burst, finish_by_index)
+    # Every task runs once, so each dispatch after the first is a switch
+    metrics.context_switches = len(order) - 1
+    metrics.last_task[0] = int(order[-1])
+    
+    start_time, finish_time = array('q', start_by_index.tobytes()), array('q', finish_by_index.tobytes())
+    result_tasks = ScheduleResult.from_columns(task_set, start_time, finish_time,
+                                               SingleExecutions(start_time, finish_time), metrics)
+    names = task_set.names
+    schedule = list(zip([names[i] for i in order.tolist()], start.tolist(), finish.tolist()))
+    return result_tasks, schedule
+
+def fcfs(tasks):
+    """First Come First Served Algorithm"""
+    task_set = TaskSet.from_tasks(tasks)
+    kernels = numpy_kernels() if len(task_set) >= NUMPY_MIN_TASKS else None
+    if kernels is not None:
+        return collect_kernel_schedule(task_set, kernels, kernels.fcfs_times)
+    return collect_schedule(task_set, iter_fcfs(task_set))
+
+def sjn(tasks):
+    """Shortest Job Next Algorithm"""
+    task_set = TaskSet.from_tasks(tasks)
+    kernels = numpy_kernels() if len(task_set) >= NUMPY_MIN_TASKS else None
+    if kernels is not None:
+        return collect_kernel_schedule(task_set, kernels, kernels.sjn_times)
+    return collect_schedule(task_set, iter_sjn(task_set))
+
+def rr(tasks, time_quantum):
+    """Round Robin Algorithm"""
+    task_set = TaskSet.from_tasks(tasks)
+    return collect_schedule(task_set, iter_rr(task_set, time_quantum))
+
+def rm(tasks, raw_ticks=False, horizon=None):
+    """Rate Monotonic Algorithm"""
+    task_set = TaskSet.from_tasks(tasks)
+    return collect_schedule(task_set, iter_rm(task_set, raw_ticks, horizon))
+
+def edf(tasks, raw_ticks=False, horizon=None):
+    """Earliest Deadline First Algorithm"""
+    task_set = TaskSet.from_tasks(tasks)
+    return collect_schedule(task_set, iter_edf(task_set, raw_ticks, horizon))
+
+# ------------------ METRICS ------------------
+class MetricsAccumulator:
+    """Running totals behind the scheduling metrics, updated one event at a time.
+    
+    Feeding it the Execution and Completion events of a run keeps busy time,
+    completion counts and waiting/turnaround sums current, so the metrics
+    can be read in O(1) at any point, including while the run is still
+    going. Once the run is over they equal calculate_metrics() on its result.
+    
+    A context switch is counted whenever a core runs a different task than
+    the one it ran last, whether or not it was idle in between. With several
+    cores, CPU utilization is the busy share of all of them, and the busy
+    share of each one is added as core_utilization.
+    """
+    def __init__(self, cores=1):
+        self.cores = cores
+        self.busy_time = 0
+        self.core_busy_time = [0] * cores
+        self.makespan = 0
+        self.completed = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.context_switches = 0
+        self.last_task = [None] * cores
+        
+    def add(self, event):
+        """Account for an Execution or Completion event"""
+        if type(event) is Execution:
+            core = event.core
+            self.busy_time += event.end - event.start
+            self.core_busy_time[core] += event.end - event.start
+            if event.task != self.last_task[core]:
+                if self.last_task[core] is not None:
+                    self.context_switches += 1
+                self.last_task[core] = event.task
+        else:
+            turnaround = event.finish - event.arrival
+            self.completed += 1
+            self.total_turnaround += turnaround
+            self.total_waiting += turnaround - event.burst
+            self.makespan = max(self.makespan, event.finish)
+            
+    def snapshot(self):
+        """Current metrics, in the same form as calculate_metrics()"""
+        metrics = {}
+        if self.completed > 0:
+            capacity = self.makespan * self.cores
+            metrics['cpu_utilization'] = (self.busy_time / capacity * 100) if capacity > 0 else 0
+            metrics['avg_waiting'] = self.total_waiting / self.completed
+            metrics['avg_turnaround'] = self.total_turnaround / self.completed
+        else:
+            metrics['cpu_utilization'] = 0
+            metrics['avg_waiting'] = 0
+            metrics['avg_turnaround'] = 0
+        metrics['context_switches'] = self.context_switches
+        if self.cores > 1:
+            metrics['core_utilization'] = [(busy / self.makespan * 100) if self.makespan > 0 else 0
+                                           for busy in self.core_busy_time]
+        return metrics
+
+def calculate_metrics(tasks):
+    if not tasks:
+        return {}
+    
+    # Results produced by the algorithms carry their metrics already
+    if isinstance(tasks, ScheduleResult):
+        return tasks.metrics.snapshot()
+    
+    metrics = {}
+    
+    # Calculate CPU utilization
+    if any(t.finish_time is not None for t in tasks):
+        total_time = max((t.finish_time or 0) for t in tasks)
+        cpu_time = sum((e[1] - e[0]) for t in tasks for e in t.executions)
+        metrics['cpu_utilization'] = (cpu_time / total_time * 100) if total_time > 0 else 0
+    else:
+        metrics['cpu_utilization'] = 0
+    
+    # Calculate average waiting and turnaround times
+    total_waiting = 0
+    total_turnaround = 0
+    completed_tasks = 0
+    
+    for task in tasks:
+        if task.finish_time is None:
+            continue
+        if isinstance(task, TaskView):
+            # Counts every job of a periodic task, as the MetricsAccumulator does
+            total_waiting += task.total_waiting_time
+            total_turnaround += task.total_turnaround_time
+            completed_tasks += task.jobs
+        else:
+            total_waiting += task.waiting_time
+            total_turnaround += task.turnaround_time
+            completed_tasks += 1
+    
+    if completed_tasks > 0:
+        metrics['avg_waiting'] = total_waiting / completed_tasks
+        metrics['avg_turnaround'] = total_turnaround / completed_tasks
+    else:
+        metrics['avg_waiting'] = 0
+        metrics['avg_turnaround'] = 0
+    
+    # Count context switches over all executions in time order
+    dispatches = sorted((start, i) for i, t in enumerate(tasks) for start, _ in t.executions)
+    metrics['context_switches'] = sum(1 for (_, a), (_, b) in zip(dispatches, dispatches[1:]) if a != b)
+    
+    return metrics
+
+# ------------------ SCHEDULE INDEX ------------------
+class ScheduleIndex:
+    """Sorted start/end index over a schedule for time-window queries.
+    
+    Entries must be added in order of start time, which is how the
+    algorithms emit them. Ends are stored as a running maximum, so both
+    columns are sorted and a window query is two binary searches, whatever
+    the length of the schedule.
+    """
+    def __init__(self, schedule=()):
+        self.schedule = []
+        self.starts = array('q')
+        self.ends = array('q')
+        self.extend(schedule)
+        
+    def append(self, entry):
+        """Add a (name, start, end) entry"""
+        _, start, end = entry[:3]
+        self.schedule.append(entry)
+        self.starts.append(start)
+        self.ends.append(max(end, self.ends[-1]) if self.ends else end)
+        
+    def extend(self, entries):
+        entries = list(entries)
+        previous_end = self.ends[-1] if self.ends else None
+        self.schedule.extend(entries)
+        self.starts.extend(entry[1] for entry in entries)
+        ends = (entry[2] for entry in entries)
+        if previous_end is not None:
+            ends = itertools.chain([previous_end], ends)
+            self.ends.extend(itertools.islice(itertools.accumulate(ends, max), 1, None))
+        else:
+            self.ends.extend(itertools.accumulate(ends, max))
+            
+    def end_time(self):
+        """Latest end time in the schedule, or 0 when it is empty"""
+        return self.ends[-1] if self.ends else 0
+        
+    def first_ending_after(self, time):
+        """Position of the first entry that ends after `time`"""
+        return bisect.bisect_right(self.ends, time)
+        
+    def window(self, start, end):
+        """Positions (first, last) of the entries overlapping [start, end)"""
+        first = self.first_ending_after(start)
+        last = bisect.bisect_left(self.starts, end, lo=first)
+        return first, max(first, last)
+        
+    def __len__(self):
+        return len(self.schedule)
+
+# ------------------ RESULT CACHE ------------------
+class ResultCache:
+    """LRU cache of algorithm runs, keyed by task set fingerprint and parameters.
+    
+    Only Round Robin depends on the time quantum, and only the periodic
+    algorithms on the release horizon, so runs of the other algorithms are
+    shared between requests that differ only in those. The core count and
+    mode are only part of the key for multi-core runs. With a directory,
+    entries are also pickled to disk and survive the process; the in-memory
+    LRU is consulted first. Cached results are shared between callers and
+    must be treated as read-only.
+    """
+    # Bump when the algorithms or the result format change, so entries
+    # written by an older version on disk are no longer found
+    VERSION = 4
+    
+    def __init__(self, max_entries=32, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+    def key(self, algorithm, tasks, time_quantum=None, horizon=None, cores=1, partitioned=False):
+        """Cache key of a run; tasks must be a TaskSet"""
+        if algorithm != "Round Robin":
+            time_quantum = None
+        text = f"{self.VERSION}\0{tasks.fingerprint()}\0{algorithm}\0{time_quantum}"
+        if horizon is not None and algorithm in PERIODIC_ALGORITHMS:
+            text += f"\0{horizon}"
+        if cores > 1:
+            text += f"\0{cores}\0{'partitioned' if partitioned else 'global'}"
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+        
+    def path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+        
+    def get(self, key):
+        """Return the cached (result, schedule) for a key, or None"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+                
+        if self.directory:
+            try:
+                with open(self.path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                self.put(key, value, persist=False)
+                with self.lock:
+                    self.hits += 1
+                return value
+                
+        with self.lock:
+            self.misses += 1
+        return None
+        
+    def put(self, key, value, persist=True):
+        """Store a (result, schedule) pair under a key"""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                
+        if self.directory and persist:
+            # Write to a temporary file first so readers never see a partial entry
+            temp_path = f"{self.path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.path(key))
+            except OSError as e:
+                print(f"Could not write cache entry: {e}")
+                
+    def run(self, algorithm, tasks, time_quantum=None, horizon=None, cores=1, partitioned=False):
+        """run_scheduler through the cache"""
+        tasks = TaskSet.from_tasks(tasks)
+        key = self.key(algorithm, tasks, time_quantum, horizon, cores, partitioned)
+        value = self.get(key)
+        if value is None:
+            value = run_scheduler(algorithm, tasks, time_quantum, horizon, cores, partitioned)
+            self.put(key, value)
+        return value
+        
+    def clear(self):
+        """Drop the in-memory entries; the disk store is left alone"""
+        with self.lock:
+            self.entries.clear()
+            
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+# ------------------ MULTITHREADED EXECUTION ------------------
+# Display names of the supported algorithms, as accepted by run_scheduler
+ALGORITHMS = ["FCFS", "SJN", "Round Robin", "Rate Monotonic", "EDF"]
+
+# Algorithms that can release periodic jobs up to a horizon
+PERIODIC_ALGORITHMS = ("Rate Monotonic", "EDF")
+
+# Short command line names for the algorithms
+ALGORITHM_ALIASES = {
+    "fcfs": "FCFS",
+    "sjn": "SJN",
+    "rr": "Round Robin",
+    "rm": "Rate Monotonic",
+    "edf": "EDF",
+}
+
+def parse_algorithms(text):
+    """Parse a comma-separated list of algorithm names or aliases.
+    
+    Meant as an argparse type, so an unknown name raises
+    argparse.ArgumentTypeError; argparse is imported only then, as the
+    command line front ends are its only users.
+    """
+    algorithms = []
+    for name in text.split(','):
+        name = name.strip()
+        algorithm = ALGORITHM_ALIASES.get(name.lower(), name)
+        if algorithm not in ALGORITHMS:
+            from argparse import ArgumentTypeError
+            raise ArgumentTypeError(f"unknown algorithm: {name}")
+        algorithms.append(algorithm)
+    return algorithms
+
+def run_scheduler(algorithm, tasks, time_quantum=None, horizon=None, cores=1, partitioned=False):
+    """Run a scheduling algorithm by its display name.
+    
+    The time quantum only applies to Round Robin, and the periodic release
+    horizon (see periodic_releases) only to PERIODIC_ALGORITHMS. With more
+    than one core the algorithm runs globally (see iter_global) or, if
+    partitioned, on each core separately (see iter_partitioned).
+    Round Robin raises ValueError without a positive time quantum.
+    """
+    if algorithm == "Round Robin":
+        check_quantum(time_quantum)
+    if cores > 1:
+        task_set = TaskSet.from_tasks(tasks)
+        return collect_schedule(task_set, iter_schedule(task_set, algorithm, time_quantum, horizon,
+                                                        cores, partitioned), cores=cores)
+    if algorithm == "FCFS":
+        return fcfs(tasks)
+    elif algorithm == "SJN":
+        return sjn(tasks)
+    elif algorithm == "Round Robin":
+        return rr(tasks, time_quantum)
+    elif algorithm == "Rate Monotonic":
+        return rm(tasks, horizon=horizon)
+    elif algorithm == "EDF":
+        return edf(tasks, horizon=horizon)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+# Progress of a scheduling job: simulated time reached and jobs completed out of total
+Progress = namedtuple('Progress', ['time', 'completed', 'total'])
+
+class SchedulingThread(threading.Thread):
+    """Thread class for running scheduling algorithms without blocking UI
+    
+    Every PROGRESS_INTERVAL events the job publishes its Progress, to the
+    progress attribute and to the optional on_progress callback (which is
+    called on this thread), and checks whether cancel() was called. A
+    cancelled job stops there and leaves the partial result, covering the
+    schedule up to that point, in result with cancelled set.
+    
+    With an interval_queue (a queue.Queue), the schedule intervals
+    scheduled since the previous progress report are put on it as a list at
+    every report, so a consumer can follow the schedule while it is built.
+    The lists share their intervals with the final schedule.
+    
+    With a ResultCache, a run already in the cache is not recomputed, and
+    completed runs are added to it; partial results never are.
+    
+    With an analyzer, a function of the TaskSet such as a schedulability
+    test, it is called on this thread before the simulation starts and its
+    return value is stored in analysis, keeping slow analyses off the
+    caller's thread.
+    """
+    PROGRESS_INTERVAL = 1024
+    
+    def __init__(self, algorithm, tasks, time_quantum=None, cache=None, on_progress=None,
+                 interval_queue=None, horizon=None, cores=1, partitioned=False, analyzer=None):
+        super().__init__(daemon=True)
+        self.algorithm = algorithm
+        self.tasks = tasks
+        self.time_quantum = time_quantum
+        self.horizon = horizon if algorithm in PERIODIC_ALGORITHMS else None
+        self.cores = cores
+        self.partitioned = partitioned
+        self.cache = cache
+        self.on_progress = on_progress
+        self.interval_queue = interval_queue
+        self.analyzer = analyzer
+        self.analysis = None
+        self.schedule = []
+        self.published = 0
+        self.result = None
+        self.progress = Progress(0, 0, 0)
+        self.cancel_requested = threading.Event()
+        self.cancelled = False
+        
+    def cancel(self):
+        """Ask the job to stop at its next progress check"""
+        self.cancel_requested.set()
+        
+    def publish(self):
+        """Put the intervals scheduled since the last call on interval_queue"""
+        if self.interval_queue is not None and len(self.schedule) > self.published:
+            self.interval_queue.put(self.schedule[self.published:])
+            self.published = len(self.schedule)
+            
+    def report(self, progress):
+        self.publish()
+        self.progress = progress
+        if self.on_progress is not None:
+            self.on_progress(progress)
+            
+    def monitor(self, events, total):
+        """Pass events through, reporting progress and stopping once cancelled"""
+        time = completed = 0
+        countdown = self.PROGRESS_INTERVAL
+        for event in events:
+            yield event
+            time = event_time(event)
+            if type(event) is Completion:
+                completed += 1
+            countdown -= 1
+            if not countdown:
+                countdown = self.PROGRESS_INTERVAL
+                self.report(Progress(time, completed, total))
+                if self.cancel_requested.is_set():
+                    self.cancelled = True
+                    return
+        self.report(Progress(time, completed, total))
+        
+    def run(self):
+        try:
+            task_set = TaskSet.from_tasks(self.tasks)
+            if self.horizon is None:
+                total = len(task_set)
+            else:
+                total = periodic_job_count(task_set, self.horizon)
+            self.report(Progress(0, 0, total))
+            if self.analyzer is not None:
+                self.analysis = self.analyzer(task_set)
+                
+            key = None
+            if self.cache is not None:
+                key = self.cache.key(self.algorithm, task_set, self.time_quantum, self.horizon,
+                                     self.cores, self.partitioned)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    self.result = cached
+                    self.schedule = cached[1]
+                    self.report(Progress(cached[0].metrics.makespan, cached[0].metrics.completed, total))
+                    return
+                    
+            events = iter_schedule(task_set, self.algorithm, self.time_quantum, self.horizon,
+                                   self.cores, self.partitioned)
+            self.result = collect_schedule(task_set, self.monitor(events, total), self.schedule, self.cores)
+            if key is not None and not self.cancelled:
+                self.cache.put(key, self.result)
+        except Exception as e:
+            print(f"Error in scheduling thread: {e}")
+            self.result = None
+
+class InlineExecutor:
+    """Executor that runs submitted work immediately in the calling thread"""
+    def __init__(self, max_workers=None):
+        pass
+        
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+        
+    def shutdown(self, wait=True):
+        pass
+
+# Executor backends available to ExecutorJob subclasses
+EXECUTOR_BACKENDS = ("thread", "process", "inline")
+
+def create_executor(backend, max_workers=None):
+    """Create an executor for one of EXECUTOR_BACKENDS.
+    
+    concurrent.futures is imported on first use; it accounts for most of
+    this module's import time otherwise.
+    """
+    if backend == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(max_workers=max_workers)
+    elif backend == "process":
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=max_workers)
+    elif backend == "inline":
+        return InlineExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor backend: {backend}")
+
+class ExecutorJob:
+    """Calls run on an executor backend, polled from the UI loop until done.
+    
+    Subclasses start their work with submit() and turn the finished futures
+    into results in collect(), which check_progress() calls once every
+    future is done. Futures are kept as (tag, future) pairs, the tag telling
+    collect() what a future computed.
+    """
+    def __init__(self, backend):
+        if backend not in EXECUTOR_BACKENDS:
+            raise ValueError(f"Unknown executor backend: {backend}")
+        self.backend = backend
+        self.running = False
+        self.futures = []
+        self.is_complete = False
+        
+    def submit(self, calls, max_workers=None):
+        """Start a new run of (tag, function, *args) calls, each on one worker"""
+        self.running = True
+        self.is_complete = False
+        self.futures = []
+        # With no calls, the next check_progress completes the job
+        if calls:
+            executor = create_executor(self.backend, max_workers=max_workers)
+            for tag, function, *args in calls:
+                self.futures.append((tag, executor.submit(function, *args)))
+            # Pending work still runs to completion; this only releases the workers afterwards
+            executor.shutdown(wait=False)
+            
+    def progress(self):
+        """Fraction of the calls completed"""
+        if not self.futures:
+            return 0.0
+        return sum(future.done() for _, future in self.futures) / len(self.futures)
+        
+    def check_progress(self):
+        """Check if every call has completed, collecting the results once they have"""
+        if not self.running:
+            return False
+            
+        if all(future.done() for _, future in self.futures):
+            self.collect()
+            self.running = False
+            self.is_complete = True
+            
+        return self.is_complete
+        
+    def collect(self):
+        """Build the results from the finished futures"""
+        raise NotImplementedError
+        
+    def wait(self):
+        """Block until every call has completed and return the results"""
+        for _, future in self.futures:
+            future.exception()
+        self.check_progress()
+        return self.results
+        
+    def get_results(self):
+        """Get the results"""
+        return self.results
+
+class AlgorithmComparer(ExecutorJob):
+    """Class to manage comparison of multiple scheduling algorithms
+    
+    The backend selects how the algorithms are executed: "thread" runs them
+    on a thread pool, "process" on a process pool (so CPU-bound runs use all
+    cores), and "inline" runs them synchronously in start_comparison. With
+    a ResultCache, cached runs are taken from it without starting any
+    worker, and new runs are added to it as they complete.
+    """
+    def __init__(self, backend="thread", cache=None):
+        super().__init__(backend)
+        self.cache = cache
+        self.results = {}
+        self.cache_keys = {}
+        
+    def start_comparison(self, tasks, algorithms, time_quantum=None, horizon=None, cores=1, partitioned=False):
+        """Start comparing multiple algorithms with the same task set.
+        
+        The periodic release horizon applies to PERIODIC_ALGORITHMS only;
+        the core count and mode to every algorithm.
+        """
+        # One shared, read-only task set for every algorithm
+        tasks = TaskSet.from_tasks(tasks)
+        
+        self.results = {}
+        self.cache_keys = {}
+        
+        pending = []
+        for algo in algorithms:
+            quantum = time_quantum if algo == "Round Robin" else None
+            algo_horizon = horizon if algo in PERIODIC_ALGORITHMS else None
+            if self.cache is not None:
+                key = self.cache_keys[algo] = self.cache.key(algo, tasks, quantum, algo_horizon,
+                                                             cores, partitioned)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    self.results[algo] = cached
+                    continue
+            pending.append((algo, quantum, algo_horizon))
+            
+        self.submit([(algo, run_scheduler, algo, tasks, quantum, algo_horizon, cores, partitioned)
+                     for algo, quantum, algo_horizon in pending], max_workers=len(pending))
+        
+    def check_progress(self):
+        """Check if all algorithms have completed, keeping each result as soon as it is ready"""
+        if self.running:
+            for algo, future in self.futures:
+                if future.done() and algo not in self.results and future.exception() is None:
+                    self.results[algo] = future.result()
+                    if self.cache is not None:
+                        self.cache.put(self.cache_keys[algo], self.results[algo])
+        return super().check_progress()
+        
+    def collect(self):
+        for algo, future in self.futures:
+            if future.exception() is not None:
+                print(f"Error running {algo}: {future.exception()}")
+
+# ------------------ QUANTUM SWEEP ------------------
+def evaluate_rr_quanta(tasks, quanta):
+    """Round Robin metrics for each time quantum, in order.
+    
+    Only the metrics are accumulated; no schedule is materialised. The
+    arrival order of the task set is computed by the first run and reused
+    by the others.
+    """
+    tasks = TaskSet.from_tasks(tasks)
+    curve = []
+    for quantum in quanta:
+        metrics = MetricsAccumulator()
+        for event in iter_rr(tasks, quantum):
+            metrics.add(event)
+        curve.append(metrics.snapshot())
+    return curve
+
+class QuantumSweep(ExecutorJob):
+    """Evaluate Round Robin over a range or list of time quanta.
+    
+    The quanta are dealt out round-robin into one chunk per worker, so that
+    cheap (large) and expensive (small) quanta are spread evenly, and each
+    chunk is evaluated by evaluate_rr_quanta on an executor backend, as with
+    AlgorithmComparer. The task set is shipped to a worker once per chunk.
+    Results are a metrics curve of (quantum, metrics) pairs in the order the
+    quanta were given; progress is polled with check_progress.
+    """
+    def __init__(self, backend="process"):
+        super().__init__(backend)
+        self.quanta = []
+        self.results = []
+        
+    def start(self, tasks, quanta, max_workers=None):
+        """Start evaluating every quantum in `quanta`"""
+        quanta = list(quanta)
+        for quantum in quanta:
+            if not isinstance(quantum, int) or quantum <= 0:
+                raise ValueError(f"Time quanta must be positive integers, got {quantum!r}")
+        tasks = TaskSet.from_tasks(tasks)
+        
+        self.quanta = quanta
+        self.results = []
+        
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(quanta)))
+        chunks = [quanta[worker::workers] for worker in range(workers)]
+        self.submit([(chunk, evaluate_rr_quanta, tasks, chunk) for chunk in chunks if chunk], workers)
+        
+    def collect(self):
+        """Merge the chunks into a metrics curve of (quantum, metrics) pairs"""
+        by_quantum = {}
+        for chunk, future in self.futures:
+            if future.exception() is not None:
+                print(f"Error in quantum sweep: {future.exception()}")
+            else:
+                by_quantum.update(zip(chunk, future.result()))
+        self.results = [(quantum, by_quantum[quantum]) for quantum in self.quanta if quantum in by_quantum]
+
+def sweep_rr(tasks, quanta, backend="process", max_workers=None):
+    """Evaluate Round Robin for every quantum in a range or list of quanta.
+    
+    Returns a list of (quantum, metrics) pairs, where metrics include the
+    average waiting and turnaround times and the number of context switches.
+    """
+    sweep = QuantumSweep(backend)
+    sweep.start(tasks, quanta, max_workers)
+    return sweep.wait()
@@ -0,0 +1,199 @@
+# SchedulingExperiment.py
+# ======================
+# Monte Carlo experiments: runs every scheduling algorithm on many random
+# workloads in parallel and summarises each metric with its mean and
+# confidence interval.
+#
+# Usage: python -m SchedulingExperiment [--trials 1000] [--size 50] [--seed 1]
+#        python -m SchedulingExperiment --distribution bimodal --load 0.7 -f csv
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import statistics
+import sys
+from collections import namedtuple
+
+from SchedulingCore import (
+    ALGORITHMS, EXECUTOR_BACKENDS, ExecutorJob, MetricsAccumulator, iter_schedule, parse_algorithms
+)
+from WorkloadLoader import BURST_DISTRIBUTIONS, generate_workload
+
+# Metrics sampled in every trial
+EXPERIMENT_METRICS = ["avg_waiting", "avg_turnaround", "cpu_utilization"]
+
+# Random workloads to draw: `size` tasks with bursts from `distribution` at
+# an offered load of `load`, as made by WorkloadLoader.generate_workload
+Workload = namedtuple('Workload', ['size', 'distribution', 'load'])
+
+# Summary of a metric's samples, with a 95% confidence interval for the mean
+Summary = namedtuple('Summary', ['mean', 'stdev', 'low', 'high', 'samples'])
+
+# Two-sided 95% critical values of Student's t distribution by degrees of
+# freedom; past the table the normal value is close enough
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+Z_CRITICAL_95 = 1.960
+
+def trial_seed(seed, trial):
+    """Workload seed of one trial, derived from the experiment seed alone.
+
+    Trials can therefore run on any worker, in any order, and a trial can
+    be reproduced on its own.
+    """
+    digest = hashlib.sha256(f"{seed}\0{trial}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+def run_trials(algorithms, workload, seeds, time_quantum=1, cores=1, partitioned=False):
+    """Metrics of every algorithm on the workload drawn from each seed.
+
+    Returns one {algorithm: {metric: value}} dict per seed. Only the
+    metrics are accumulated; no schedule is materialised.
+    """
+    results = []
+    for seed in seeds:
+        tasks = generate_workload(workload.size, workload.distribution, workload.load, seed)
+        trial = {}
+        for algorithm in algorithms:
+            metrics = MetricsAccumulator(cores)
+            for event in iter_schedule(tasks, algorithm, time_quantum, None, cores, partitioned):
+                metrics.add(event)
+            snapshot = metrics.snapshot()
+            trial[algorithm] = {metric: snapshot[metric] for metric in EXPERIMENT_METRICS}
+        results.append(trial)
+    return results
+
+def summarize(values):
+    """Summary of a list of samples; the interval is empty for fewer than two"""
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return Summary(mean, 0.0, mean, mean, len(values))
+    stdev = statistics.stdev(values)
+    degrees = len(values) - 1
+    critical = T_CRITICAL_95[degrees - 1] if degrees <= len(T_CRITICAL_95) else Z_CRITICAL_95
+    margin = critical * stdev / math.sqrt(len(values))
+    return Summary(mean, stdev, mean - margin, mean + margin, len(values))
+
+class MonteCarloExperiment(ExecutorJob):
+    """Run every algorithm on `trials` random workloads across a process pool.
+
+    Trial i draws its workload from trial_seed(seed, i), so results depend
+    only on the seed and not on the backend, worker count or completion
+    order. Trials are split into a few contiguous chunks per worker, and
+    workers generate their own workloads, so only seeds and metrics cross
+    process boundaries. Progress is polled with check_progress.
+
+    Results map each algorithm to {metric: [sample per trial]} in trial
+    order; summaries() reduces them to a Summary per metric.
+    """
+    # Chunks per worker, trading scheduling overhead against load balance
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, backend="process"):
+        super().__init__(backend)
+        self.algorithms = []
+        self.results = {}
+
+    def start(self, algorithms, workload, trials, seed=0, time_quantum=1, cores=1, partitioned=False,
+              max_workers=None):
+        """Start running `trials` trials of the algorithms on random workloads"""
+        if trials <= 0:
+            raise ValueError(f"Trials must be positive, got {trials!r}")
+        if workload.distribution not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution: {workload.distribution}")
+
+        self.algorithms = list(algorithms)
+        self.results = {}
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, trials))
+        chunk_size = math.ceil(trials / (workers * self.CHUNKS_PER_WORKER))
+        calls = []
+        for first in range(0, trials, chunk_size):
+            seeds = [trial_seed(seed, trial) for trial in range(first, min(first + chunk_size, trials))]
+            calls.append((first, run_trials, self.algorithms, workload, seeds, time_quantum, cores, partitioned))
+        self.submit(calls, workers)
+
+    def collect(self):
+        """Gather the samples as {algorithm: {metric: [value per trial]}}, in trial order"""
+        self.results = {algorithm: {metric: [] for metric in EXPERIMENT_METRICS}
+                        for algorithm in self.algorithms}
+        for _, future in self.futures:
+            if future.exception() is not None:
+                print(f"Error in Monte Carlo experiment: {future.exception()}")
+                continue
+            for trial in future.result():
+                for algorithm, metrics in trial.items():
+                    for metric, value in metrics.items():
+                        self.results[algorithm][metric].append(value)
+
+    def summaries(self):
+        """Summary of every metric of every algorithm with samples"""
+        return {algorithm: {metric: summarize(values) for metric, values in samples.items() if values}
+                for algorithm, samples in self.results.items()}
+
+def run_experiment(algorithms, workload, trials, seed=0, time_quantum=1, cores=1, partitioned=False,
+                   backend="process", max_workers=None):
+    """Run a Monte Carlo experiment to completion; returns the finished MonteCarloExperiment"""
+    experiment = MonteCarloExperiment(backend)
+    experiment.start(algorithms, workload, trials, seed, time_quantum, cores, partitioned, max_workers)
+    experiment.wait()
+    return experiment
+
+def write_summaries(summaries, output_format, out):
+    """Write {algorithm: {metric: Summary}} as JSON or CSV"""
+    if output_format == "json":
+        json.dump({algorithm: {metric: summary._asdict() for metric, summary in metrics.items()}
+                   for algorithm, metrics in summaries.items()}, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.writer(out)
+        writer.writerow(["algorithm", "metric"] + list(Summary._fields))
+        for algorithm, metrics in summaries.items():
+            for metric, summary in metrics.items():
+                writer.writerow([algorithm, metric] + list(summary))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m SchedulingExperiment",
+        description="Run the scheduling algorithms on many random workloads and summarise their metrics."
+    )
+    parser.add_argument("-a", "--algorithms", type=parse_algorithms, default=ALGORITHMS,
+                        help="comma-separated algorithms: fcfs, sjn, rr, rm, edf (default: all)")
+    parser.add_argument("-n", "--trials", type=int, default=1000, help="random workloads to run (default: 1000)")
+    parser.add_argument("--size", type=int, default=50, help="tasks per workload (default: 50)")
+    parser.add_argument("--distribution", choices=list(BURST_DISTRIBUTIONS), default="uniform",
+                        help="burst time distribution (default: uniform)")
+    parser.add_argument("--load", type=float, default=0.9, help="offered load (default: 0.9)")
+    parser.add_argument("--seed", type=int, default=0, help="experiment random seed (default: 0)")
+    parser.add_argument("-q", "--time-quantum", type=int, default=1,
+                        help="time quantum for Round Robin (default: 1)")
+    parser.add_argument("-c", "--cores", type=int, default=1, help="number of cores (default: 1)")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="with several cores, assign every task to one core")
+    parser.add_argument("--backend", choices=EXECUTOR_BACKENDS, default="process",
+                        help="how trials run in parallel (default: process)")
+    parser.add_argument("-j", "--workers", type=int, help="parallel workers (default: one per CPU)")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json",
+                        help="output format (default: json)")
+    args = parser.parse_args(argv)
+
+    for name in ("trials", "size", "time_quantum", "cores"):
+        if getattr(args, name) <= 0:
+            parser.error(f"{name.replace('_', ' ')} must be positive")
+    if args.load <= 0:
+        parser.error("load must be positive")
+
+    experiment = run_experiment(args.algorithms, Workload(args.size, args.distribution, args.load),
+                                args.trials, args.seed, args.time_quantum, args.cores, args.partitioned,
+                                args.backend, args.workers)
+    write_summaries(experiment.summaries(), args.format, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
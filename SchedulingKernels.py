@@ -0,0 +1,100 @@
+# SchedulingKernels.py
+# ======================
+# NumPy kernels for the non-preemptive algorithms and the metric reductions.
+# NumPy is optional: SchedulingCore only imports this module through
+# numpy_kernels() and runs its pure-Python reference implementations when
+# the import fails.
+
+import heapq
+
+import numpy as np
+
+def as_array(column):
+    """Zero-copy int64 view of an array('q') column"""
+    return np.frombuffer(column, dtype=np.int64)
+
+def by_arrival(arrival, burst):
+    """(order, arrival, burst) sorted by arrival, ties in input order.
+    
+    Traces are usually in arrival order already; an O(n) check then skips
+    the stable sort, which dominates the kernels on unsorted input.
+    """
+    if (arrival[1:] >= arrival[:-1]).all():
+        return np.arange(len(arrival)), arrival, burst
+    order = np.argsort(arrival, kind='stable')
+    return order, arrival[order], burst[order]
+
+def fcfs_times(arrival, burst):
+    """First Come First Served as arrays: (order, start, finish) in execution order.
+
+    order[k] is the index of the k-th task to run. Each task finishes at
+    max(previous finish, arrival) + burst, which unrolls to the cumulative
+    burst C_k plus the running maximum of arrival_j - C_(j-1) over the tasks
+    run so far, so the schedule is a sort by arrival (skipped when already
+    sorted), one cumulative sum and one running maximum.
+    """
+    order, arrival, burst = by_arrival(arrival, burst)
+    work = np.cumsum(burst)
+    finish = work + np.maximum.accumulate(arrival - (work - burst))
+    return order, finish - burst, finish
+
+def sjn_times(arrival, burst):
+    """Shortest Job Next as arrays: (order, start, finish) in execution order.
+
+    Which task runs next depends on what has arrived by then, so SJN is no
+    prefix sum; but every work-conserving schedule has the same busy
+    periods, which FCFS gives. A busy period of a single task runs it on
+    arrival, vectorised; the others are simulated with a ready heap keyed
+    on (burst, admission order), admitting tasks that arrive together in
+    input order, exactly as SchedulingCore.iter_sjn does.
+    """
+    arrival_order, arrival, burst = by_arrival(arrival, burst)
+    work = np.cumsum(burst)
+    fcfs_finish = work + np.maximum.accumulate(arrival - (work - burst))
+
+    # A busy period starts with every task arriving after all earlier work is done
+    period_starts = np.flatnonzero(np.concatenate(([True], arrival[1:] > fcfs_finish[:-1])))
+    period_sizes = np.diff(np.append(period_starts, len(arrival)))
+
+    order = arrival_order.copy()
+    start = arrival.copy()
+    finish = arrival + burst
+
+    busy = period_sizes > 1
+    if busy.any():
+        arrival_list, burst_list, index_list = arrival.tolist(), burst.tolist(), arrival_order.tolist()
+        for first, size in zip(period_starts[busy].tolist(), period_sizes[busy].tolist()):
+            end = first + size
+            time = arrival_list[first]
+            pending = first
+            ready = []
+            admitted = 0
+            for slot in range(first, end):
+                # Admit the tasks that have arrived by now, in input order
+                batch_end = pending
+                while batch_end < end and arrival_list[batch_end] <= time:
+                    batch_end += 1
+                for position in sorted(range(pending, batch_end), key=index_list.__getitem__):
+                    heapq.heappush(ready, (burst_list[position], admitted, position))
+                    admitted += 1
+                pending = batch_end
+
+                position = heapq.heappop(ready)[2]
+                order[slot] = index_list[position]
+                start[slot] = time
+                time += burst_list[position]
+                finish[slot] = time
+    return order, start, finish
+
+def completion_totals(arrival, burst, finish):
+    """Totals over the finished tasks, those with finish >= 0.
+
+    Returns (completed, makespan, total waiting, total turnaround) as
+    Python ints, so metrics derived from them match the pure-Python ones.
+    """
+    done = finish >= 0
+    finish, turnaround = finish[done], finish[done] - arrival[done]
+    if not len(finish):
+        return 0, 0, 0, 0
+    total_turnaround = int(turnaround.sum())
+    return len(finish), int(finish.max()), total_turnaround - int(burst[done].sum()), total_turnaround
@@ -4,24 +4,45 @@
 
 import pygame
 import sys
-import threading
 import time
 import re
 import math
 import queue
-from copy import deepcopy
+import statistics
+from collections import OrderedDict
+
+from SchedulingCore import (
+    ALGORITHMS, UNSET, TaskSet, ScheduleResult, ScheduleIndex, calculate_metrics,
+    ResultCache, SchedulingThread, AlgorithmComparer, QuantumSweep, HYPERPERIOD, PERIODIC_ALGORITHMS
+)
+from SchedulingAnalysis import analyze, summary
+from SchedulingExperiment import MonteCarloExperiment, Workload
 
 # ------------------ PYGAME SETUP ------------------
-pygame.init()
-screen = pygame.display.set_mode((1600, 900))
-pygame.display.set_caption("CPU Scheduling Visualizer")
-clock = pygame.time.Clock()
+# The display and fonts are created by init_display(), so importing this
+# module does not open a window
+screen = None
+clock = None
 
 # Fonts
-title_font = pygame.font.SysFont('Arial', 36)
-heading_font = pygame.font.SysFont('Arial', 24)
-font = pygame.font.SysFont('Arial', 18)
-small_font = pygame.font.SysFont('Arial', 16)
+title_font = None
+heading_font = None
+font = None
+small_font = None
+
+def init_display():
+    """Initialise pygame, the main window and the fonts"""
+    global screen, clock, title_font, heading_font, font, small_font
+    
+    pygame.init()
+    screen = pygame.display.set_mode((1600, 900))
+    pygame.display.set_caption("CPU Scheduling Visualizer")
+    clock = pygame.time.Clock()
+    
+    title_font = pygame.font.SysFont('Arial', 36)
+    heading_font = pygame.font.SysFont('Arial', 24)
+    font = pygame.font.SysFont('Arial', 18)
+    small_font = pygame.font.SysFont('Arial', 16)
 
 # Colors
 BG_COLOR = (245, 242, 236)  # Light beige background
@@ -36,6 +57,7 @@ TABLE_HEADER = (76, 84, 98)  # Dark slate for table headers
 TABLE_ROW_1 = (108, 117, 125) # Darker gray for odd rows
 TABLE_ROW_2 = (122, 130, 136) # Lighter gray for even rows
 BORDER_COLOR = (200, 200, 200) # Light gray borders
+SUCCESS_COLOR = (34, 139, 34) # Forest green for passed checks
 CHART_COLORS = [
     (70, 130, 180),   # Steel Blue
     (106, 90, 205),   # Slate Blue
@@ -47,20 +69,91 @@ CHART_COLORS = [
     (152, 251, 152),  # Pale Green
 ]
 
-# ------------------ TASK CLASS ------------------
-class Task:
-    def __init__(self, name, arrival, burst, deadline=None, period=None):
-        self.name = name
-        self.arrival = arrival
-        self.burst = burst
-        self.remaining = burst
-        self.deadline = deadline
-        self.period = period
-        self.start_time = None
-        self.finish_time = None
-        self.executions = []
-        self.waiting_time = 0
-        self.turnaround_time = 0
+# ------------------ TEXT RENDERING ------------------
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces keyed by (font, text, color).
+    
+    Most strings on screen (titles, labels, table cells) are the same from
+    one frame to the next, so rendering them once and reusing the surface
+    removes most per-frame allocation. Cached surfaces are shared and must
+    only be blitted, never drawn on.
+    """
+    def __init__(self, max_size=2048):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+            
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+        
+    def stats(self):
+        """Hit/miss counters and current size of the cache"""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.surfaces)}
+        
+    def clear(self):
+        self.surfaces.clear()
+
+# Shared by every widget and chart
+text_cache = TextCache()
+
+def render_text(font, text, color):
+    """Render anti-aliased text, reusing a cached surface when possible"""
+    return text_cache.render(font, text, color)
+
+# ------------------ REDRAW TRACKING ------------------
+class DirtyRegions:
+    """Screen regions that have changed and must be repainted.
+    
+    Widgets mark their own rect when their appearance changes (hover,
+    input, a new result); the main loop repaints only those regions and
+    pushes them with pygame.display.update. Marking without a rect asks
+    for a full repaint.
+    """
+    def __init__(self):
+        self.rects = []
+        self.full = True
+        
+    def mark(self, rect=None):
+        if rect is None:
+            self.full = True
+            self.rects = []
+        elif not self.full:
+            self.rects.append(pygame.Rect(rect))
+            
+    def take(self):
+        """Return (full, rects) for the next frame and reset"""
+        full, rects = self.full, self.rects
+        self.full, self.rects = False, []
+        return full, rects
+
+# Shared by every widget and the main loop
+dirty = DirtyRegions()
+
+# Status bar along the bottom of the window
+STATUS_RECT = (0, 870, 1600, 30)
+
+# Progress bar of a running algorithm, below the Gantt chart
+PROGRESS_RECT = (320, 275, 1230, 70)
+
+# Most schedule intervals moved from a running algorithm to the Gantt chart per frame
+LIVE_INTERVALS_PER_FRAME = 20000
+
+# Random workloads run by the Monte Carlo button, and how many
+EXPERIMENT_WORKLOAD = Workload(size=20, distribution="exponential", load=0.9)
+EXPERIMENT_TRIALS = 200
 
 # ------------------ UI COMPONENTS ------------------
 class Button:
@@ -82,13 +175,16 @@ class Button:
         
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(screen, color, temp_rect, border_radius=5)
-        text_surf = font.render(self.text, True, self.text_color)
+        text_surf = render_text(font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=temp_rect.center)
         screen.blit(text_surf, text_rect)
         
     def check_hover(self, pos, y_offset=0):
         temp_rect = pygame.Rect(self.x, self.y + y_offset, self.width, self.height)
-        self.is_hovered = temp_rect.collidepoint(pos)
+        is_hovered = bool(temp_rect.collidepoint(pos))
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            dirty.mark(temp_rect)
         return self.is_hovered
         
     def is_clicked(self, pos, event, y_offset=0):
@@ -123,7 +219,7 @@ class Dropdown:
         # Draw main button
         pygame.draw.rect(screen, CARD_BG, self.rect, border_radius=5)
         pygame.draw.rect(screen, BORDER_COLOR, self.rect, width=1, border_radius=5)
-        text_surf = font.render(self.selected, True, TEXT_COLOR)
+        text_surf = render_text(font, self.selected, TEXT_COLOR)
         text_rect = text_surf.get_rect(midleft=(self.rect.left + 10, self.rect.centery))
         screen.blit(text_surf, text_rect)
         
@@ -151,14 +247,28 @@ class Dropdown:
                 bg_color = DROPDOWN_HOVER if i == self.hovered_index else DROPDOWN_BG
                 pygame.draw.rect(self.dropdown_surface, bg_color, rect, border_radius=5)
                 pygame.draw.rect(self.dropdown_surface, BORDER_COLOR, rect, width=1, border_radius=5)
-                option_text = font.render(self.options[i], True, TEXT_COLOR)
+                option_text = render_text(font, self.options[i], TEXT_COLOR)
                 option_rect = option_text.get_rect(midleft=(rect.left + 10, rect.centery))
                 self.dropdown_surface.blit(option_text, option_rect)
             
             # Blit the dropdown surface to the screen, ensuring it appears on top
             screen.blit(self.dropdown_surface, (self.x, self.y + self.height))
     
+    def list_rect(self):
+        """Screen area covered by the open option list, including its shadow"""
+        return pygame.Rect(self.x - 5, self.y + self.height - 5,
+                           self.width + 10, len(self.options) * self.height + 10)
+        
     def handle_event(self, event, pos):
+        was_active, was_hovered, was_selected = self.is_active, self.hovered_index, self.selected
+        result = self.process_event(event, pos)
+        if self.selected != was_selected:
+            dirty.mark(self.rect)
+        if self.is_active != was_active or (self.is_active and self.hovered_index != was_hovered):
+            dirty.mark(self.list_rect())
+        return result
+        
+    def process_event(self, event, pos):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(pos):
                 self.is_active = not self.is_active
@@ -209,7 +319,7 @@ class InputField:
         self.placeholder = placeholder
         self.active = False
         self.is_numeric = is_numeric
-        self.label_surface = font.render(label, True, TEXT_COLOR)
+        self.label_surface = render_text(font, label, TEXT_COLOR)
         self.label_rect = self.label_surface.get_rect(topleft=(x, y - 25))
         
     def draw(self, y_offset=0):
@@ -227,14 +337,21 @@ class InputField:
         
         # Draw text or placeholder
         if self.text:
-            text_surf = font.render(self.text, True, TEXT_COLOR)
+            text_surf = render_text(font, self.text, TEXT_COLOR)
         else:
-            text_surf = font.render(self.placeholder, True, BORDER_COLOR)
+            text_surf = render_text(font, self.placeholder, BORDER_COLOR)
             
         text_rect = text_surf.get_rect(midleft=(temp_rect.left + 10, temp_rect.centery))
         screen.blit(text_surf, text_rect)
         
     def handle_event(self, event, y_offset=0):
+        was_active, old_text = self.active, self.text
+        result = self.process_event(event, y_offset)
+        if self.active != was_active or self.text != old_text:
+            dirty.mark(pygame.Rect(self.x, self.y + y_offset, self.width, self.height))
+        return result
+        
+    def process_event(self, event, y_offset=0):
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Create a temporary rect with the current offset for collision detection
             temp_rect = pygame.Rect(self.x, self.y + y_offset, self.width, self.height)
@@ -254,7 +371,7 @@ class InputField:
         
         return self.text if not self.active and event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN else None
 
-# ------------------ SCHEDULING ALGORITHMS ------------------
+# ------------------ INPUT PARSING ------------------
 def parse_input_list(text):
     """Parse comma or space-separated values into a list of integers"""
     if not text.strip():
@@ -263,349 +380,484 @@ def parse_input_list(text):
     parts = re.split(r'[,\s]+', text.strip())
     return [int(p) for p in parts if p.isdigit()]
 
-def fcfs(tasks):
-    """First Come First Served Algorithm"""
-    result_tasks = deepcopy(tasks)
-    result_schedule = []
+def sweep_quanta(tasks, time_quantum, max_points=24):
+    """Time quanta for a Round Robin sweep: 1 up to the longest burst, plus time_quantum.
     
-    time = 0
-    for task in sorted(result_tasks, key=lambda t: t.arrival):
-        # Wait until task arrives if needed
-        time = max(time, task.arrival)
-        
-        # Set task start time if this is first execution
-        if task.start_time is None:
-            task.start_time = time
-            
-        task.waiting_time = time - task.arrival
-        task.finish_time = time + task.burst
-        task.turnaround_time = task.finish_time - task.arrival
-        
-        result_schedule.append((task.name, time, task.finish_time))
-        task.executions.append((time, task.finish_time))
-        
-        time += task.burst
-        
-    return result_tasks, result_schedule
+    Any quantum at least as long as the longest burst schedules like FCFS,
+    so larger ones are not worth evaluating. Long ranges are thinned to
+    about max_points evenly spaced quanta.
+    """
+    longest = max(max(tasks.burst, default=1), 1)
+    step = max(1, math.ceil(longest / max_points))
+    quanta = set(range(1, longest + 1, step))
+    quanta.update((longest, time_quantum))
+    return sorted(quanta)
 
-def sjn(tasks):
-    """Shortest Job Next Algorithm"""
-    result_tasks = deepcopy(tasks)
-    result_schedule = []
+# ------------------ DRAW ------------------
+class GanttChart:
+    """Zoomable Gantt chart rendered into an off-screen surface.
     
-    time = 0
-    ready = []
-    left = result_tasks.copy()
+    The chart shows the time window [view_start, view_end) of the schedule
+    and is rasterised only when the schedule or the window changes; every
+    other frame just blits the cached surface. Intervals are looked up in a
+    ScheduleIndex, so only those in the visible window are visited. Narrow
+    intervals are bucketed into the pixel columns they cover, and when the
+    window holds more intervals than there are pixel columns each column is
+    sampled from the index instead, so drawing costs depend on the chart
+    width rather than on the length of the schedule.
     
-    while left or ready:
-        # Move arrived tasks to ready queue
-        for t in left[:]:
-            if t.arrival <= time:
-                ready.append(t)
-                left.remove(t)
-                
-        if ready:
-            # Select task with shortest burst time
-            ready.sort(key=lambda x: x.burst)
-            t = ready.pop(0)
-            
-            # Set task start time if this is first execution
-            if t.start_time is None:
-                t.start_time = time
-                
-            t.waiting_time = time - t.arrival
-            t.finish_time = time + t.burst
-            t.turnaround_time = t.finish_time - t.arrival
-            
-            result_schedule.append((t.name, time, t.finish_time))
-            t.executions.append((time, t.finish_time))
-            
-            time += t.burst
-        else:
-            time += 1
-            
-    return result_tasks, result_schedule
-
-def rr(tasks, time_quantum):
-    """Round Robin Algorithm"""
-    result_tasks = deepcopy(tasks)
-    result_schedule = []
+    A multi-core schedule, whose entries carry their core as a fourth
+    field, is drawn as one lane per core, each with its own index.
+    """
+    # Blocks narrower than this (in pixels) are aggregated into columns
+    MIN_BLOCK_WIDTH = 3
     
-    time = 0
-    ready_queue = []
-    remaining_tasks = result_tasks.copy()
+    # Narrowest time window the chart can be zoomed into
+    MIN_SPAN = 1
     
-    while remaining_tasks or ready_queue:
-        # Move arrived tasks to ready queue
-        for task in remaining_tasks[:]:
-            if task.arrival <= time:
-                ready_queue.append(task)
-                remaining_tasks.remove(task)
-                
-        if ready_queue:
-            current_task = ready_queue.pop(0)
-            
-            # Set task start time if first execution
-            if current_task.start_time is None:
-                current_task.start_time = time
-                
-            # Determine execution time for this quantum
-            execution_time = min(time_quantum, current_task.remaining)
-            
-            # Execute for the quantum
-            start_time = time
-            time += execution_time
-            current_task.remaining -= execution_time
+    # Space around the bars for the time axis and its labels
+    MARGIN = 10
+    AXIS_HEIGHT = 40
+    
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.rect = pygame.Rect(x, y, width, height + self.AXIS_HEIGHT)
+        self.lanes = [ScheduleIndex()]
+        self.max_time = 0
+        self.view_start = 0
+        self.view_end = 0
+        self.dragging = False
+        self.surface = None
+        
+    def __len__(self):
+        return sum(len(lane) for lane in self.lanes)
+        
+    def set_schedule(self, schedule, max_time, cores=1):
+        """Replace the schedule shown, on `cores` lanes, and reset the view to all of it"""
+        self.lanes = [ScheduleIndex() for _ in range(cores)]
+        self.add_entries(schedule)
+        self.max_time = max_time
+        self.reset_view()
+        
+    def add_entries(self, entries):
+        """Append entries to the index of their lane"""
+        if len(self.lanes) == 1:
+            self.lanes[0].extend(entries)
+            return
+        by_lane = [[] for _ in self.lanes]
+        for entry in entries:
+            by_lane[entry[3]].append(entry)
+        for lane, lane_entries in zip(self.lanes, by_lane):
+            if lane_entries:
+                lane.extend(lane_entries)
+        
+    def extend(self, entries):
+        """Append entries to the end of the schedule shown.
+        
+        A view showing the end of the schedule follows it as it grows: the
+        whole schedule stays in view when it was, otherwise the window
+        slides along at the same zoom level.
+        """
+        following = self.view_end >= self.max_time
+        self.add_entries(entries)
+        self.max_time = max(lane.end_time() for lane in self.lanes)
+        if following and self.view_start <= 0:
+            self.set_view(0, self.max_time)
+        elif following:
+            span = self.view_end - self.view_start
+            self.set_view(self.max_time - span, self.max_time)
+        elif entries and min(entry[1] for entry in entries) < self.view_end:
+            self.invalidate()
             
-            # Record execution interval
-            result_schedule.append((current_task.name, start_time, time))
-            current_task.executions.append((start_time, time))
+    def reset_view(self):
+        self.set_view(0, self.max_time)
+        
+    def set_view(self, view_start, view_end):
+        """Show the time window [view_start, view_end), clamped to the schedule"""
+        span = min(max(view_end - view_start, self.MIN_SPAN), max(self.max_time, self.MIN_SPAN))
+        view_start = min(max(view_start, 0), max(self.max_time - span, 0))
+        if (view_start, view_start + span) != (self.view_start, self.view_end):
+            self.view_start, self.view_end = view_start, view_start + span
+            self.invalidate()
             
-            # Check if task is complete
-            if current_task.remaining <= 0:
-                current_task.finish_time = time
-                current_task.turnaround_time = current_task.finish_time - current_task.arrival
-                current_task.waiting_time = current_task.turnaround_time - current_task.burst
-            else:
-                # Put back in ready queue
-                ready_queue.append(current_task)
+    def invalidate(self):
+        """Re-render the chart on the next draw"""
+        self.surface = None
+        dirty.mark(pygame.Rect(self.x - self.MARGIN, self.y,
+                               self.width + 2 * self.MARGIN, self.height + self.AXIS_HEIGHT))
+        
+    def time_at(self, screen_x):
+        """Simulated time under a screen x coordinate"""
+        return self.view_start + (screen_x - self.x) * (self.view_end - self.view_start) / self.width
+        
+    def zoom(self, factor, screen_x):
+        """Scale the visible span by `factor`, keeping the time under screen_x in place"""
+        anchor = self.time_at(screen_x)
+        self.set_view(anchor - (anchor - self.view_start) * factor,
+                      anchor + (self.view_end - anchor) * factor)
+        
+    def pan(self, dx):
+        """Scroll the view by dx pixels"""
+        shift = dx * (self.view_end - self.view_start) / self.width
+        self.set_view(self.view_start - shift, self.view_end - shift)
+        
+    def draw(self):
+        if self.surface is None:
+            self.surface = self.render()
+        screen.blit(self.surface, (self.x - self.MARGIN, self.y))
+        
+    def render(self):
+        """Rasterise the visible window into a new surface"""
+        surface = pygame.Surface((self.width + 2 * self.MARGIN, self.height + self.AXIS_HEIGHT), pygame.SRCALPHA)
+        x, y, width, height = self.MARGIN, 0, self.width, self.height
+        view_start, view_end = self.view_start, self.view_end
+        
+        # Draw timeline axis
+        pygame.draw.line(surface, TEXT_COLOR, (x, y + height + 10), (x + width, y + height + 10), 2)
+        
+        # Draw time markers
+        span = view_end - view_start
+        unit_width = width / span if span > 0 else width
+        step = max(1, int(span // 10))
+        for t in range(math.ceil(view_start / step) * step, int(view_end) + 1, step):
+            marker_x = x + (t - view_start) * unit_width
+            pygame.draw.line(surface, TEXT_COLOR, (marker_x, y + height + 10), (marker_x, y + height + 15), 2)
+            time_text = render_text(small_font, str(t), TEXT_COLOR)
+            surface.blit(time_text, (marker_x - 5, y + height + 20))
+        
+        # Lanes share the chart height, with a gap between them while they are tall enough
+        lane_height = height / len(self.lanes)
+        gap = 2 if lane_height >= 8 else 0
+        for lane, index in enumerate(self.lanes):
+            self.render_lane(surface, index, x, y + round(lane * lane_height),
+                             max(1, round(lane_height) - gap), unit_width)
+        
+        return surface
+        
+    def render_lane(self, surface, index, x, y, height, unit_width):
+        """Draw the visible intervals of one lane's index into the surface"""
+        width = self.width
+        view_start, view_end = self.view_start, self.view_end
+        span = view_end - view_start
+        schedule = index.schedule
+        
+        # Color of the narrow intervals covering each pixel column
+        columns = [None] * (width + 1)
+        
+        first, last = index.window(view_start, view_end)
+        if last - first > width:
+            # More intervals than pixels: take the interval under each column
+            for column in range(width):
+                i = index.first_ending_after(view_start + column / unit_width)
+                if i < len(schedule) and index.starts[i] < view_start + (column + 1) / unit_width:
+                    columns[column] = CHART_COLORS[i % len(CHART_COLORS)]
         else:
-            # No tasks ready, advance time
-            time += 1
-            
-    return result_tasks, result_schedule
+            # Draw task executions
+            for i in range(first, last):
+                task_name, start, end = schedule[i][:3]
+                color = CHART_COLORS[i % len(CHART_COLORS)]
+                left = max(start - view_start, 0) * unit_width
+                right = min(end - view_start, span) * unit_width
+                block_x = x + left
+                block_width = right - left
+                
+                if block_width < self.MIN_BLOCK_WIDTH:
+                    # Too narrow to draw on its own, claim the pixel columns it covers
+                    first_column = min(int(left), width)
+                    last_column = min(max(first_column + 1, math.ceil(right)), width + 1)
+                    for column in range(first_column, last_column):
+                        if columns[column] is None:
+                            columns[column] = color
+                    continue
+                
+                # Draw execution block
+                pygame.draw.rect(surface, color, (block_x, y, block_width, height), border_radius=3)
+                pygame.draw.rect(surface, TEXT_COLOR, (block_x, y, block_width, height), width=1, border_radius=3)
+                
+                # Draw task name only if block is wide enough
+                name_text = render_text(small_font, task_name, (255, 255, 255))
+                name_rect = name_text.get_rect(center=(block_x + block_width/2, y + height/2))
+                
+                # Only draw text if there's enough space
+                if block_width > name_rect.width + 4 and height >= name_rect.height:
+                    surface.blit(name_text, name_rect)
+        
+        # Draw the aggregated columns, one rectangle per run of equal colors
+        run_start = 0
+        for column in range(1, len(columns) + 1):
+            if column == len(columns) or columns[column] != columns[run_start]:
+                if columns[run_start] is not None:
+                    pygame.draw.rect(surface, columns[run_start], (x + run_start, y, column - run_start, height))
+                run_start = column
+        
+    def handle_event(self, event, pos):
+        """Zoom with the mouse wheel, pan by dragging, reset with a right click.
+        
+        Returns True if a mouse wheel event was used for zooming.
+        """
+        if event.type == pygame.MOUSEWHEEL and self.rect.collidepoint(pos):
+            self.zoom(0.8 ** event.y, pos[0])
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(pos):
+            if event.button == 1:
+                self.dragging = True
+            elif event.button == 3:
+                self.reset_view()
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.pan(event.rel[0])
+        return False
+
+def format_time(value):
+    """A task's time for the results table; averages over periodic jobs get two decimals"""
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
 
-def rm(tasks):
-    """Rate Monotonic Algorithm"""
-    result_tasks = deepcopy(tasks)
-    result_schedule = []
+class ResultsTable:
+    """Scrollable per-task results table that draws only its visible rows.
+    
+    The order of the rows for each sort key is computed once per result,
+    as a list of task indices, and reused until the result changes; each
+    frame then looks up just the rows in the visible window, so scrolling
+    and re-sorting cost the same for ten tasks or a hundred thousand.
+    Clicking a header sorts by that column (clicking it again reverses the
+    order), the mouse wheel scrolls and the scrollbar can be clicked or
+    dragged to jump through the table.
+    """
+    # Column headers and the sort key of each column
+    COLUMNS = [
+        ("Job", "name"),
+        ("Arrival Time", "arrival"),
+        ("Burst Time", "burst"),
+        ("Finish Time", "finish"),
+        ("Turn Around Time", "turnaround"),
+        ("Waiting Time", "waiting"),
+    ]
+    
+    ROW_HEIGHT = 30
+    HEADER_HEIGHT = 40
+    SCROLLBAR_WIDTH = 8
+    SCROLLBAR_GAP = 4
     
-    time = 0
-    # Sort tasks by period (rate monotonic)
-    periodic_tasks = sorted(result_tasks, key=lambda x: x.period if x.period is not None else float('inf'))
+    # Rows moved per mouse wheel step
+    WHEEL_ROWS = 3
     
-    # Continue until all tasks have completed their execution
-    while any(x.remaining > 0 for x in periodic_tasks):
-        # Get tasks that have arrived and still need execution
-        ready = [x for x in periodic_tasks if x.arrival <= time and x.remaining > 0]
-        
-        if ready:
-            # Select highest priority task (lowest period)
-            t = ready[0]
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.rect = pygame.Rect(x, y, width + self.SCROLLBAR_GAP + self.SCROLLBAR_WIDTH, height)
+        self.scrollbar_rect = pygame.Rect(x + width + self.SCROLLBAR_GAP, y + self.HEADER_HEIGHT,
+                                          self.SCROLLBAR_WIDTH, height - self.HEADER_HEIGHT)
+        # One row is kept for the averages
+        self.visible_rows = (height - self.HEADER_HEIGHT) // self.ROW_HEIGHT - 1
+        self.set_tasks([])
+        
+    def set_tasks(self, tasks):
+        """Show a new result (a ScheduleResult or a list of tasks)"""
+        self.tasks = tasks
+        self.metrics = calculate_metrics(tasks) if len(tasks) else None
+        self.orders = {}
+        self.sort_key = "name"
+        self.descending = False
+        self.first_row = 0
+        self.dragging = False
+        dirty.mark(self.rect)
+        
+    def sort_values(self, key):
+        """Sort value of every task for one column; unfinished tasks sort last"""
+        tasks = self.tasks
+        # Times averaged over the jobs of periodic tasks come from their TaskViews
+        averaged = isinstance(tasks, ScheduleResult) and tasks.jobs is not None and key in ("turnaround", "waiting")
+        if isinstance(tasks, ScheduleResult) and not averaged:
+            task_set = tasks.task_set
+            if key == "name":
+                return task_set.names
+            if key in ("arrival", "burst"):
+                return getattr(task_set, key)
+            finish = tasks.finish_time
+            if key == "finish":
+                return [f if f != UNSET else math.inf for f in finish]
+            if key == "turnaround":
+                return [f - a if f != UNSET else math.inf for f, a in zip(finish, task_set.arrival)]
+            return [f - a - b if f != UNSET else math.inf
+                    for f, a, b in zip(finish, task_set.arrival, task_set.burst)]
+                    
+        if key in ("name", "arrival", "burst"):
+            return [getattr(task, key) for task in tasks]
+        attribute = {"finish": "finish_time", "turnaround": "turnaround_time", "waiting": "waiting_time"}[key]
+        return [getattr(task, attribute) if task.finish_time is not None else math.inf for task in tasks]
+        
+    def order(self):
+        """Task indices in ascending order of the current sort key, built once per key"""
+        order = self.orders.get(self.sort_key)
+        if order is None:
+            values = self.sort_values(self.sort_key)
+            order = sorted(range(len(values)), key=values.__getitem__)
+            self.orders[self.sort_key] = order
+        return order
+        
+    def max_first_row(self):
+        return max(0, len(self.tasks) - self.visible_rows)
+        
+    def scroll_to(self, first_row):
+        first_row = max(0, min(int(first_row), self.max_first_row()))
+        if first_row != self.first_row:
+            self.first_row = first_row
+            dirty.mark(self.rect)
             
-            # Set task start time if first execution
-            if t.start_time is None:
-                t.start_time = time
-                
-            # Execute for one time unit
-            start = time
-            t.remaining -= 1
-            time += 1
+    def sort_by(self, key):
+        """Sort by a column; sorting by the current column again reverses the order"""
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            self.sort_key = key
+            self.descending = False
+        self.first_row = 0
+        dirty.mark(self.rect)
+        
+    def scroll_to_bar(self, pos_y):
+        """Scroll so the scrollbar thumb is centred on a screen y position"""
+        track = self.scrollbar_rect
+        fraction = (pos_y - track.y) / track.height
+        self.scroll_to(fraction * len(self.tasks) - self.visible_rows / 2)
+        
+    def visible_tasks(self):
+        """(row, task) pairs for the rows in the visible window"""
+        order = self.order()
+        count = len(order)
+        for row in range(self.first_row, min(self.first_row + self.visible_rows, count)):
+            index = order[count - 1 - row] if self.descending else order[row]
+            yield row, self.tasks[index]
             
-            # Record execution
-            result_schedule.append((t.name, start, time))
-            t.executions.append((start, time))
+    def draw(self):
+        if not len(self.tasks):
+            return
             
-            # Check if task is complete
-            if t.remaining == 0:
-                t.finish_time = time
-                t.turnaround_time = t.finish_time - t.arrival
-                t.waiting_time = t.turnaround_time - t.burst
-        else:
-            # No tasks ready, advance time
-            time += 1
+        x, y, width = self.x, self.y, self.width
+        row_height, header_height = self.ROW_HEIGHT, self.HEADER_HEIGHT
+        col_width = width / len(self.COLUMNS)
+        
+        # Draw table headers, marking the sorted column
+        for i, (header, key) in enumerate(self.COLUMNS):
+            header_rect = pygame.Rect(x + i * col_width, y, col_width, header_height)
+            pygame.draw.rect(screen, TABLE_HEADER, header_rect)
+            pygame.draw.rect(screen, TEXT_COLOR, header_rect, width=1)
             
-    return result_tasks, result_schedule
-
-def edf(tasks):
-    """Earliest Deadline First Algorithm"""
-    result_tasks = deepcopy(tasks)
-    result_schedule = []
-    
-    time = 0
-    while any(x.remaining > 0 for x in result_tasks):
-        # Get tasks that have arrived and still need execution
-        ready = [x for x in result_tasks if x.arrival <= time and x.remaining > 0]
-        
-        if ready:
-            # Select task with earliest deadline
-            t = min(ready, key=lambda x: x.deadline if x.deadline is not None else float('inf'))
+            header_text = render_text(small_font, header, (255, 255, 255))
+            header_text_rect = header_text.get_rect(center=header_rect.center)
+            screen.blit(header_text, header_text_rect)
             
-            # Set task start time if first execution
-            if t.start_time is None:
-                t.start_time = time
+            if key == self.sort_key:
+                tip_x, mid_y = header_rect.right - 10, header_rect.bottom - 8
+                if self.descending:
+                    points = [(tip_x - 4, mid_y - 2), (tip_x + 4, mid_y - 2), (tip_x, mid_y + 2)]
+                else:
+                    points = [(tip_x - 4, mid_y + 2), (tip_x + 4, mid_y + 2), (tip_x, mid_y - 2)]
+                pygame.draw.polygon(screen, HEADING_COLOR, points)
+                
+        # Draw the rows in the visible window
+        drawn = 0
+        for row, task in self.visible_tasks():
+            row_y = y + header_height + drawn * row_height
+            row_color = TABLE_ROW_1 if row % 2 == 0 else TABLE_ROW_2
+            drawn += 1
             
-            # Execute for one time unit
-            start = time
-            t.remaining -= 1
-            time += 1
+            # Draw row background
+            row_rect = pygame.Rect(x, row_y, width, row_height)
+            pygame.draw.rect(screen, row_color, row_rect)
             
-            # Record execution
-            result_schedule.append((t.name, start, time))
-            t.executions.append((start, time))
+            # Task data
+            finished = task.finish_time is not None
+            values = [
+                task.name,
+                str(task.arrival),
+                str(task.burst),
+                str(task.finish_time if finished else "-"),
+                format_time(task.turnaround_time) if finished else "-",
+                format_time(task.waiting_time) if finished else "-"
+            ]
             
-            # Check if task is complete
-            if t.remaining == 0:
-                t.finish_time = time
-                t.turnaround_time = t.finish_time - t.arrival
-                t.waiting_time = t.turnaround_time - t.burst
-        else:
-            # No tasks ready, advance time
-            time += 1
+            # Draw cell values
+            for j, value in enumerate(values):
+                cell_rect = pygame.Rect(x + j * col_width, row_y, col_width, row_height)
+                pygame.draw.rect(screen, TEXT_COLOR, cell_rect, width=1)
+                
+                cell_text = render_text(small_font, value, (255, 255, 255))
+                cell_text_rect = cell_text.get_rect(center=cell_rect.center)
+                screen.blit(cell_text, cell_text_rect)
+                
+        # Draw the scrollbar and the visible range when not everything fits
+        total = len(self.tasks)
+        if total > self.visible_rows:
+            track = self.scrollbar_rect
+            pygame.draw.rect(screen, TABLE_ROW_2, track, border_radius=4)
+            thumb_height = max(20, track.height * self.visible_rows / total)
+            thumb_y = track.y + (track.height - thumb_height) * self.first_row / self.max_first_row()
+            pygame.draw.rect(screen, BUTTON_COLOR, (track.x, thumb_y, track.width, thumb_height), border_radius=4)
             
-    return result_tasks, result_schedule
-
-# ------------------ METRICS & DRAW ------------------
-def calculate_metrics(tasks):
-    if not tasks:
-        return {}
-    
-    metrics = {}
-    
-    # Calculate CPU utilization
-    if any(t.finish_time is not None for t in tasks):
-        total_time = max((t.finish_time or 0) for t in tasks)
-        cpu_time = sum((e[1] - e[0]) for t in tasks for e in t.executions)
-        metrics['cpu_utilization'] = (cpu_time / total_time * 100) if total_time > 0 else 0
-    else:
-        metrics['cpu_utilization'] = 0
-    
-    # Calculate average waiting and turnaround times
-    total_waiting = 0
-    total_turnaround = 0
-    completed_tasks = 0
-    
-    for task in tasks:
-        if task.finish_time is not None:
-            total_waiting += task.waiting_time
-            total_turnaround += task.turnaround_time
-            completed_tasks += 1
-    
-    if completed_tasks > 0:
-        metrics['avg_waiting'] = total_waiting / completed_tasks
-        metrics['avg_turnaround'] = total_turnaround / completed_tasks
-    else:
-        metrics['avg_waiting'] = 0
-        metrics['avg_turnaround'] = 0
-    
-    return metrics
-
-def draw_gantt_chart(x, y, width, height, max_time, current_schedule):
-    # Draw timeline axis
-    pygame.draw.line(screen, TEXT_COLOR, (x, y + height + 10), (x + width, y + height + 10), 2)
-    
-    # Draw time markers
-    unit_width = width / max_time if max_time > 0 else width
-    for t in range(0, max_time + 1, max(1, max_time // 10)):
-        marker_x = x + t * unit_width
-        pygame.draw.line(screen, TEXT_COLOR, (marker_x, y + height + 10), (marker_x, y + height + 15), 2)
-        time_text = small_font.render(str(t), True, TEXT_COLOR)
-        screen.blit(time_text, (marker_x - 5, y + height + 20))
-    
-    # Draw task executions
-    for i, (task_name, start, end) in enumerate(current_schedule):
-        color = CHART_COLORS[i % len(CHART_COLORS)]
-        block_x = x + start * unit_width
-        block_width = (end - start) * unit_width
-        
-        # Draw execution block
-        pygame.draw.rect(screen, color, (block_x, y, block_width, height), border_radius=3)
-        pygame.draw.rect(screen, TEXT_COLOR, (block_x, y, block_width, height), width=1, border_radius=3)
-        
-        # Draw task name only if block is wide enough
-        name_text = small_font.render(task_name, True, (255, 255, 255))
-        name_rect = name_text.get_rect(center=(block_x + block_width/2, y + height/2))
-        
-        # Only draw text if there's enough space
-        if block_width > name_rect.width + 4:
-            screen.blit(name_text, name_rect)
-
-def draw_results_table(x, y, width, height, current_tasks):
-    # Table header
-    headers = ["Job", "Arrival Time", "Burst Time", "Finish Time", "Turn Around Time", "Waiting Time"]
-    col_width = width / len(headers)
-    
-    # Calculate max visible rows based on available height
-    row_height = 30
-    header_height = 40
-    max_rows = (height - header_height) // row_height
-    
-    # Draw table headers
-    for i, header in enumerate(headers):
-        header_rect = pygame.Rect(x + i * col_width, y, col_width, header_height)
-        pygame.draw.rect(screen, TABLE_HEADER, header_rect)
-        pygame.draw.rect(screen, TEXT_COLOR, header_rect, width=1)
-        
-        header_text = small_font.render(header, True, (255, 255, 255))
-        header_text_rect = header_text.get_rect(center=header_rect.center)
-        screen.blit(header_text, header_text_rect)
-    
-    # Draw table rows - limit to max visible rows
-    sorted_tasks = sorted(current_tasks, key=lambda t: t.name)
-    visible_tasks = sorted_tasks[:max_rows-1]  # Leave space for average row
-    
-    for i, task in enumerate(visible_tasks):
-        row_y = y + header_height + i * row_height
-        row_color = TABLE_ROW_1 if i % 2 == 0 else TABLE_ROW_2
-        
-        # Draw row background
-        row_rect = pygame.Rect(x, row_y, width, row_height)
-        pygame.draw.rect(screen, row_color, row_rect)
-        
-        # Task data
-        values = [
-            task.name,
-            str(task.arrival),
-            str(task.burst),
-            str(task.finish_time if task.finish_time is not None else "-"),
-            str(task.turnaround_time if task.finish_time is not None else "-"),
-            str(task.waiting_time if task.finish_time is not None else "-")
-        ]
-        
-        # Draw cell values
-        for j, value in enumerate(values):
-            cell_rect = pygame.Rect(x + j * col_width, row_y, col_width, row_height)
-            pygame.draw.rect(screen, TEXT_COLOR, cell_rect, width=1)
+            range_text = render_text(small_font, f"{self.first_row + 1}-{self.first_row + drawn} of {total}", TEXT_COLOR)
+            screen.blit(range_text, (x + width - range_text.get_width(), y - 28))
             
-            cell_text = small_font.render(value, True, (255, 255, 255))
-            cell_text_rect = cell_text.get_rect(center=cell_rect.center)
-            screen.blit(cell_text, cell_text_rect)
-    
-    # Show indicator if there are more tasks than can be displayed
-    if len(sorted_tasks) > max_rows-1:
-        more_text = small_font.render(f"+ {len(sorted_tasks) - (max_rows-1)} more tasks", True, TEXT_COLOR)
-        screen.blit(more_text, (x + width - 150, y + header_height + (max_rows-1) * row_height + 5))
-    
-    # Draw averages row
-    if current_tasks:
-        metrics = calculate_metrics(current_tasks)
-        avg_row_y = y + header_height + min(len(visible_tasks), max_rows-1) * row_height
+        # Draw averages row
+        avg_row_y = y + header_height + drawn * row_height
         
         # Draw row background
         avg_rect = pygame.Rect(x, avg_row_y, width, row_height)
         pygame.draw.rect(screen, TABLE_HEADER, avg_rect)
         
         # Create the "Average" text for the first cell
-        avg_text = small_font.render("Average", True, (255, 255, 255))
+        avg_text = render_text(small_font, "Average", (255, 255, 255))
         avg_text_rect = avg_text.get_rect(center=(x + col_width/2, avg_row_y + row_height/2))
         screen.blit(avg_text, avg_text_rect)
         
         # Draw the average cells
-        for j in range(len(headers)):
+        for j in range(len(self.COLUMNS)):
             cell_rect = pygame.Rect(x + j * col_width, avg_row_y, col_width, row_height)
             pygame.draw.rect(screen, TEXT_COLOR, cell_rect, width=1)
             
             # Only add values for turnaround and waiting time columns
             if j == 4:  # Turnaround time column
-                value = f"{metrics['avg_turnaround']:.2f}"
-                cell_text = small_font.render(value, True, (255, 255, 255))
+                value = f"{self.metrics['avg_turnaround']:.2f}"
+                cell_text = render_text(small_font, value, (255, 255, 255))
                 cell_text_rect = cell_text.get_rect(center=cell_rect.center)
                 screen.blit(cell_text, cell_text_rect)
             elif j == 5:  # Waiting time column
-                value = f"{metrics['avg_waiting']:.2f}"
-                cell_text = small_font.render(value, True, (255, 255, 255))
+                value = f"{self.metrics['avg_waiting']:.2f}"
+                cell_text = render_text(small_font, value, (255, 255, 255))
                 cell_text_rect = cell_text.get_rect(center=cell_rect.center)
                 screen.blit(cell_text, cell_text_rect)
+                
+    def handle_event(self, event, pos):
+        """Scroll with the wheel or the scrollbar, sort by clicking a header.
+        
+        Returns True if the event was used by the table.
+        """
+        if not len(self.tasks):
+            return False
+        if event.type == pygame.MOUSEWHEEL and self.rect.collidepoint(pos):
+            self.scroll_to(self.first_row - event.y * self.WHEEL_ROWS)
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.scrollbar_rect.collidepoint(pos):
+                self.dragging = True
+                self.scroll_to_bar(pos[1])
+                return True
+            header_rect = pygame.Rect(self.x, self.y, self.width, self.HEADER_HEIGHT)
+            if header_rect.collidepoint(pos):
+                column = int((pos[0] - self.x) * len(self.COLUMNS) // self.width)
+                self.sort_by(self.COLUMNS[min(column, len(self.COLUMNS) - 1)][1])
+                return True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.scroll_to_bar(pos[1])
+            return True
+        return False
 
 # ------------------ NEW COMPONENTS FOR ALGORITHM COMPARISON ------------------
 def draw_bar_chart(x, y, width, height, data, title, colors):
@@ -613,7 +865,7 @@ def draw_bar_chart(x, y, width, height, data, title, colors):
     pygame.draw.rect(screen, CARD_BG, (x-10, y-40, width+20, height+60), border_radius=10)
     
     # Draw title
-    title_surf = heading_font.render(title, True, TEXT_COLOR)
+    title_surf = render_text(heading_font, title, TEXT_COLOR)
     title_rect = title_surf.get_rect(midtop=(x + width/2, y-30))
     screen.blit(title_surf, title_rect)
     
@@ -645,40 +897,189 @@ def draw_bar_chart(x, y, width, height, data, title, colors):
         pygame.draw.rect(screen, TEXT_COLOR, (bar_x, bar_y, bar_width, bar_height), width=1)
         
         # Draw algorithm name
-        algo_name = small_font.render(algo, True, TEXT_COLOR)
+        algo_name = render_text(small_font, algo, TEXT_COLOR)
         algo_rect = algo_name.get_rect(midtop=(bar_x + bar_width/2, y + height + 5))
         screen.blit(algo_name, algo_rect)
         
         # Draw value on top of bar
-        value_text = small_font.render(f"{value:.2f}", True, TEXT_COLOR)
+        value_text = render_text(small_font, f"{value:.2f}", TEXT_COLOR)
         value_rect = value_text.get_rect(midbottom=(bar_x + bar_width/2, bar_y - 5))
         screen.blit(value_text, value_rect)
     
     # Draw X axis
     pygame.draw.line(screen, TEXT_COLOR, (x, y+height), (x+width, y+height), 2)
 
-def draw_back_button(x, y):
+def draw_line_chart(x, y, width, height, xs, series, title, colors, marker_x=None):
+    """Draw one or more series of values over common x values as a line chart.
+    
+    series maps a legend label to a list of values, one per x value; the x
+    value marker_x, if present, is highlighted with a vertical line.
+    """
+    pygame.draw.rect(screen, CARD_BG, (x-10, y-40, width+20, height+60), border_radius=10)
+    
+    # Draw title
+    title_surf = render_text(heading_font, title, TEXT_COLOR)
+    title_rect = title_surf.get_rect(midtop=(x + width/2, y-30))
+    screen.blit(title_surf, title_rect)
+    
+    # Draw axes
+    pygame.draw.line(screen, TEXT_COLOR, (x, y), (x, y+height), 2)
+    pygame.draw.line(screen, TEXT_COLOR, (x, y+height), (x+width, y+height), 2)
+    
+    if not xs:
+        return
+        
+    # Calculate ranges for scaling
+    min_x, max_x = min(xs), max(xs)
+    x_span = (max_x - min_x) or 1
+    max_value = max((max(values) for values in series.values() if values), default=0) or 1
+    
+    def point(x_value, value):
+        return (x + 10 + (x_value - min_x) / x_span * (width - 20),
+                y + height - value / max_value * (height - 20))
+        
+    # Highlight the marker
+    if marker_x is not None and min_x <= marker_x <= max_x:
+        marker_left = point(marker_x, 0)[0]
+        pygame.draw.line(screen, BORDER_COLOR, (marker_left, y), (marker_left, y+height), 2)
+        
+    # Draw each series with its legend entry
+    for i, (label, values) in enumerate(series.items()):
+        color = colors[i % len(colors)]
+        points = [point(x_value, value) for x_value, value in zip(xs, values)]
+        if len(points) > 1:
+            pygame.draw.lines(screen, color, False, points, 2)
+        for p in points:
+            pygame.draw.circle(screen, color, p, 3)
+            
+        legend_y = y + 5 + i * 20
+        pygame.draw.rect(screen, color, (x + 15, legend_y + 4, 12, 12))
+        legend_text = render_text(small_font, label, TEXT_COLOR)
+        screen.blit(legend_text, (x + 32, legend_y))
+        
+    # Label the value range and the x values at the ends and the marker
+    max_text = render_text(small_font, f"{max_value:.2f}" if isinstance(max_value, float) else str(max_value), TEXT_COLOR)
+    screen.blit(max_text, (x + width - max_text.get_width(), y))
+    for x_value in {min_x, max_x, marker_x} - {None}:
+        if min_x <= x_value <= max_x:
+            x_text = render_text(small_font, str(x_value), TEXT_COLOR)
+            x_rect = x_text.get_rect(midtop=(point(x_value, 0)[0], y + height + 5))
+            screen.blit(x_text, x_rect)
+
+def draw_distribution_chart(x, y, width, height, samples, summaries, title, colors):
+    """Draw the distribution of each algorithm's samples as a box plot.
+    
+    Boxes span the quartiles with a line at the median and whiskers out to
+    the extremes. The mean is marked with a dot and its confidence interval
+    (from summaries, as made by SchedulingExperiment.summarize) with a bar,
+    and labelled above the whisker.
+    """
+    pygame.draw.rect(screen, CARD_BG, (x-10, y-40, width+20, height+60), border_radius=10)
+    
+    # Draw title
+    title_surf = render_text(heading_font, title, TEXT_COLOR)
+    title_rect = title_surf.get_rect(midtop=(x + width/2, y-30))
+    screen.blit(title_surf, title_rect)
+    
+    # Draw axes
+    pygame.draw.line(screen, TEXT_COLOR, (x, y), (x, y+height), 2)
+    pygame.draw.line(screen, TEXT_COLOR, (x, y+height), (x+width, y+height), 2)
+    
+    samples = {algo: values for algo, values in samples.items() if values}
+    if not samples:
+        return
+        
+    max_value = max(max(values) for values in samples.values()) or 1
+    
+    def value_y(value):
+        return y + height - value / max_value * (height - 30)
+        
+    column_width = (width - 40) / len(samples)
+    box_width = column_width * 0.6
+    for i, (algo, values) in enumerate(samples.items()):
+        color = colors[i % len(colors)]
+        center = x + 20 + (i + 0.5) * column_width
+        
+        ordered = sorted(values)
+        if len(ordered) > 1:
+            q1, median, q3 = statistics.quantiles(ordered, n=4, method='inclusive')
+        else:
+            q1 = median = q3 = ordered[0]
+            
+        # Whiskers, box and median
+        pygame.draw.line(screen, TEXT_COLOR, (center, value_y(ordered[0])), (center, value_y(ordered[-1])), 1)
+        for end in (ordered[0], ordered[-1]):
+            pygame.draw.line(screen, TEXT_COLOR, (center - box_width/4, value_y(end)),
+                             (center + box_width/4, value_y(end)), 1)
+        box = pygame.Rect(center - box_width/2, value_y(q3), box_width, max(value_y(q1) - value_y(q3), 1))
+        pygame.draw.rect(screen, color, box)
+        pygame.draw.rect(screen, TEXT_COLOR, box, width=1)
+        pygame.draw.line(screen, TEXT_COLOR, (box.left, value_y(median)), (box.right, value_y(median)), 2)
+        
+        # Mean and its confidence interval
+        summary = summaries.get(algo)
+        if summary:
+            pygame.draw.line(screen, (255, 255, 255), (center + box_width/2 + 4, value_y(summary.low)),
+                             (center + box_width/2 + 4, value_y(summary.high)), 3)
+            pygame.draw.circle(screen, (255, 255, 255), (center, value_y(summary.mean)), 4)
+            pygame.draw.circle(screen, TEXT_COLOR, (center, value_y(summary.mean)), 4, width=1)
+            margin = summary.high - summary.mean
+            value_text = render_text(small_font, f"{summary.mean:.2f} \u00b1 {margin:.2f}", TEXT_COLOR)
+            value_rect = value_text.get_rect(midbottom=(center, value_y(ordered[-1]) - 3))
+            screen.blit(value_text, value_rect)
+            
+        # Draw algorithm name
+        algo_name = render_text(small_font, algo, TEXT_COLOR)
+        algo_rect = algo_name.get_rect(midtop=(center, y + height + 5))
+        screen.blit(algo_name, algo_rect)
+
+def draw_back_button(x, y, hovered=False):
     """Draw a back button for returning from comparison view"""
     back_button = Button(x, y, 120, 40, "Back")
+    back_button.is_hovered = hovered
     back_button.draw()
     return back_button
 
-def draw_comparison_view(comparison_results):
-    """Draw the comparison view with all algorithm metrics"""
+def draw_experiment_charts(experiment, chart_width, chart_height, padding):
+    """Draw the metric distributions of a finished MonteCarloExperiment"""
+    samples, summaries = experiment.get_results(), experiment.summaries()
+    charts = [("avg_waiting", "Average Waiting Time"),
+              ("avg_turnaround", "Average Turnaround Time"),
+              ("cpu_utilization", "CPU Utilization (%)")]
+    for i, (metric, title) in enumerate(charts):
+        draw_distribution_chart(100 + i * (chart_width + padding), 150, chart_width, chart_height,
+                                {algo: metrics[metric] for algo, metrics in samples.items()},
+                                {algo: metrics[metric] for algo, metrics in summaries.items() if metric in metrics},
+                                title, CHART_COLORS)
+
+def draw_comparison_view(comparison_results, back_hovered=False, sweep_results=(), time_quantum=None,
+                         experiment=None, experiment_note=""):
+    """Draw the comparison view with all algorithm metrics and the RR quantum sweep.
+    
+    Given a finished MonteCarloExperiment, its metric distributions over
+    random workloads are drawn instead, described by experiment_note.
+    """
     # Clear screen
     screen.fill(BG_COLOR)
     
     # Draw title
-    title_text = title_font.render("ALGORITHM COMPARISON", True, HEADING_COLOR)
+    title_text = render_text(title_font, "ALGORITHM COMPARISON", HEADING_COLOR)
     title_rect = title_text.get_rect(center=(800, 50))
     screen.blit(title_text, title_rect)
     
+    if experiment is not None:
+        note = render_text(heading_font, experiment_note, TEXT_COLOR)
+        screen.blit(note, note.get_rect(center=(800, 95)))
+        if experiment.is_complete:
+            draw_experiment_charts(experiment, 400, 300, 60)
+        return draw_back_button(20, 20, back_hovered)
+    
     if not comparison_results:
         # Show message if no results
-        msg = heading_font.render("No comparison data available", True, TEXT_COLOR)
+        msg = render_text(heading_font, "No comparison data available", TEXT_COLOR)
         msg_rect = msg.get_rect(center=(800, 450))
         screen.blit(msg, msg_rect)
-        return draw_back_button(20, 20)
+        return draw_back_button(20, 20, back_hovered)
     
     # Extract metrics for each algorithm
     waiting_times = {}
@@ -708,79 +1109,20 @@ def draw_comparison_view(comparison_results):
     draw_bar_chart(100 + 2 * (chart_width + padding), 150, chart_width, 
                    chart_height, cpu_utilization, "CPU Utilization (%)", CHART_COLORS)
     
-    # Draw back button
-    return draw_back_button(20, 20)
-
-# ------------------ MULTITHREADED EXECUTION ------------------
-class SchedulingThread(threading.Thread):
-    """Thread class for running scheduling algorithms without blocking UI"""
-    def __init__(self, algorithm, tasks, time_quantum=None):
-        super().__init__()
-        self.algorithm = algorithm
-        self.tasks = tasks
-        self.time_quantum = time_quantum
-        self.result = None
-        
-    def run(self):
-        try:
-            if self.algorithm == "FCFS":
-                self.result = fcfs(self.tasks)
-            elif self.algorithm == "SJN":
-                self.result = sjn(self.tasks)
-            elif self.algorithm == "Round Robin":
-                self.result = rr(self.tasks, self.time_quantum)
-            elif self.algorithm == "Rate Monotonic":
-                self.result = rm(self.tasks)
-            elif self.algorithm == "EDF":
-                self.result = edf(self.tasks)
-        except Exception as e:
-            print(f"Error in scheduling thread: {e}")
-            self.result = None
-
-class AlgorithmComparer:
-    """Class to manage comparison of multiple scheduling algorithms"""
-    def __init__(self):
-        self.results = {}
-        self.running = False
-        self.threads = []
-        self.is_complete = False
-        
-    def start_comparison(self, tasks, algorithms, time_quantum=None):
-        """Start comparing multiple algorithms with the same task set"""
-        self.results = {}
-        self.running = True
-        self.is_complete = False
-        self.threads = []
-        
-        for algo in algorithms:
-            if algo == "Round Robin" and time_quantum is not None:
-                thread = SchedulingThread(algo, tasks, time_quantum)
-            else:
-                thread = SchedulingThread(algo, tasks)
-            thread.start()
-            self.threads.append((algo, thread))
-        
-    def check_progress(self):
-        """Check if all algorithms have completed"""
-        if not self.running:
-            return False
-            
-        all_done = True
-        for algo, thread in self.threads:
-            if thread.is_alive():
-                all_done = False
-            elif algo not in self.results and thread.result is not None:
-                self.results[algo] = thread.result
-                
-        if all_done and len(self.results) == len(self.threads):
-            self.running = False
-            self.is_complete = True
-            
-        return self.is_complete
+    # Round Robin metrics against the time quantum, below the bar charts
+    if sweep_results:
+        quanta = [quantum for quantum, _ in sweep_results]
+        sweep_width = (3 * chart_width + padding) / 2
+        draw_line_chart(100, 600, sweep_width, 200, quanta, {
+            "Avg Waiting": [metrics['avg_waiting'] for _, metrics in sweep_results],
+            "Avg Turnaround": [metrics['avg_turnaround'] for _, metrics in sweep_results],
+        }, "Round Robin: Times by Quantum", CHART_COLORS, time_quantum)
+        draw_line_chart(100 + sweep_width + padding, 600, sweep_width, 200, quanta, {
+            "Context Switches": [metrics['context_switches'] for _, metrics in sweep_results],
+        }, "Round Robin: Context Switches by Quantum", CHART_COLORS[2:], time_quantum)
     
-    def get_results(self):
-        """Get the results of the comparison"""
-        return self.results
+    # Draw back button
+    return draw_back_button(20, 20, back_hovered)
 
 # ------------------ MAIN APP CLASS ------------------
 class SchedulingApp:
@@ -793,35 +1135,58 @@ class SchedulingApp:
         self.deadline_field = InputField(50, 440, 200, 40, "Deadlines (Only for EDF)", is_numeric=True)
         self.period_field = InputField(50, 520, 200, 40, "Periods (Only for RM)", is_numeric=True)
         self.time_quantum_field = InputField(50, 600, 200, 40, "Time Quantum (only for RR)", "1", is_numeric=True)
+        self.horizon_field = InputField(570, 520, 240, 40, "Periodic Horizon (RM/EDF)", "off", is_numeric=True)
+        self.cores_field = InputField(320, 740, 120, 40, "Cores", "1", is_numeric=True)
         
         # Buttons
         self.run_button = Button(300, 600, 150, 40, "Run Algorithm")
         self.compare_button = Button(480, 600, 150, 40, "Compare All")
         self.clear_button = Button(660, 600, 150, 40, "Clear All")
+        self.abort_button = Button(1430, 280, 120, 40, "Abort")
+        self.core_mode_button = Button(455, 740, 150, 40, "Global")
+        self.experiment_button = Button(620, 740, 170, 40, "Monte Carlo")
         
         # Dropdown menu for algorithm selection
-        self.algorithm_dropdown = Dropdown(300, 520, 250, 40, [
-            "FCFS", "SJN", "Round Robin", "Rate Monotonic", "EDF"
-        ])
+        self.algorithm_dropdown = Dropdown(300, 520, 250, 40, ALGORITHMS)
         
         # State variables
         self.current_tasks = []
         self.current_schedule = []
         self.max_time = 0
+        self.gantt_chart = GanttChart(320, 170, 1230, 60)
+        self.results_table = ResultsTable(860, 500, 690, 330)
         self.comparison_results = {}
+        self.sweep_results = []
+        self.comparison_quantum = None
         self.view_mode = "main"  # 'main' or 'comparison'
+        self.back_hovered = False
         
-        # Threading related
+        # Threading related; runs are memoised across both buttons
+        self.result_cache = ResultCache()
         self.scheduler_thread = None
-        self.algorithm_comparer = AlgorithmComparer()
+        self.shown_progress = None
+        
+        # Intervals streamed from the running algorithm; live_batch is the
+        # batch being moved to the Gantt chart, from position live_position
+        self.interval_queue = None
+        self.live_batch = []
+        self.live_position = 0
+        self.algorithm_comparer = AlgorithmComparer(backend="process", cache=self.result_cache)
+        self.quantum_sweep = QuantumSweep(backend="process")
         
-        # Scroll position for task table
-        self.scroll_y = 0
-        self.max_scroll = 0
+        # Monte Carlo experiment shown in the comparison view instead of the comparison, if any
+        self.experiment = None
+        self.experiment_note = ""
         
         # Precomputed results
         self.metrics = {}
         
+        # Schedulability analysis of the last RM or EDF run, shown as soon as it starts
+        self.analysis = None
+        
+        # Multi-core mode: global (shared ready queue) or partitioned
+        self.partitioned = False
+        
         # Status message
         self.status_message = ""
         self.status_time = 0
@@ -833,9 +1198,14 @@ class SchedulingApp:
         """Show a status message for a certain duration"""
         self.status_message = message
         self.status_time = pygame.time.get_ticks() + duration
+        dirty.mark(STATUS_RECT)
+        
+    def set_view_mode(self, view_mode):
+        self.view_mode = view_mode
+        dirty.mark()
         
     def create_tasks_from_input(self):
-        """Create task objects from input fields"""
+        """Create a task set from input fields"""
         # Get input values
         task_names = self.task_names_field.text.split(',')
         task_names = [name.strip() for name in task_names if name.strip()]
@@ -854,22 +1224,59 @@ class SchedulingApp:
             self.show_status("Number of tasks, arrival times, and burst times must match")
             return []
             
+        if 0 in periods[:len(task_names)]:
+            self.show_status("Periods must be positive")
+            return []
+            
         # Create tasks
-        tasks = []
+        tasks = TaskSet()
         for i in range(len(task_names)):
             deadline = deadlines[i] if i < len(deadlines) else None
             period = periods[i] if i < len(periods) else None
             
-            tasks.append(Task(
+            tasks.append(
                 task_names[i],
                 arrival_times[i],
                 burst_times[i],
                 deadline,
                 period
-            ))
+            )
             
         return tasks
         
+    def periodic_horizon(self):
+        """Periodic release horizon from its input field.
+        
+        Empty means each task runs once, 0 means one hyperperiod and any
+        other number is the horizon itself. Returns (valid, horizon).
+        """
+        text = self.horizon_field.text.strip()
+        if not text:
+            return True, None
+        try:
+            horizon = int(text)
+        except ValueError:
+            self.show_status("Invalid periodic horizon")
+            return False, None
+        return True, HYPERPERIOD if horizon == 0 else horizon
+        
+    def core_count(self):
+        """Number of cores from its input field (empty means 1); returns (valid, cores)"""
+        try:
+            cores = int(self.cores_field.text.strip() or "1")
+        except ValueError:
+            self.show_status("Invalid number of cores")
+            return False, 1
+        if cores <= 0:
+            self.show_status("Number of cores must be positive")
+            return False, 1
+        return True, cores
+        
+    def set_partitioned(self, partitioned):
+        self.partitioned = partitioned
+        self.core_mode_button.text = "Partitioned" if partitioned else "Global"
+        dirty.mark(self.core_mode_button.rect)
+        
     def run_algorithm(self):
         """Run the selected scheduling algorithm"""
         # Get tasks from input
@@ -892,16 +1299,79 @@ class SchedulingApp:
                 self.show_status("Invalid time quantum")
                 return
                 
+        valid, horizon = self.periodic_horizon()
+        if not valid:
+            return
+        valid, cores = self.core_count()
+        if not valid:
+            return
+            
         # Reset current results
         self.current_tasks = []
         self.current_schedule = []
         self.max_time = 0
-        
-        # Start algorithm in a separate thread
+        dirty.mark()
+        
+        # Periodic task sets are checked analytically on the scheduling
+        # thread before they are simulated, as the exact tests can be slow
+        self.analysis = None
+        analyzer = None
+        if algorithm in PERIODIC_ALGORITHMS and cores == 1:
+            analyzer = lambda task_set: analyze(task_set, algorithm)
+        
+        # A new run replaces one still in progress
+        if self.scheduler_thread:
+            self.scheduler_thread.cancel()
+            
+        # Start algorithm in a separate thread, streaming its intervals to the Gantt chart
         self.show_status(f"Running {algorithm}...")
-        self.scheduler_thread = SchedulingThread(algorithm, tasks, time_quantum)
+        self.gantt_chart.set_schedule([], 0, cores)
+        self.interval_queue = queue.Queue()
+        self.live_batch, self.live_position = [], 0
+        self.scheduler_thread = SchedulingThread(algorithm, tasks, time_quantum, cache=self.result_cache,
+                                                 interval_queue=self.interval_queue, horizon=horizon,
+                                                 cores=cores, partitioned=self.partitioned, analyzer=analyzer)
         self.scheduler_thread.start()
         
+    def drain_intervals(self, budget=LIVE_INTERVALS_PER_FRAME):
+        """Move up to `budget` streamed intervals to the Gantt chart.
+        
+        Returns True once the queue has been emptied.
+        """
+        while budget > 0:
+            if self.live_position >= len(self.live_batch):
+                try:
+                    self.live_batch, self.live_position = self.interval_queue.get_nowait(), 0
+                except queue.Empty:
+                    return True
+            end = min(self.live_position + budget, len(self.live_batch))
+            self.gantt_chart.extend(self.live_batch[self.live_position:end])
+            budget -= end - self.live_position
+            self.live_position = end
+        return False
+        
+    def abort_algorithm(self):
+        """Stop the running algorithm, keeping the schedule computed so far"""
+        if self.scheduler_thread:
+            self.scheduler_thread.cancel()
+            self.show_status(f"Aborting {self.scheduler_thread.algorithm}...")
+            
+    def draw_progress(self):
+        """Draw the progress bar and abort button of the running algorithm"""
+        progress = self.scheduler_thread.progress
+        fraction = progress.completed / progress.total if progress.total else 0
+        
+        bar_rect = pygame.Rect(320, 290, 1090, 24)
+        pygame.draw.rect(screen, BORDER_COLOR, bar_rect, border_radius=5)
+        pygame.draw.rect(screen, BUTTON_COLOR, (bar_rect.x, bar_rect.y, bar_rect.width * fraction, bar_rect.height),
+                         border_radius=5)
+        
+        progress_text = render_text(small_font, f"{self.scheduler_thread.algorithm}: time {progress.time}, "
+                                                f"{progress.completed} of {progress.total} tasks completed", TEXT_COLOR)
+        screen.blit(progress_text, (bar_rect.x, bar_rect.bottom + 5))
+        
+        self.abort_button.draw()
+        
     def run_comparison(self):
         """Run comparison of all scheduling algorithms"""
         # Get tasks from input
@@ -920,10 +1390,48 @@ class SchedulingApp:
             self.show_status("Invalid time quantum")
             return
             
-        # Start comparison
+        valid, horizon = self.periodic_horizon()
+        if not valid:
+            return
+        valid, cores = self.core_count()
+        if not valid:
+            return
+            
+        # Start comparison, and sweep single-core Round Robin over a range of quanta
         self.show_status("Running comparison...")
-        algorithms = ["FCFS", "SJN", "Round Robin", "Rate Monotonic", "EDF"]
-        self.algorithm_comparer.start_comparison(tasks, algorithms, time_quantum)
+        self.experiment = None
+        self.algorithm_comparer.start_comparison(tasks, ALGORITHMS, time_quantum, horizon,
+                                                 cores, self.partitioned)
+        self.sweep_results = []
+        self.comparison_quantum = time_quantum
+        if cores == 1:
+            self.quantum_sweep.start(tasks, sweep_quanta(tasks, time_quantum))
+        
+    def run_experiment(self):
+        """Run every algorithm on EXPERIMENT_TRIALS random workloads"""
+        try:
+            time_quantum = int(self.time_quantum_field.text or "1")
+            if time_quantum <= 0:
+                self.show_status("Time quantum must be positive")
+                return
+        except ValueError:
+            self.show_status("Invalid time quantum")
+            return
+            
+        valid, cores = self.core_count()
+        if not valid:
+            return
+            
+        workload = EXPERIMENT_WORKLOAD
+        mode = f", {cores} cores ({'partitioned' if self.partitioned else 'global'})" if cores > 1 else ""
+        self.experiment_note = (f"{EXPERIMENT_TRIALS} random workloads of {workload.size} tasks, "
+                                f"{workload.distribution} bursts, load {workload.load}{mode}; "
+                                f"means with 95% confidence intervals")
+        self.show_status("Running Monte Carlo experiment...")
+        self.experiment = MonteCarloExperiment(backend="process")
+        self.experiment.start(ALGORITHMS, workload, EXPERIMENT_TRIALS, time_quantum=time_quantum,
+                              cores=cores, partitioned=self.partitioned)
+        self.set_view_mode("comparison")
         
     def clear_all(self):
         """Clear all input fields and results"""
@@ -933,32 +1441,60 @@ class SchedulingApp:
         self.deadline_field.text = ""
         self.period_field.text = ""
         self.time_quantum_field.text = "1"
+        self.horizon_field.text = ""
+        self.cores_field.text = ""
+        self.set_partitioned(False)
         
         self.current_tasks = []
         self.current_schedule = []
         self.max_time = 0
+        self.gantt_chart.set_schedule([], 0)
+        self.results_table.set_tasks([])
         self.comparison_results = {}
+        self.sweep_results = []
         self.metrics = {}
+        self.analysis = None
+        self.experiment = None
+        dirty.mark()
+        
+        if self.scheduler_thread:
+            self.scheduler_thread.cancel()
+            self.scheduler_thread = None
         
         self.show_status("All data cleared")
         
-    def handle_events(self):
+    def handle_events(self, events):
         """Handle input events"""
         # Get mouse position
         mouse_pos = pygame.mouse.get_pos()
         
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
                 
-            # Handle scrolling for task table
-            if event.type == pygame.MOUSEWHEEL:
-                self.scroll_y += event.y * 20
-                self.scroll_y = max(min(self.scroll_y, 0), -self.max_scroll)
+            # The window was uncovered or resized: its contents are lost
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+                dirty.mark()
+                
+            # Zoom and pan the Gantt chart
+            if self.view_mode == "main" and len(self.gantt_chart) and self.gantt_chart.handle_event(event, mouse_pos):
+                continue
+                
+            # Scroll and sort the results table
+            if self.view_mode == "main" and self.results_table.handle_event(event, mouse_pos):
+                continue
                 
             # Handle view mode specific events
             if self.view_mode == "main":
+                # The open option list covers the widgets below it, so clicks
+                # on it only reach the dropdown
+                dropdown = self.algorithm_dropdown
+                if (event.type == pygame.MOUSEBUTTONDOWN and dropdown.is_active
+                        and dropdown.list_rect().collidepoint(mouse_pos)):
+                    dropdown.handle_event(event, mouse_pos)
+                    continue
+
                 # Handle input fields
                 self.task_names_field.handle_event(event)
                 self.arrival_times_field.handle_event(event)
@@ -966,66 +1502,114 @@ class SchedulingApp:
                 self.deadline_field.handle_event(event)
                 self.period_field.handle_event(event)
                 self.time_quantum_field.handle_event(event)
+                self.horizon_field.handle_event(event)
+                self.cores_field.handle_event(event)
                 
                 # Handle algorithm dropdown
                 self.algorithm_dropdown.handle_event(event, mouse_pos)
                 
                 # Handle buttons
-                if self.run_button.is_clicked(mouse_pos, event):
+                if self.scheduler_thread and self.abort_button.is_clicked(mouse_pos, event):
+                    self.abort_algorithm()
+                elif self.run_button.is_clicked(mouse_pos, event):
                     self.run_algorithm()
                 elif self.compare_button.is_clicked(mouse_pos, event):
                     self.run_comparison()
                     if self.algorithm_comparer.running:
-                        self.view_mode = "comparison"
+                        self.set_view_mode("comparison")
                 elif self.clear_button.is_clicked(mouse_pos, event):
                     self.clear_all()
+                elif self.core_mode_button.is_clicked(mouse_pos, event):
+                    self.set_partitioned(not self.partitioned)
+                elif self.experiment_button.is_clicked(mouse_pos, event):
+                    self.run_experiment()
                     
             elif self.view_mode == "comparison":
                 # In comparison view, only handle back button
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     back_button_rect = pygame.Rect(20, 20, 120, 40)
                     if back_button_rect.collidepoint(mouse_pos):
-                        self.view_mode = "main"
+                        self.set_view_mode("main")
                         
         # Check hover state for buttons
         if self.view_mode == "main":
             self.run_button.check_hover(mouse_pos)
             self.compare_button.check_hover(mouse_pos)
             self.clear_button.check_hover(mouse_pos)
+            self.core_mode_button.check_hover(mouse_pos)
+            self.experiment_button.check_hover(mouse_pos)
+            if self.scheduler_thread:
+                self.abort_button.check_hover(mouse_pos)
+        else:
+            back_hovered = bool(pygame.Rect(20, 20, 120, 40).collidepoint(mouse_pos))
+            if back_hovered != self.back_hovered:
+                self.back_hovered = back_hovered
+                dirty.mark((20, 20, 120, 40))
                 
         return True
         
     def update(self):
         """Update application state"""
-        # Check if scheduler thread is running
-        if self.scheduler_thread and not self.scheduler_thread.is_alive() and self.scheduler_thread.result:
-            self.current_tasks, self.current_schedule = self.scheduler_thread.result
-            self.max_time = max([end for _, _, end in self.current_schedule]) if self.current_schedule else 0
-            self.metrics = calculate_metrics(self.current_tasks)
+        # Check if scheduler thread is running, and show what it has scheduled so far
+        thread = self.scheduler_thread
+        drained = self.drain_intervals() if thread else True
+        if thread and thread.analysis is not self.analysis:
+            self.analysis = thread.analysis
+            dirty.mark()
+        if thread and thread.is_alive():
+            if thread.progress != self.shown_progress:
+                self.shown_progress = thread.progress
+                dirty.mark(PROGRESS_RECT)
+        elif thread and drained:
             self.scheduler_thread = None
-            self.show_status("Algorithm execution completed")
+            self.interval_queue = None
+            self.live_batch = []
+            dirty.mark()
+            if thread.result is None:
+                self.show_status(f"{thread.algorithm} failed")
+            else:
+                # The Gantt chart already holds the whole schedule
+                self.current_tasks, self.current_schedule = thread.result
+                self.max_time = self.gantt_chart.max_time
+                self.results_table.set_tasks(self.current_tasks)
+                self.metrics = calculate_metrics(self.current_tasks)
+                if thread.cancelled:
+                    self.show_status(f"{thread.algorithm} aborted at time {thread.progress.time}; "
+                                     f"showing the partial schedule", 5000)
+                else:
+                    self.show_status("Algorithm execution completed")
             
-        # Check if comparison is running
-        if self.view_mode == "comparison" and self.algorithm_comparer.running:
+        # Check if comparison is running, even after leaving its view
+        if self.algorithm_comparer.running:
             if self.algorithm_comparer.check_progress():
                 self.comparison_results = self.algorithm_comparer.get_results()
+                dirty.mark()
                 self.show_status("Comparison completed")
                 
+        if self.experiment is not None and self.experiment.running and self.experiment.check_progress():
+            dirty.mark()
+            self.show_status("Monte Carlo experiment completed")
+            
+        if self.quantum_sweep.running and self.quantum_sweep.check_progress():
+            self.sweep_results = self.quantum_sweep.get_results()
+            dirty.mark()
+            
         # Clear status message after timeout
         if self.status_message and pygame.time.get_ticks() > self.status_time:
             self.status_message = ""
+            dirty.mark(STATUS_RECT)
             
     def draw_main_view(self):
         """Draw the main application view"""
         # Draw title
-        title_text = title_font.render("CPU SCHEDULING VISUALIZER", True, HEADING_COLOR)
+        title_text = render_text(title_font, "CPU SCHEDULING VISUALIZER", HEADING_COLOR)
         title_rect = title_text.get_rect(center=(800, 50))
         screen.blit(title_text, title_rect)
         
         # Draw panel for input fields
         panel_rect = pygame.Rect(30, 120, 240, 540)
         pygame.draw.rect(screen, CARD_BG, panel_rect, border_radius=10)
-        panel_title = heading_font.render("Task Configuration", True, HEADING_COLOR)
+        panel_title = render_text(heading_font, "Task Configuration", HEADING_COLOR)
         screen.blit(panel_title, (panel_rect.centerx - panel_title.get_width()//2, 130))
         
         # Draw input fields
@@ -1039,18 +1623,32 @@ class SchedulingApp:
         # Draw algorithm selection panel
         algo_panel = pygame.Rect(300, 450, 510, 130)
         pygame.draw.rect(screen, CARD_BG, algo_panel, border_radius=10)
-        algo_title = heading_font.render("Algorithm Selection", True, HEADING_COLOR)
+        algo_title = render_text(heading_font, "Algorithm Selection", HEADING_COLOR)
         screen.blit(algo_title, (algo_panel.centerx - algo_title.get_width()//2, 460))
+        self.horizon_field.draw()
+        
+        # Draw multi-core panel
+        cores_panel = pygame.Rect(300, 670, 510, 130)
+        pygame.draw.rect(screen, CARD_BG, cores_panel, border_radius=10)
+        cores_title = render_text(heading_font, "Cores & Experiments", HEADING_COLOR)
+        screen.blit(cores_title, (cores_panel.centerx - cores_title.get_width()//2, 680))
+        self.cores_field.draw()
+        self.core_mode_button.draw()
+        self.experiment_button.draw()
         
         # Draw results panel
         results_panel = pygame.Rect(300, 120, 1270, 310)
         pygame.draw.rect(screen, CARD_BG, results_panel, border_radius=10)
-        results_title = heading_font.render("Gantt Chart", True, HEADING_COLOR)
+        results_title = render_text(heading_font, "Gantt Chart", HEADING_COLOR)
         screen.blit(results_title, (results_panel.centerx - results_title.get_width()//2, 130))
         
-        # Draw Gantt chart
-        if self.current_schedule:
-            draw_gantt_chart(320, 170, 1230, 60, self.max_time, self.current_schedule)
+        # Draw Gantt chart, including the live part of a running algorithm
+        if self.scheduler_thread:
+            if len(self.gantt_chart):
+                self.gantt_chart.draw()
+            self.draw_progress()
+        elif self.current_schedule:
+            self.gantt_chart.draw()
             
             # Draw metrics
             metrics_y = 280
@@ -1059,29 +1657,41 @@ class SchedulingApp:
                 avg_wait = self.metrics.get('avg_waiting', 0)
                 avg_turn = self.metrics.get('avg_turnaround', 0)
                 
-                metrics_text = heading_font.render(f"CPU Utilization: {cpu_util:.2f}%", True, TEXT_COLOR)
+                metrics_text = render_text(heading_font, f"CPU Utilization: {cpu_util:.2f}%", TEXT_COLOR)
                 screen.blit(metrics_text, (320, metrics_y))
                 
-                metrics_text = heading_font.render(f"Avg Waiting Time: {avg_wait:.2f}", True, TEXT_COLOR)
+                metrics_text = render_text(heading_font, f"Avg Waiting Time: {avg_wait:.2f}", TEXT_COLOR)
                 screen.blit(metrics_text, (620, metrics_y))
                 
-                metrics_text = heading_font.render(f"Avg Turnaround Time: {avg_turn:.2f}", True, TEXT_COLOR)
+                metrics_text = render_text(heading_font, f"Avg Turnaround Time: {avg_turn:.2f}", TEXT_COLOR)
                 screen.blit(metrics_text, (920, metrics_y))
+                
+                core_util = self.metrics.get('core_utilization')
+                if core_util:
+                    metrics_text = render_text(heading_font, f"Per Core: {min(core_util):.0f}-{max(core_util):.0f}%",
+                                               TEXT_COLOR)
+                    screen.blit(metrics_text, (1250, metrics_y))
         else:
-            no_data = heading_font.render("No data to display. Run an algorithm to see results.", True, TEXT_COLOR)
+            no_data = render_text(heading_font, "No data to display. Run an algorithm to see results.", TEXT_COLOR)
             screen.blit(no_data, (results_panel.centerx - no_data.get_width()//2, 190))
             
+        # Draw the schedulability verdict
+        if self.analysis:
+            colors = {True: SUCCESS_COLOR, False: BUTTON_COLOR, None: TEXT_COLOR}
+            verdict_text = render_text(font, summary(self.analysis), colors[self.analysis.schedulable])
+            screen.blit(verdict_text, (320, 380))
+            
         # Draw task results table panel
         table_panel = pygame.Rect(840, 450, 730, 400)
         pygame.draw.rect(screen, CARD_BG, table_panel, border_radius=10)
-        table_title = heading_font.render("Results Table", True, HEADING_COLOR)
+        table_title = render_text(heading_font, "Results Table", HEADING_COLOR)
         screen.blit(table_title, (table_panel.centerx - table_title.get_width()//2, 460))
         
         # Draw results table
         if self.current_tasks:
-            draw_results_table(860, 500, 690, 330, self.current_tasks)
+            self.results_table.draw()
         else:
-            no_table = heading_font.render("No tasks to display", True, TEXT_COLOR)
+            no_table = render_text(heading_font, "No tasks to display", TEXT_COLOR)
             screen.blit(no_table, (table_panel.centerx - no_table.get_width()//2, 550))
         
         # Draw buttons
@@ -1094,51 +1704,96 @@ class SchedulingApp:
         
         # Draw status message if present
         if self.status_message:
-            status_bg = pygame.Rect(0, 870, 1600, 30)
+            status_bg = pygame.Rect(STATUS_RECT)
             pygame.draw.rect(screen, (50, 50, 50), status_bg)
-            status_text = font.render(self.status_message, True, (255, 255, 255))
+            status_text = render_text(font, self.status_message, (255, 255, 255))
             screen.blit(status_text, (10, 875))
             
+    def is_animating(self):
+        """Whether the screen can change without user input"""
+        return (self.scheduler_thread is not None or self.algorithm_comparer.running
+                or self.quantum_sweep.running or (self.experiment is not None and self.experiment.running))
+        
+    def wait_for_events(self):
+        """Sleep until there is an event to handle or the status message expires"""
+        if self.status_message:
+            timeout = max(1, self.status_time - pygame.time.get_ticks() + 1)
+            event = pygame.event.wait(timeout)
+        else:
+            event = pygame.event.wait()
+        events = [event] if event.type != pygame.NOEVENT else []
+        return events + pygame.event.get()
+        
+    def draw_view(self):
+        """Draw the current view onto the screen"""
+        screen.fill(BG_COLOR)
+        
+        if self.view_mode == "main":
+            self.draw_main_view()
+        elif self.view_mode == "comparison":
+            draw_comparison_view(self.comparison_results, self.back_hovered,
+                                 self.sweep_results, self.comparison_quantum,
+                                 self.experiment, self.experiment_note)
+            
+            # Draw status message if present
+            if self.status_message:
+                status_bg = pygame.Rect(STATUS_RECT)
+                pygame.draw.rect(screen, (50, 50, 50), status_bg)
+                status_text = render_text(font, self.status_message, (255, 255, 255))
+                screen.blit(status_text, (10, 875))
+                
+            # Draw loading indicator if comparison is still running
+            if self.algorithm_comparer.running:
+                running_text = render_text(heading_font, "Running comparison...", TEXT_COLOR)
+                screen.blit(running_text, (800 - running_text.get_width()//2, 450))
+                
+            if self.experiment is not None and self.experiment.running:
+                running_text = render_text(heading_font, "Running Monte Carlo experiment...", TEXT_COLOR)
+                screen.blit(running_text, (800 - running_text.get_width()//2, 450))
+                
+            if self.quantum_sweep.running:
+                sweep_text = render_text(heading_font, "Sweeping Round Robin time quanta...", TEXT_COLOR)
+                screen.blit(sweep_text, (800 - sweep_text.get_width()//2, 700))
+                
+    def redraw(self):
+        """Repaint what changed since the last frame and push it to the display"""
+        full, rects = dirty.take()
+        if full:
+            self.draw_view()
+            pygame.display.flip()
+        elif rects:
+            # One clipped repaint covering every dirty region
+            screen.set_clip(rects[0].unionall(rects[1:]))
+            self.draw_view()
+            screen.set_clip(None)
+            pygame.display.update(rects)
+            
     def run(self):
         """Main application loop"""
         running = True
         
         while running:
+            # Poll at 60 fps while work is in progress, otherwise sleep until
+            # something happens
+            if self.is_animating():
+                clock.tick(60)
+                events = pygame.event.get()
+            else:
+                events = self.wait_for_events()
+                
             # Handle events
-            running = self.handle_events()
+            running = self.handle_events(events)
             
             # Update application state
             self.update()
             
-            # Clear screen
-            screen.fill(BG_COLOR)
-            
-            # Draw appropriate view
-            if self.view_mode == "main":
-                self.draw_main_view()
-            elif self.view_mode == "comparison":
-                back_button = draw_comparison_view(self.comparison_results)
-                back_button.check_hover(pygame.mouse.get_pos())
-                
-                # Draw status message if present
-                if self.status_message:
-                    status_bg = pygame.Rect(0, 870, 1600, 30)
-                    pygame.draw.rect(screen, (50, 50, 50), status_bg)
-                    status_text = font.render(self.status_message, True, (255, 255, 255))
-                    screen.blit(status_text, (10, 875))
-                    
-                # Draw loading indicator if comparison is still running
-                if self.algorithm_comparer.running:
-                    running_text = heading_font.render("Running comparison...", True, TEXT_COLOR)
-                    screen.blit(running_text, (800 - running_text.get_width()//2, 450))
-            
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)
+            # Repaint changed regions
+            self.redraw()
 
 # ------------------ MAIN EXECUTION ------------------
 if __name__ == "__main__":
     try:
+        init_display()
         app = SchedulingApp()
         app.run()
     except Exception as e:
@@ -0,0 +1,142 @@
+# WorkloadLoader.py
+# ======================
+# Streaming ingestion of task traces from CSV and JSON Lines files, and
+# synthetic workloads for benchmarks and experiments
+
+import csv
+import json
+import random
+
+from SchedulingCore import Task, TaskSet
+
+# Columns of a workload row; deadline and period are optional
+WORKLOAD_FIELDS = ["name", "arrival", "burst", "deadline", "period"]
+
+# Burst time generators, each taking a random.Random
+BURST_DISTRIBUTIONS = {
+    # Evenly spread medium bursts
+    "uniform": lambda rng: rng.randint(1, 20),
+    # Mostly short bursts with a long tail
+    "exponential": lambda rng: 1 + int(rng.expovariate(1 / 9)),
+    # Interactive tasks mixed with a few long batch jobs
+    "bimodal": lambda rng: rng.randint(50, 100) if rng.random() < 0.1 else rng.randint(1, 5),
+}
+
+# Periods given to the tasks, for Rate Monotonic
+PERIODS = [10, 20, 25, 50, 100, 200]
+
+# Largest time a TaskSet column (array('q')) can hold
+MAX_TIME = 2**63 - 1
+
+class WorkloadError(ValueError):
+    """Raised for an unreadable or invalid workload row"""
+    def __init__(self, path, line_no, message):
+        super().__init__(f"{path}:{line_no}: {message}")
+        self.path = path
+        self.line_no = line_no
+
+def parse_time(value, field, optional=False):
+    """Validate a time field as an integer from 0 to MAX_TIME; empty optional fields are None"""
+    if value is None or value == "":
+        if optional:
+            return None
+        raise ValueError(f"missing {field}")
+    try:
+        if isinstance(value, (bool, float)):
+            raise ValueError
+        time = int(value)
+    except (TypeError, ValueError):
+        time = -1
+    if time < 0:
+        raise ValueError(f"{field} must be a non-negative integer, got {value!r}")
+    if time > MAX_TIME:
+        raise ValueError(f"{field} must be at most {MAX_TIME}, got {value!r}")
+    return time
+
+def parse_row(row):
+    """Validate one workload row (a dict of field values) into a Task"""
+    name = row.get("name")
+    if name is None or not str(name).strip():
+        raise ValueError("missing name")
+    period = parse_time(row.get("period"), "period", optional=True)
+    if period == 0:
+        raise ValueError("period must be positive")
+    return Task(
+        str(name).strip(),
+        parse_time(row.get("arrival"), "arrival"),
+        parse_time(row.get("burst"), "burst"),
+        parse_time(row.get("deadline"), "deadline", optional=True),
+        period
+    )
+
+def iter_rows(path, file_format=None):
+    """Yield (line number, row dict) pairs from a CSV or JSONL file, one line at a time"""
+    if file_format is None:
+        file_format = "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+    with open(path, newline="") as f:
+        if file_format == "csv":
+            reader = csv.reader(f)
+            header = [field.strip() for field in next(reader, [])]
+            for row in reader:
+                if row:
+                    yield reader.line_num, dict(zip(header, row))
+        elif file_format == "jsonl":
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise WorkloadError(path, line_no, f"invalid JSON ({e.msg})")
+                if not isinstance(row, dict):
+                    raise WorkloadError(path, line_no, "expected a JSON object")
+                yield line_no, row
+        else:
+            raise ValueError(f"Unknown workload format: {file_format}")
+
+def iter_workload(path, file_format=None, ordered=True):
+    """Lazily read and validate the tasks of a workload file.
+
+    Rows are parsed one at a time, so memory use does not depend on the
+    size of the file. With ordered=True (the default) the iterator is
+    guaranteed to yield tasks in arrival order and raises WorkloadError on
+    the first row that arrives earlier than its predecessor.
+    """
+    last_arrival = 0
+    for line_no, row in iter_rows(path, file_format):
+        try:
+            task = parse_row(row)
+        except ValueError as e:
+            raise WorkloadError(path, line_no, str(e))
+        if ordered and task.arrival < last_arrival:
+            raise WorkloadError(path, line_no, f"arrival {task.arrival} is earlier than "
+                                               f"the previous arrival {last_arrival}")
+        last_arrival = task.arrival
+        yield task
+
+def load_taskset(path, file_format=None):
+    """Read a workload file straight into TaskSet columns, in any arrival order"""
+    tasks = TaskSet()
+    for task in iter_workload(path, file_format, ordered=False):
+        tasks.append(task.name, task.arrival, task.burst, task.deadline, task.period)
+    return tasks
+
+def generate_workload(size, distribution="uniform", load=0.9, seed=0):
+    """Synthetic task set of `size` tasks arriving as a Poisson process.
+
+    Inter-arrival times are scaled so that the offered load (total burst
+    time over the arrival span) is about `load`. Every task gets a deadline
+    a few bursts after its arrival and a period, so that all algorithms can
+    run on it.
+    """
+    rng = random.Random(seed)
+    bursts = [BURST_DISTRIBUTIONS[distribution](rng) for _ in range(size)]
+    mean_interarrival = sum(bursts) / size / load
+
+    tasks = TaskSet()
+    arrival = 0.0
+    for i, burst in enumerate(bursts):
+        tasks.append(f"T{i}", int(arrival), burst, int(arrival) + burst * rng.randint(2, 6), rng.choice(PERIODS))
+        arrival += rng.expovariate(1 / mean_interarrival)
+    return tasks
@@ -0,0 +1,9 @@
+# conftest.py
+# ======================
+# Puts the repository root on sys.path, so that a bare `pytest` can import
+# the modules under test as `python -m pytest` does
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,207 @@
+# scheduling_reference.py
+# ======================
+# The original list-based scheduling loops, kept verbatim as the reference
+# that the event-driven engines in SchedulingCore must reproduce. They step
+# time one unit at a time and are only fit for small task sets.
+
+from copy import deepcopy
+
+from SchedulingCore import Task
+
+def random_tasks(rng, count, span=20, max_burst=8):
+    """Task objects with random arrivals, bursts (some zero), deadlines and periods"""
+    return [Task(f"P{rng.randint(0, 5)}", rng.randint(0, span), rng.randint(0, max_burst),
+                 rng.choice([None, rng.randint(0, 30)]), rng.choice([None, rng.randint(1, 10)]))
+            for _ in range(count)]
+
+def fcfs(tasks):
+    """First Come First Served Algorithm"""
+    result_tasks = deepcopy(tasks)
+    result_schedule = []
+
+    time = 0
+    for task in sorted(result_tasks, key=lambda t: t.arrival):
+        # Wait until task arrives if needed
+        time = max(time, task.arrival)
+
+        # Set task start time if this is first execution
+        if task.start_time is None:
+            task.start_time = time
+
+        task.waiting_time = time - task.arrival
+        task.finish_time = time + task.burst
+        task.turnaround_time = task.finish_time - task.arrival
+
+        result_schedule.append((task.name, time, task.finish_time))
+        task.executions.append((time, task.finish_time))
+
+        time += task.burst
+
+    return result_tasks, result_schedule
+
+def sjn(tasks):
+    """Shortest Job Next Algorithm"""
+    result_tasks = deepcopy(tasks)
+    result_schedule = []
+
+    time = 0
+    ready = []
+    left = result_tasks.copy()
+
+    while left or ready:
+        # Move arrived tasks to ready queue
+        for t in left[:]:
+            if t.arrival <= time:
+                ready.append(t)
+                left.remove(t)
+
+        if ready:
+            # Select task with shortest burst time
+            ready.sort(key=lambda x: x.burst)
+            t = ready.pop(0)
+
+            # Set task start time if this is first execution
+            if t.start_time is None:
+                t.start_time = time
+
+            t.waiting_time = time - t.arrival
+            t.finish_time = time + t.burst
+            t.turnaround_time = t.finish_time - t.arrival
+
+            result_schedule.append((t.name, time, t.finish_time))
+            t.executions.append((time, t.finish_time))
+
+            time += t.burst
+        else:
+            time += 1
+
+    return result_tasks, result_schedule
+
+def rr(tasks, time_quantum):
+    """Round Robin Algorithm"""
+    result_tasks = deepcopy(tasks)
+    result_schedule = []
+
+    time = 0
+    ready_queue = []
+    remaining_tasks = result_tasks.copy()
+
+    while remaining_tasks or ready_queue:
+        # Move arrived tasks to ready queue
+        for task in remaining_tasks[:]:
+            if task.arrival <= time:
+                ready_queue.append(task)
+                remaining_tasks.remove(task)
+
+        if ready_queue:
+            current_task = ready_queue.pop(0)
+
+            # Set task start time if first execution
+            if current_task.start_time is None:
+                current_task.start_time = time
+
+            # Determine execution time for this quantum
+            execution_time = min(time_quantum, current_task.remaining)
+
+            # Execute for the quantum
+            start_time = time
+            time += execution_time
+            current_task.remaining -= execution_time
+
+            # Record execution interval
+            result_schedule.append((current_task.name, start_time, time))
+            current_task.executions.append((start_time, time))
+
+            # Check if task is complete
+            if current_task.remaining <= 0:
+                current_task.finish_time = time
+                current_task.turnaround_time = current_task.finish_time - current_task.arrival
+                current_task.waiting_time = current_task.turnaround_time - current_task.burst
+            else:
+                # Put back in ready queue
+                ready_queue.append(current_task)
+        else:
+            # No tasks ready, advance time
+            time += 1
+
+    return result_tasks, result_schedule
+
+def rm(tasks):
+    """Rate Monotonic Algorithm"""
+    result_tasks = deepcopy(tasks)
+    result_schedule = []
+
+    time = 0
+    # Sort tasks by period (rate monotonic)
+    periodic_tasks = sorted(result_tasks, key=lambda x: x.period if x.period is not None else float('inf'))
+
+    # Continue until all tasks have completed their execution
+    while any(x.remaining > 0 for x in periodic_tasks):
+        # Get tasks that have arrived and still need execution
+        ready = [x for x in periodic_tasks if x.arrival <= time and x.remaining > 0]
+
+        if ready:
+            # Select highest priority task (lowest period)
+            t = ready[0]
+
+            # Set task start time if first execution
+            if t.start_time is None:
+                t.start_time = time
+
+            # Execute for one time unit
+            start = time
+            t.remaining -= 1
+            time += 1
+
+            # Record execution
+            result_schedule.append((t.name, start, time))
+            t.executions.append((start, time))
+
+            # Check if task is complete
+            if t.remaining == 0:
+                t.finish_time = time
+                t.turnaround_time = t.finish_time - t.arrival
+                t.waiting_time = t.turnaround_time - t.burst
+        else:
+            # No tasks ready, advance time
+            time += 1
+
+    return result_tasks, result_schedule
+
+def edf(tasks):
+    """Earliest Deadline First Algorithm"""
+    result_tasks = deepcopy(tasks)
+    result_schedule = []
+
+    time = 0
+    while any(x.remaining > 0 for x in result_tasks):
+        # Get tasks that have arrived and still need execution
+        ready = [x for x in result_tasks if x.arrival <= time and x.remaining > 0]
+
+        if ready:
+            # Select task with earliest deadline
+            t = min(ready, key=lambda x: x.deadline if x.deadline is not None else float('inf'))
+
+            # Set task start time if first execution
+            if t.start_time is None:
+                t.start_time = time
+
+            # Execute for one time unit
+            start = time
+            t.remaining -= 1
+            time += 1
+
+            # Record execution
+            result_schedule.append((t.name, start, time))
+            t.executions.append((start, time))
+
+            # Check if task is complete
+            if t.remaining == 0:
+                t.finish_time = time
+                t.turnaround_time = t.finish_time - t.arrival
+                t.waiting_time = t.turnaround_time - t.burst
+        else:
+            # No tasks ready, advance time
+            time += 1
+
+    return result_tasks, result_schedule
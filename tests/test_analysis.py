@@ -0,0 +1,96 @@
+# test_analysis.py
+# ======================
+# The schedulability tests must agree with simulating the periodic jobs:
+# a synchronous task set is schedulable exactly when no simulated job
+# misses its deadline.
+
+import math
+import random
+import threading
+import unittest
+from unittest import mock
+
+import SchedulingAnalysis
+from SchedulingAnalysis import analyze, demand_test, periodic_tasks, response_time_test
+from SchedulingCore import PERIODIC_ALGORITHMS, Completion, SchedulingThread, Task, TaskSet, iter_schedule
+
+# Periods with a small hyperperiod, so every task set is cheap to simulate
+PERIODS = [2, 3, 4, 6, 8, 12]
+
+def misses_deadline(tasks, algorithm):
+    """Whether a job released within two hyperperiods misses its deadline when simulated"""
+    task_set = TaskSet.from_tasks(tasks)
+    relative = [period if deadline < 0 else deadline - arrival
+                for arrival, deadline, period in zip(task_set.arrival, task_set.deadline, task_set.period)]
+    horizon = 2 * math.lcm(*task_set.period)
+    return any(type(event) is Completion and event.finish > event.arrival + relative[event.task]
+               for event in iter_schedule(task_set, algorithm, horizon=horizon))
+
+def random_periodic_tasks(rng):
+    tasks = []
+    for i in range(rng.randint(1, 4)):
+        period = rng.choice(PERIODS)
+        burst = rng.randint(1, period // 2 + 1)
+        deadline = rng.choice([None, rng.randint(burst, 2 * period)])
+        tasks.append(Task(f"T{i}", 0, burst, deadline, period))
+    return tasks
+
+class TestExactTests(unittest.TestCase):
+    def test_verdicts_match_simulation(self):
+        rng = random.Random(6)
+        outcomes = set()
+        for _ in range(1000):
+            tasks = random_periodic_tasks(rng)
+            periodic, synchronous = periodic_tasks(tasks)
+            self.assertTrue(synchronous)
+            # An overload may only miss a deadline after the simulated window
+            if SchedulingAnalysis.utilization(periodic) > 1:
+                continue
+            for algorithm, test in (("Rate Monotonic", response_time_test), ("EDF", demand_test)):
+                schedulable = not misses_deadline(tasks, algorithm)
+                self.assertEqual(test(periodic, synchronous).schedulable, schedulable, (algorithm, tasks))
+                self.assertEqual(analyze(tasks, algorithm).schedulable, schedulable, (algorithm, tasks))
+                outcomes.add((algorithm, schedulable))
+        self.assertEqual(len(outcomes), 4)
+
+    def test_asynchronous_failure_is_inconclusive(self):
+        # Together both tasks would need 4 units by time 2; offset, both fit
+        tasks = [Task("A", 0, 2, 2, 4), Task("B", 2, 2, 4, 4)]
+        periodic, synchronous = periodic_tasks(tasks)
+        self.assertFalse(synchronous)
+        for algorithm, test in (("Rate Monotonic", response_time_test), ("EDF", demand_test)):
+            self.assertIsNone(test(periodic, synchronous).schedulable)
+            self.assertIsNone(analyze(tasks, algorithm).schedulable)
+            self.assertTrue(analyze(tasks[:1], algorithm).schedulable)
+            self.assertFalse(misses_deadline(tasks, algorithm))
+
+    def test_overload_is_decided_for_any_arrivals(self):
+        tasks = [Task("A", 0, 3, None, 4), Task("B", 1, 2, None, 4)]
+        for algorithm in PERIODIC_ALGORITHMS:
+            self.assertFalse(analyze(tasks, algorithm).schedulable)
+
+    def test_demand_test_gives_up(self):
+        tasks = [Task("A", 0, 1, 1, 2), Task("B", 0, 1, 5, 6), Task("C", 0, 1, 11, 12)]
+        periodic, _ = periodic_tasks(tasks)
+        verdict = demand_test(periodic)
+        self.assertTrue(verdict.schedulable)
+        with mock.patch.object(SchedulingAnalysis, "MAX_DEMAND_POINTS", 2):
+            verdict = demand_test(periodic)
+            self.assertIsNone(verdict.schedulable)
+            self.assertIn("gave up after 2 deadlines", verdict.detail)
+            self.assertIsNone(analyze(tasks, "EDF").schedulable)
+
+class TestScheduledAnalysis(unittest.TestCase):
+    def test_analyzer_runs_on_the_scheduling_thread(self):
+        tasks = [Task("A", 0, 1, None, 2), Task("B", 0, 2, None, 4)]
+        thread = SchedulingThread("EDF", tasks, horizon=8,
+                                  analyzer=lambda task_set: (threading.current_thread(), analyze(task_set, "EDF")))
+        thread.start()
+        thread.join()
+        analyzed_on, analysis = thread.analysis
+        self.assertIs(analyzed_on, thread)
+        self.assertTrue(analysis.schedulable)
+        self.assertEqual(thread.result[0].metrics.completed, 6)
+
+if __name__ == "__main__":
+    unittest.main()
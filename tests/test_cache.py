@@ -0,0 +1,123 @@
+# test_cache.py
+# ======================
+# ResultCache: task set fingerprints, which parameters make a run a hit or
+# a miss, and entries stored on disk.
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from SchedulingCore import ALGORITHMS, PERIODIC_ALGORITHMS, ResultCache, Task, TaskSet, run_scheduler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TASKS = [Task("A", 0, 4, 9, 10), Task("B", 1, 3, 7, 5), Task("C", 2, 2, None, 20)]
+
+class TestFingerprint(unittest.TestCase):
+    def test_same_tasks_same_fingerprint(self):
+        task_set = TaskSet.from_tasks(TASKS)
+        self.assertEqual(TaskSet.from_tasks(TASKS).fingerprint(), task_set.fingerprint())
+        task_set.arrival_order()
+        self.assertEqual(TaskSet.from_tasks(TASKS).fingerprint(), task_set.fingerprint())
+
+    def test_stable_across_processes(self):
+        script = ("from SchedulingCore import Task, TaskSet; "
+                  "print(TaskSet.from_tasks([Task('A', 0, 4, 9, 10), Task('B', 1, 3, 7, 5), "
+                  "Task('C', 2, 2, None, 20)]).fingerprint())")
+        fingerprints = set()
+        for seed in ("1", "2"):
+            output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True,
+                                    env=dict(os.environ, PYTHONHASHSEED=seed), check=True).stdout
+            fingerprints.add(output.strip())
+        self.assertEqual(fingerprints, {TaskSet.from_tasks(TASKS).fingerprint()})
+
+    def test_any_change_changes_fingerprint(self):
+        variants = [TASKS, TASKS[:2], TASKS[::-1],
+                    [Task("A", 0, 4, 9, 10), Task("B", 1, 3, 7, 5), Task("D", 2, 2, None, 20)],
+                    [Task("A", 1, 4, 9, 10), Task("B", 1, 3, 7, 5), Task("C", 2, 2, None, 20)],
+                    [Task("A", 0, 5, 9, 10), Task("B", 1, 3, 7, 5), Task("C", 2, 2, None, 20)],
+                    [Task("A", 0, 4, None, 10), Task("B", 1, 3, 7, 5), Task("C", 2, 2, None, 20)],
+                    [Task("A", 0, 4, 9, None), Task("B", 1, 3, 7, 5), Task("C", 2, 2, None, 20)]]
+        fingerprints = {TaskSet.from_tasks(tasks).fingerprint() for tasks in variants}
+        self.assertEqual(len(fingerprints), len(variants))
+
+class TestResultCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = ResultCache()
+        task_set = TaskSet.from_tasks(TASKS)
+        for algorithm in ALGORITHMS:
+            cache.run(algorithm, task_set, 2, 40)
+        self.assertEqual(cache.stats(), {"entries": 5, "hits": 0, "misses": 5})
+
+        # Only the parameters an algorithm depends on take part in its key
+        for algorithm in ALGORITHMS:
+            with self.subTest(algorithm):
+                hits = cache.hits
+                cache.run(algorithm, TaskSet.from_tasks(TASKS), 2, 40)
+                cache.run(algorithm, task_set, 3, 40)
+                cache.run(algorithm, task_set, 2, 80)
+                expected = 1 + (algorithm != "Round Robin") + (algorithm not in PERIODIC_ALGORITHMS)
+                self.assertEqual(cache.hits - hits, expected)
+
+        # So do the core count and mode, on more than one core
+        hits, misses = cache.hits, cache.misses
+        cache.run("EDF", task_set, 2, 40, 1, True)
+        self.assertEqual(cache.hits, hits + 1)
+        for cores, partitioned in ((2, False), (2, True), (3, False)):
+            cache.run("EDF", task_set, 2, 40, cores, partitioned)
+        self.assertEqual(cache.misses, misses + 3)
+        cache.run("EDF", task_set, 2, 40, 2, True)
+        self.assertEqual(cache.hits, hits + 2)
+
+    def test_cached_result_matches_run(self):
+        cache = ResultCache()
+        for algorithm in ALGORITHMS:
+            expected, expected_schedule = run_scheduler(algorithm, TASKS, 2, 40, 2)
+            for _ in range(2):
+                result, schedule = cache.run(algorithm, TASKS, 2, 40, 2)
+                self.assertEqual(schedule, expected_schedule)
+                self.assertEqual(result.metrics.snapshot(), expected.metrics.snapshot())
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResultCache(max_entries=2)
+        for algorithm in ("FCFS", "SJN", "FCFS", "EDF"):
+            cache.run(algorithm, TASKS)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 1, "misses": 3})
+        cache.run("FCFS", TASKS)
+        cache.run("SJN", TASKS)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 2, "misses": 4})
+
+    def test_disk_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            writer = ResultCache(directory=directory)
+            expected, expected_schedule = writer.run("Round Robin", TASKS, 2)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            # A new cache, as in another process, finds the entry on disk
+            reader = ResultCache(directory=directory)
+            result, schedule = reader.run("Round Robin", TASKS, 2)
+            self.assertEqual(reader.stats(), {"entries": 1, "hits": 1, "misses": 0})
+            self.assertEqual(schedule, expected_schedule)
+            self.assertEqual(list(result.executions), list(expected.executions))
+            self.assertEqual([task.finish_time for task in result], [task.finish_time for task in expected])
+            self.assertEqual(result.metrics.snapshot(), expected.metrics.snapshot())
+
+            # Another version of the cache does not
+            reader.clear()
+            reader.VERSION = ResultCache.VERSION + 1
+            reader.run("Round Robin", TASKS, 2)
+            self.assertEqual(reader.stats(), {"entries": 1, "hits": 1, "misses": 1})
+
+    def test_unreadable_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory=directory)
+            key = cache.key("FCFS", TaskSet.from_tasks(TASKS))
+            with open(cache.path(key), "wb") as f:
+                f.write(b"not a pickle")
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(cache.misses, 1)
+
+if __name__ == "__main__":
+    unittest.main()
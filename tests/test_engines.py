@@ -0,0 +1,54 @@
+# test_engines.py
+# ======================
+# The event-driven engines must reproduce the schedules of the original
+# unit-step loops exactly.
+
+import random
+import unittest
+
+import SchedulingCore
+
+import scheduling_reference
+from scheduling_reference import random_tasks
+
+def outcome(result):
+    """Per-task outcomes and the schedule of a (tasks, schedule) pair, comparable with =="""
+    tasks, schedule = result
+    return ([(task.name, task.start_time, task.finish_time, task.waiting_time, task.turnaround_time,
+              list(task.executions)) for task in tasks], list(schedule))
+
+class TestReferenceSchedules(unittest.TestCase):
+    """The engines against the original loops on seeded random task sets"""
+    def check(self, name, *args, **options):
+        rng = random.Random(name)
+        for _ in range(500):
+            tasks = random_tasks(rng, rng.randint(0, 9))
+            # A None argument is a time quantum drawn per task set
+            run_args = [rng.randint(1, 4) if arg is None else arg for arg in args]
+            expected = getattr(scheduling_reference, name)(tasks, *run_args)
+            actual = getattr(SchedulingCore, name)(tasks, *run_args, **options)
+            self.assertEqual(outcome(actual), outcome(expected), f"{name}{tuple(run_args)} on {tasks!r}")
+
+    def test_fcfs(self):
+        self.check("fcfs")
+
+    def test_sjn(self):
+        self.check("sjn")
+
+    def test_rr(self):
+        self.check("rr", None)
+
+    def test_rm(self):
+        # The reference runs one time unit at a time
+        self.check("rm", raw_ticks=True)
+
+    def test_edf(self):
+        self.check("edf", raw_ticks=True)
+
+    def test_rm_merges_adjacent_slices(self):
+        tasks = [SchedulingCore.Task("A", 0, 3, period=5), SchedulingCore.Task("B", 1, 2, period=10)]
+        _, schedule = SchedulingCore.rm(tasks)
+        self.assertEqual(schedule, [("A", 0, 3), ("B", 3, 5)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# test_kernels.py
+# ======================
+# The NumPy kernels of fcfs and sjn must reproduce the pure-Python engines
+# exactly, and the engines must still run when NumPy is missing.
+
+import random
+import unittest
+from unittest import mock
+
+import SchedulingCore
+from SchedulingCore import NUMPY_MIN_TASKS, TaskSet, collect_schedule, iter_fcfs, iter_sjn
+
+@unittest.skipUnless(SchedulingCore.numpy_kernels(), "NumPy is not installed")
+class TestNumpyKernels(unittest.TestCase):
+    """The NumPy fast paths of fcfs and sjn against their pure-Python engines"""
+    def check(self, task_set):
+        for fast, engine in ((SchedulingCore.fcfs, iter_fcfs), (SchedulingCore.sjn, iter_sjn)):
+            result, schedule = fast(task_set)
+            expected, expected_schedule = collect_schedule(task_set, engine(task_set))
+            self.assertEqual(schedule, expected_schedule, engine.__name__)
+            self.assertEqual(result.start_time, expected.start_time)
+            self.assertEqual(result.finish_time, expected.finish_time)
+            self.assertEqual(list(result.executions), expected.executions)
+            self.assertEqual(vars(result.metrics), vars(expected.metrics))
+
+    def test_random_task_sets(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            task_set = TaskSet()
+            span = rng.choice([10, 1000, 100000])
+            for i in range(rng.choice([NUMPY_MIN_TASKS, 3 * NUMPY_MIN_TASKS])):
+                burst = rng.randint(0, 3) if rng.random() < 0.2 else rng.randint(1, 50)
+                task_set.append(f"T{i}", rng.randint(0, span), burst)
+            self.check(task_set)
+
+    def test_sorted_arrivals(self):
+        rng = random.Random(4)
+        task_set = TaskSet()
+        arrival = 0
+        for i in range(2 * NUMPY_MIN_TASKS):
+            arrival += rng.randint(0, 10)
+            task_set.append(f"T{i}", arrival, rng.randint(0, 12))
+        self.check(task_set)
+
+class TestNumpyFallback(unittest.TestCase):
+    def test_engines_run_without_numpy(self):
+        task_set = TaskSet()
+        for i in range(NUMPY_MIN_TASKS):
+            task_set.append(f"T{i}", i, 2)
+        with mock.patch.object(SchedulingCore, "numpy_kernels", lambda: None):
+            for fast, engine in ((SchedulingCore.fcfs, iter_fcfs), (SchedulingCore.sjn, iter_sjn)):
+                result, schedule = fast(task_set)
+                self.assertIsInstance(result.executions, list)
+                self.assertEqual(schedule, collect_schedule(task_set, engine(task_set))[1])
+
+if __name__ == "__main__":
+    unittest.main()
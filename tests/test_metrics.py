@@ -0,0 +1,40 @@
+# test_metrics.py
+# ======================
+# The MetricsAccumulator must agree with calculate_metrics() rescanning the
+# tasks of a finished run.
+
+import random
+import unittest
+
+from SchedulingCore import ALGORITHMS, MetricsAccumulator, calculate_metrics, iter_schedule, run_scheduler
+
+from scheduling_reference import random_tasks
+
+AVERAGED_METRICS = ("cpu_utilization", "avg_waiting", "avg_turnaround")
+
+class TestMetricsAccumulator(unittest.TestCase):
+    def test_matches_rescan_of_tasks(self):
+        rng = random.Random(2)
+        for _ in range(200):
+            tasks = random_tasks(rng, rng.randint(1, 9))
+            for algorithm in ALGORITHMS:
+                result, _ = run_scheduler(algorithm, tasks, 2)
+                from_tasks, accumulated = calculate_metrics(list(result)), calculate_metrics(result)
+                # Context switches between zero-length intervals at the same
+                # time are only ordered correctly by the accumulator
+                for metric in AVERAGED_METRICS:
+                    self.assertEqual(from_tasks[metric], accumulated[metric], algorithm)
+
+    def test_streamed_events_match_collected_result(self):
+        rng = random.Random(3)
+        for _ in range(100):
+            tasks = random_tasks(rng, rng.randint(1, 9))
+            for algorithm in ALGORITHMS:
+                metrics = MetricsAccumulator()
+                for event in iter_schedule(tasks, algorithm, 3):
+                    metrics.add(event)
+                result, _ = run_scheduler(algorithm, tasks, 3)
+                self.assertEqual(metrics.snapshot(), calculate_metrics(result), algorithm)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+# test_multicore.py
+# ======================
+# The global multi-core scheduler on one core must reproduce the
+# single-core engines exactly.
+
+import random
+import unittest
+
+from SchedulingCore import ALGORITHMS, Task, TaskSet, collect_schedule, iter_global, iter_schedule, run_scheduler
+
+from scheduling_reference import random_tasks
+
+class TestMultiCore(unittest.TestCase):
+    def test_one_core_global_matches_single_core(self):
+        rng = random.Random(5)
+        for _ in range(300):
+            task_set = TaskSet.from_tasks(random_tasks(rng, rng.randint(1, 8), span=15, max_burst=6))
+            for algorithm in ALGORITHMS:
+                for horizon in (None, 40):
+                    quantum = rng.randint(1, 3)
+                    expected, expected_schedule = collect_schedule(
+                        task_set, iter_schedule(task_set, algorithm, quantum, horizon))
+                    result, schedule = collect_schedule(
+                        task_set, iter_global(task_set, algorithm, 1, quantum, horizon))
+                    self.assertEqual(schedule, expected_schedule, algorithm)
+                    self.assertEqual(result.finish_time, expected.finish_time)
+                    self.assertEqual(result.metrics.snapshot(), expected.metrics.snapshot())
+
+    def test_round_robin_needs_a_positive_quantum(self):
+        tasks = [Task("A", 0, 3), Task("B", 1, 2)]
+        for quantum in (None, 0, -1):
+            for cores, partitioned in ((1, False), (2, False), (2, True)):
+                with self.subTest(quantum=quantum, cores=cores, partitioned=partitioned):
+                    with self.assertRaises(ValueError):
+                        iter_schedule(tasks, "Round Robin", quantum, cores=cores, partitioned=partitioned)
+                    with self.assertRaises(ValueError):
+                        run_scheduler("Round Robin", tasks, quantum, cores=cores, partitioned=partitioned)
+
+if __name__ == "__main__":
+    unittest.main()
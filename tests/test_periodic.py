@@ -0,0 +1,25 @@
+# test_periodic.py
+# ======================
+# Periodic releases: jobs per task, per-task times averaged over jobs and
+# rejection of non-positive periods.
+
+import unittest
+
+from SchedulingCore import HYPERPERIOD, Task, calculate_metrics, periodic_releases, run_scheduler
+
+class TestPeriodicReleases(unittest.TestCase):
+    def test_task_times_average_over_jobs(self):
+        tasks = [Task("A", 0, 1, period=5), Task("B", 0, 2, period=10)]
+        result, _ = run_scheduler("EDF", tasks, horizon=20)
+        self.assertEqual([task.jobs for task in result], [4, 2])
+        self.assertEqual([task.remaining for task in result], [0, 0])
+        self.assertEqual(calculate_metrics(list(result)), calculate_metrics(result))
+
+    def test_non_positive_period_is_rejected(self):
+        tasks = [Task("A", 0, 1, period=0)]
+        for horizon in (20, HYPERPERIOD):
+            with self.assertRaises(ValueError):
+                list(periodic_releases(tasks, horizon))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+# test_taskset.py
+# ======================
+# TaskSet pickling, as done when shipping task sets to worker processes,
+# and fingerprints.
+
+import pickle
+import unittest
+
+from SchedulingCore import TaskSet
+
+def task_set(names):
+    tasks = TaskSet()
+    for i, name in enumerate(names):
+        tasks.append(name, i, i + 1, None if i % 2 else 10 * i, 5 if i % 2 else None)
+    return tasks
+
+class TestTaskSet(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        for names in ([], [""], ["A", "", "B"], ["a\0b", "\0", "c"]):
+            with self.subTest(names=names):
+                tasks = task_set(names)
+                copy = pickle.loads(pickle.dumps(tasks))
+                self.assertEqual(copy.names, names)
+                for column in ("arrival", "burst", "deadline", "period"):
+                    self.assertEqual(getattr(copy, column), getattr(tasks, column))
+                self.assertEqual([task.deadline for task in copy], [task.deadline for task in tasks])
+                self.assertEqual(copy.fingerprint(), tasks.fingerprint())
+
+    def test_fingerprint_depends_on_names(self):
+        cases = (["a\0b", "c"], ["a", "b\0c"], ["ab", "c"], ["a", "bc"])
+        fingerprints = {task_set(names).fingerprint() for names in cases}
+        self.assertEqual(len(fingerprints), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# test_thread.py
+# ======================
+# SchedulingThread: progress reports, cancellation and the streamed
+# schedule intervals.
+
+import queue
+import random
+import unittest
+
+from SchedulingCore import (
+    Progress, ResultCache, SchedulingThread, Task, TaskSet, periodic_job_count, run_scheduler
+)
+
+def long_task_set(count=5000):
+    rng = random.Random(7)
+    tasks = TaskSet()
+    for i in range(count):
+        tasks.append(f"T{i}", i, rng.randint(1, 5), i + rng.randint(5, 40), rng.choice([20, 50, 100]))
+    return tasks
+
+def run_thread(*args, **options):
+    thread = SchedulingThread(*args, **options)
+    thread.start()
+    thread.join()
+    return thread
+
+class TestProgress(unittest.TestCase):
+    def test_periodic_runs_reach_their_total(self):
+        tasks = [Task("A", 0, 1, None, 4), Task("B", 0, 2, None, 6), Task("C", 3, 1)]
+        for algorithm in ("Rate Monotonic", "EDF"):
+            for horizon in (24, "hyperperiod"):
+                with self.subTest(algorithm=algorithm, horizon=horizon):
+                    reports = []
+                    thread = run_thread(algorithm, tasks, horizon=horizon, on_progress=reports.append)
+                    total = periodic_job_count(tasks, horizon)
+                    self.assertGreater(total, len(tasks))
+                    self.assertEqual(reports[0], Progress(0, 0, total))
+                    self.assertEqual(thread.progress, reports[-1])
+                    self.assertEqual(thread.progress.completed, total)
+                    self.assertEqual(thread.result[0].metrics.completed, total)
+
+    def test_reports_are_monotonic(self):
+        tasks = long_task_set()
+        reports = []
+        thread = run_thread("EDF", tasks, horizon=2000, on_progress=reports.append)
+        self.assertGreater(len(reports), 3)
+        self.assertEqual(reports, sorted(reports, key=lambda progress: (progress.time, progress.completed)))
+        self.assertEqual(thread.progress.completed, periodic_job_count(tasks, 2000))
+
+    def test_cached_run_reports_completion(self):
+        cache = ResultCache()
+        tasks = TaskSet.from_tasks([Task("A", 0, 1, None, 4), Task("B", 0, 2, None, 6)])
+        first = run_thread("EDF", tasks, cache=cache, horizon=24)
+        second = run_thread("EDF", tasks, cache=cache, horizon=24)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(second.progress, first.progress)
+
+class TestCancel(unittest.TestCase):
+    def test_cancelled_run_keeps_a_consistent_partial_result(self):
+        tasks = long_task_set()
+        for algorithm, horizon in (("FCFS", None), ("Round Robin", None), ("EDF", 2000)):
+            with self.subTest(algorithm):
+                cache = ResultCache()
+                intervals = queue.Queue()
+                # Cancel at the first report after the start, from the thread itself
+                thread = SchedulingThread(algorithm, tasks, 2, cache=cache, interval_queue=intervals,
+                                          horizon=horizon,
+                                          on_progress=lambda progress: progress.completed and thread.cancel())
+                thread.start()
+                thread.join()
+
+                result, schedule = thread.result
+                progress = thread.progress
+                self.assertTrue(thread.cancelled)
+                self.assertGreater(progress.completed, 0)
+                self.assertLess(progress.completed, progress.total)
+
+                # The partial schedule is a prefix of the full one, up to the last report
+                _, full_schedule = run_scheduler(algorithm, tasks, 2, horizon)
+                self.assertEqual(schedule, full_schedule[:len(schedule)])
+                self.assertEqual(max(end for _, _, end in schedule), progress.time)
+                self.assertEqual(result.metrics.completed, progress.completed)
+                finished = [task.finish_time for task in result if task.finish_time is not None]
+                self.assertLessEqual(max(finished), progress.time)
+
+                # Every streamed interval was published, and nothing was cached
+                streamed = []
+                while not intervals.empty():
+                    streamed.extend(intervals.get())
+                self.assertEqual(streamed, schedule)
+                self.assertEqual(cache.stats()["entries"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
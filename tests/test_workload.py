@@ -0,0 +1,105 @@
+# test_workload.py
+# ======================
+# Workload files: validation of CSV and JSONL rows, and how the command line
+# front end reports invalid files.
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import SchedulingCLI
+from WorkloadLoader import MAX_TIME, WorkloadError, iter_workload, load_taskset
+
+class WorkloadFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, filename, text):
+        path = os.path.join(self.directory, filename)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+class TestLoader(WorkloadFileTest):
+    def test_csv(self):
+        path = self.write("tasks.csv", "name,arrival,burst,deadline,period\nA,0,3,,\nB,2,1,9,10\n")
+        tasks = load_taskset(path)
+        self.assertEqual(tasks.names, ["A", "B"])
+        self.assertEqual([(task.arrival, task.burst, task.deadline, task.period) for task in tasks],
+                         [(0, 3, None, None), (2, 1, 9, 10)])
+
+    def test_jsonl(self):
+        rows = [{"name": "A", "arrival": 0, "burst": 3}, {"name": "B", "arrival": 2, "burst": 1, "period": 10}]
+        path = self.write("tasks.jsonl", "".join(json.dumps(row) + "\n" for row in rows) + "\n")
+        tasks = load_taskset(path)
+        self.assertEqual(tasks.names, ["A", "B"])
+        self.assertEqual([task.period for task in tasks], [None, 10])
+
+    def test_invalid_rows(self):
+        cases = {
+            "missing column": ("tasks.csv", "name,arrival\nA,0\n", 2, "missing burst"),
+            "negative time": ("tasks.csv", "name,arrival,burst\nA,0,1\nB,-1,2\n", 3, "arrival"),
+            "not a number": ("tasks.csv", "name,arrival,burst\nA,x,1\n", 2, "arrival"),
+            "zero period": ("tasks.csv", "name,arrival,burst,period\nA,0,1,0\n", 2, "period"),
+            "out of range": ("tasks.csv", f"name,arrival,burst\nA,0,{MAX_TIME + 1}\n", 2, "burst"),
+            "fractional time": ("tasks.jsonl", '{"name": "A", "arrival": 0.5, "burst": 1}\n', 1, "arrival"),
+            "invalid JSON": ("tasks.jsonl", '{"name": "A", "arrival": 0, "burst": 1}\n{"name"\n', 2, "invalid JSON"),
+            "not an object": ("tasks.jsonl", '["A", 0, 1]\n', 1, "JSON object"),
+        }
+        for case, (filename, text, line_no, message) in cases.items():
+            with self.subTest(case):
+                path = self.write(filename, text)
+                with self.assertRaises(WorkloadError) as raised:
+                    load_taskset(path)
+                self.assertEqual(raised.exception.line_no, line_no)
+                self.assertIn(message, str(raised.exception))
+
+    def test_largest_time(self):
+        path = self.write("tasks.csv", f"name,arrival,burst\nA,{MAX_TIME},0\n")
+        self.assertEqual(load_taskset(path).arrival[0], MAX_TIME)
+
+    def test_ordered_rejects_earlier_arrival(self):
+        path = self.write("tasks.csv", "name,arrival,burst\nA,5,1\nB,2,1\n")
+        with self.assertRaises(WorkloadError) as raised:
+            list(iter_workload(path))
+        self.assertEqual(raised.exception.line_no, 3)
+        self.assertEqual(len(load_taskset(path)), 2)
+
+class TestCLI(WorkloadFileTest):
+    def run_cli(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                status = SchedulingCLI.main(list(argv))
+            except SystemExit as e:
+                status = e.code
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_metrics(self):
+        path = self.write("tasks.csv", "name,arrival,burst\nA,0,3\nB,1,2\n")
+        status, output, _ = self.run_cli(path, "-a", "fcfs")
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(output)["FCFS"]["avg_turnaround"], 3.5)
+
+    def test_invalid_workload_exits_with_usage_error(self):
+        for text in ["name,arrival,burst\nA,0,x\n", f"name,arrival,burst\nA,0,{2**63}\n"]:
+            path = self.write("tasks.csv", text)
+            for options in ([], ["--stream"], ["--sweep", "1-2", "--backend", "inline"], ["--analyze"]):
+                with self.subTest(text=text, options=options):
+                    status, output, error = self.run_cli(path, *options)
+                    self.assertEqual(status, 2)
+                    self.assertEqual(output, "")
+                    self.assertIn(f"{path}:2: burst", error)
+
+    def test_missing_file(self):
+        status, _, error = self.run_cli(os.path.join(self.directory, "missing.csv"))
+        self.assertEqual(status, 2)
+        self.assertIn("missing.csv", error)
+
+if __name__ == "__main__":
+    unittest.main()